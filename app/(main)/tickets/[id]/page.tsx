@@ -18,13 +18,16 @@ export default async function TicketDetailPage({
   }
 
   const { id } = await params;
-  const ticket = await getTicketById(id, session.user.id, session.user.role);
+  const ticket = await getTicketById(id, session.user.id, session.user.role, {
+    includeArchived: true,
+  });
 
   if (!ticket) {
     notFound();
   }
 
   const canReopen =
+    !ticket.isArchived &&
     ticket.status === 'closed' &&
     ticket.closedAt !== null &&
     canReopenTicket(new Date(ticket.closedAt));
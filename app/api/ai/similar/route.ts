@@ -6,14 +6,14 @@
  */
 
 import { NextRequest, NextResponse } from 'next/server';
-import { auth } from '@/lib/auth';
+import { getCurrentUser } from '@/lib/auth-utils';
 import { findSimilarTickets } from '@/lib/services/ai-service';
 
 export async function GET(request: NextRequest) {
   try {
     // Check authentication
-    const session = await auth();
-    if (!session?.user) {
+    const user = await getCurrentUser();
+    if (!user) {
       return NextResponse.json(
         { error: '인증이 필요합니다.' },
         { status: 401 }
@@ -22,7 +22,7 @@ export async function GET(request: NextRequest) {
 
     // Check role (Agent, Manager, Admin only)
     const allowedRoles = ['agent', 'manager', 'admin'];
-    if (!allowedRoles.includes(session.user.role)) {
+    if (!allowedRoles.includes(user.role)) {
       return NextResponse.json(
         { error: '권한이 없습니다.' },
         { status: 403 }
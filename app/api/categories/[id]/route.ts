@@ -3,6 +3,7 @@ import { db } from '@/lib/db';
 import { categories } from '@/lib/db/schema';
 import { categoryUpdateSchema } from '@/lib/validations';
 import { requireAdmin } from '@/lib/auth-utils';
+import { invalidateReferenceData } from '@/lib/services/reference-data-service';
 import { eq } from 'drizzle-orm';
 
 /**
@@ -98,6 +99,8 @@ export async function PATCH(
       .where(eq(categories.id, id))
       .returning();
 
+    await invalidateReferenceData('categories');
+
     return NextResponse.json({
       success: true,
       data: updated,
@@ -157,6 +160,9 @@ export async function DELETE(
 
     await db.delete(categories).where(eq(categories.id, id));
 
+    // Templates of the category are deleted by cascade
+    await invalidateReferenceData('categories', 'promptTemplates');
+
     return NextResponse.json({
       success: true,
       message: '카테고리가 삭제되었습니다',
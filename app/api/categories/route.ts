@@ -3,6 +3,7 @@ import { db } from '@/lib/db';
 import { categories } from '@/lib/db/schema';
 import { categoryCreateSchema } from '@/lib/validations';
 import { requireAdmin } from '@/lib/auth-utils';
+import { invalidateReferenceData } from '@/lib/services/reference-data-service';
 import { desc, eq } from 'drizzle-orm';
 
 /**
@@ -65,6 +66,8 @@ export async function POST(request: NextRequest) {
       })
       .returning();
 
+    await invalidateReferenceData('categories');
+
     return NextResponse.json(
       {
         success: true,
@@ -0,0 +1,42 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { archiveClosedTickets } from '@/lib/services/archive-service';
+import { verifyCronRequest } from '@/lib/cron-auth';
+
+/**
+ * Cron job endpoint to archive long-closed tickets
+ * Moves tickets closed for more than TICKET_ARCHIVE_AFTER_DAYS (and their
+ * histories) out of the live tables.
+ * Scheduled daily in vercel.json (see DEPLOYMENT.md)
+ */
+export async function GET(request: NextRequest) {
+  try {
+    const unauthorized = verifyCronRequest(request);
+    if (unauthorized) {
+      return unauthorized;
+    }
+
+    let ticketsArchived = 0;
+    let batch: number;
+    // Each call moves a bounded batch; stop after a day's worth of work
+    do {
+      batch = await archiveClosedTickets();
+      ticketsArchived += batch;
+    } while (batch > 0 && ticketsArchived < 50000);
+
+    return NextResponse.json({
+      success: true,
+      timestamp: new Date().toISOString(),
+      ticketsArchived,
+    });
+  } catch (error) {
+    console.error('Fatal error in ticket archive cron job:', error);
+    return NextResponse.json(
+      {
+        success: false,
+        error: error instanceof Error ? error.message : 'Unknown error',
+        timestamp: new Date().toISOString(),
+      },
+      { status: 500 }
+    );
+  }
+}
@@ -0,0 +1,61 @@
+import { NextRequest, NextResponse } from 'next/server';
+import {
+  REPORT_ROLLUP_LEASE,
+  refreshAllReportRollups,
+} from '@/lib/services/report-rollup-service';
+import { invalidateReportCache } from '@/lib/services/report-cache-service';
+import { runWithLease } from '@/lib/services/job-lease-service';
+import { verifyCronRequest } from '@/lib/cron-auth';
+
+/**
+ * Cron job endpoint to compact reporting rollups
+ * Rebuilds the daily report rows of every day changed since the last run.
+ * Report requests only read the rollups, so this job (plus a throttled
+ * background refresh) is what keeps them current.
+ * Should be called every few minutes via Vercel Cron or external service
+ */
+export async function GET(request: NextRequest) {
+  try {
+    const unauthorized = verifyCronRequest(request);
+    if (unauthorized) {
+      return unauthorized;
+    }
+
+    const run = await runWithLease(REPORT_ROLLUP_LEASE, ({ signal }) =>
+      refreshAllReportRollups(signal)
+    );
+
+    // Another instance is already rebuilding; this trigger is a no-op
+    if (!run.acquired) {
+      return NextResponse.json({
+        success: true,
+        skipped: true,
+        reason: 'already_running',
+        heldUntil: run.expiresAt?.toISOString() ?? null,
+        timestamp: new Date().toISOString(),
+      });
+    }
+
+    const daysRebuilt = run.result;
+    if (daysRebuilt > 0) {
+      await invalidateReportCache();
+    }
+
+    return NextResponse.json({
+      success: true,
+      skipped: false,
+      timestamp: new Date().toISOString(),
+      daysRebuilt,
+    });
+  } catch (error) {
+    console.error('Fatal error in report rollup cron job:', error);
+    return NextResponse.json(
+      {
+        success: false,
+        error: error instanceof Error ? error.message : 'Unknown error',
+        timestamp: new Date().toISOString(),
+      },
+      { status: 500 }
+    );
+  }
+}
@@ -8,11 +8,290 @@ import {
 import {
   sendSLAWarningNotification,
   sendSLAViolationNotification,
+  sendSLAWarningDigest,
+  sendSLAViolationDigest,
 } from '@/lib/services/notification-service';
+import type { SLANotificationTicket } from '@/lib/services/notification-service';
+import type { TicketWithSLA } from '@/lib/services/sla-service';
+import { runWithLease } from '@/lib/services/job-lease-service';
+import { verifyCronRequest } from '@/lib/cron-auth';
+
+// Only one instance sweeps at a time; overlapping triggers are skipped
+const SLA_CHECK_LEASE = 'sla-check';
+
+// "digest" (default): one email per agent and one per manager per sweep;
+// "individual": one email per ticket and SLA type
+const NOTIFICATION_MODE =
+  process.env.SLA_NOTIFICATION_MODE === 'individual' ? 'individual' : 'digest';
+
+type SLACheckResults = {
+  mode: typeof NOTIFICATION_MODE;
+  warnings: { response: number; resolve: number };
+  violations: { response: number; resolve: number };
+  notificationsSent: number; // rendered messages (a violation message goes to every manager)
+  errors: string[];
+};
+
+async function collect(
+  label: string,
+  fetchTickets: () => Promise<TicketWithSLA[]>,
+  results: SLACheckResults
+): Promise<TicketWithSLA[]> {
+  try {
+    return await fetchTickets();
+  } catch (error) {
+    const errorMsg = `Error checking ${label}: ${error instanceof Error ? error.message : 'Unknown error'}`;
+    console.error(errorMsg);
+    results.errors.push(errorMsg);
+    return [];
+  }
+}
+
+/**
+ * Group warnings by agent and violations into one list, then send one
+ * digest per agent and one violation digest for all managers
+ */
+async function sendDigests(results: SLACheckResults, signal: AbortSignal) {
+  const [approachingResponse, approachingResolve, violatedResponse, violatedResolve] =
+    await Promise.all([
+      collect('approaching response SLA', getTicketsApproachingResponseSLA, results),
+      collect('approaching resolve SLA', getTicketsApproachingResolveSLA, results),
+      collect('violated response SLA', getTicketsViolatedResponseSLA, results),
+      collect('violated resolve SLA', getTicketsViolatedResolveSLA, results),
+    ]);
+
+  const warningsByAgent = new Map<string, { agentName: string; tickets: SLANotificationTicket[] }>();
+  const addWarning = (ticket: TicketWithSLA, slaType: 'response' | 'resolve') => {
+    const deadline = slaType === 'response' ? ticket.slaResponseDeadline : ticket.slaResolveDeadline;
+    if (!ticket.agentEmail || !ticket.agentName || !deadline) {
+      console.warn(`Ticket ${ticket.id} missing required data for notification`);
+      return;
+    }
+    const group = warningsByAgent.get(ticket.agentEmail) ?? {
+      agentName: ticket.agentName,
+      tickets: [],
+    };
+    group.tickets.push({ ticketId: ticket.id, ticketTitle: ticket.title, slaType, deadline });
+    warningsByAgent.set(ticket.agentEmail, group);
+  };
+  approachingResponse.forEach((ticket) => addWarning(ticket, 'response'));
+  approachingResolve.forEach((ticket) => addWarning(ticket, 'resolve'));
+
+  for (const [agentEmail, group] of warningsByAgent) {
+    if (signal.aborted) break;
+
+    const sent = await sendSLAWarningDigest({ agentEmail, ...group });
+    if (!sent) {
+      results.errors.push(`Failed to send SLA warning digest to ${agentEmail}`);
+      continue;
+    }
+    if (sent.length > 0) results.notificationsSent++;
+    for (const ticket of sent) results.warnings[ticket.slaType]++;
+  }
+
+  const violations: Array<SLANotificationTicket & { agentName: string }> = [];
+  const addViolation = (ticket: TicketWithSLA, slaType: 'response' | 'resolve') => {
+    const deadline = slaType === 'response' ? ticket.slaResponseDeadline : ticket.slaResolveDeadline;
+    if (!ticket.agentName || !deadline) {
+      console.warn(`Ticket ${ticket.id} missing required data for violation notification`);
+      return;
+    }
+    violations.push({
+      ticketId: ticket.id,
+      ticketTitle: ticket.title,
+      agentName: ticket.agentName,
+      slaType,
+      deadline,
+    });
+  };
+  violatedResponse.forEach((ticket) => addViolation(ticket, 'response'));
+  violatedResolve.forEach((ticket) => addViolation(ticket, 'resolve'));
+
+  if (violations.length === 0 || signal.aborted) return;
+
+  if (await sendSLAViolationDigest(violations)) {
+    results.notificationsSent++;
+    for (const ticket of violations) results.violations[ticket.slaType]++;
+  } else {
+    results.errors.push(`Failed to send SLA violation digest for ${violations.length} tickets`);
+  }
+}
+
+/**
+ * Send one notification per ticket and SLA type
+ */
+async function sendIndividually(results: SLACheckResults, signal: AbortSignal) {
+  // 1. Check for tickets approaching response SLA deadline
+  try {
+    const approachingResponseTickets = await getTicketsApproachingResponseSLA();
+
+    for (const ticket of approachingResponseTickets) {
+      if (signal.aborted) break;
+
+      if (!ticket.agentEmail || !ticket.agentName || !ticket.slaResponseDeadline) {
+        console.warn(`Ticket ${ticket.id} missing required data for notification`);
+        continue;
+      }
+
+      const success = await sendSLAWarningNotification({
+        ticketId: ticket.id,
+        ticketTitle: ticket.title,
+        agentName: ticket.agentName,
+        agentEmail: ticket.agentEmail,
+        slaType: 'response',
+        deadline: ticket.slaResponseDeadline,
+      });
+
+      if (success) {
+        results.warnings.response++;
+        results.notificationsSent++;
+      } else {
+        results.errors.push(`Failed to send response warning for ticket ${ticket.id}`);
+      }
+    }
+  } catch (error) {
+    const errorMsg = `Error checking approaching response SLA: ${error instanceof Error ? error.message : 'Unknown error'}`;
+    console.error(errorMsg);
+    results.errors.push(errorMsg);
+  }
+
+  // 2. Check for tickets approaching resolve SLA deadline
+  try {
+    const approachingResolveTickets = await getTicketsApproachingResolveSLA();
+
+    for (const ticket of approachingResolveTickets) {
+      if (signal.aborted) break;
+
+      if (!ticket.agentEmail || !ticket.agentName || !ticket.slaResolveDeadline) {
+        console.warn(`Ticket ${ticket.id} missing required data for notification`);
+        continue;
+      }
+
+      const success = await sendSLAWarningNotification({
+        ticketId: ticket.id,
+        ticketTitle: ticket.title,
+        agentName: ticket.agentName,
+        agentEmail: ticket.agentEmail,
+        slaType: 'resolve',
+        deadline: ticket.slaResolveDeadline,
+      });
+
+      if (success) {
+        results.warnings.resolve++;
+        results.notificationsSent++;
+      } else {
+        results.errors.push(`Failed to send resolve warning for ticket ${ticket.id}`);
+      }
+    }
+  } catch (error) {
+    const errorMsg = `Error checking approaching resolve SLA: ${error instanceof Error ? error.message : 'Unknown error'}`;
+    console.error(errorMsg);
+    results.errors.push(errorMsg);
+  }
+
+  // 3. Check for tickets that violated response SLA
+  try {
+    const violatedResponseTickets = await getTicketsViolatedResponseSLA();
+
+    for (const ticket of violatedResponseTickets) {
+      if (signal.aborted) break;
+
+      if (!ticket.agentName || !ticket.slaResponseDeadline) {
+        console.warn(`Ticket ${ticket.id} missing required data for violation notification`);
+        continue;
+      }
+
+      const success = await sendSLAViolationNotification({
+        ticketId: ticket.id,
+        ticketTitle: ticket.title,
+        agentName: ticket.agentName,
+        slaType: 'response',
+        deadline: ticket.slaResponseDeadline,
+      });
+
+      if (success) {
+        results.violations.response++;
+        results.notificationsSent++;
+      } else {
+        results.errors.push(`Failed to send response violation for ticket ${ticket.id}`);
+      }
+    }
+  } catch (error) {
+    const errorMsg = `Error checking violated response SLA: ${error instanceof Error ? error.message : 'Unknown error'}`;
+    console.error(errorMsg);
+    results.errors.push(errorMsg);
+  }
+
+  // 4. Check for tickets that violated resolve SLA
+  try {
+    const violatedResolveTickets = await getTicketsViolatedResolveSLA();
+
+    for (const ticket of violatedResolveTickets) {
+      if (signal.aborted) break;
+
+      if (!ticket.agentName || !ticket.slaResolveDeadline) {
+        console.warn(`Ticket ${ticket.id} missing required data for violation notification`);
+        continue;
+      }
+
+      const success = await sendSLAViolationNotification({
+        ticketId: ticket.id,
+        ticketTitle: ticket.title,
+        agentName: ticket.agentName,
+        slaType: 'resolve',
+        deadline: ticket.slaResolveDeadline,
+      });
+
+      if (success) {
+        results.violations.resolve++;
+        results.notificationsSent++;
+      } else {
+        results.errors.push(`Failed to send resolve violation for ticket ${ticket.id}`);
+      }
+    }
+  } catch (error) {
+    const errorMsg = `Error checking violated resolve SLA: ${error instanceof Error ? error.message : 'Unknown error'}`;
+    console.error(errorMsg);
+    results.errors.push(errorMsg);
+  }
+}
+
+/**
+ * Send SLA warnings and violation notifications for every due ticket
+ */
+async function runSLACheck(signal: AbortSignal) {
+  const results: SLACheckResults = {
+    mode: NOTIFICATION_MODE,
+    warnings: {
+      response: 0,
+      resolve: 0,
+    },
+    violations: {
+      response: 0,
+      resolve: 0,
+    },
+    notificationsSent: 0,
+    errors: [],
+  };
+
+  if (NOTIFICATION_MODE === 'digest') {
+    await sendDigests(results, signal);
+  } else {
+    await sendIndividually(results, signal);
+  }
+
+  if (signal.aborted) {
+    results.errors.push('Lease lost during the run; remaining tickets are left to the next run');
+  }
+
+  return results;
+}
 
 /**
  * Cron job endpoint to check SLA status and send notifications
- * Should be called every 15 minutes via Vercel Cron or external service
+ * Should be called every 15 minutes via Vercel Cron or external service.
+ * Runs are serialized across instances with a lease; a trigger that finds
+ * another run in progress returns `skipped: true`.
  *
  * Example Vercel cron configuration (vercel.json):
  * {
@@ -24,155 +303,29 @@ import {
  */
 export async function GET(request: NextRequest) {
   try {
-    // Optional: Verify cron secret to prevent unauthorized access
-    const authHeader = request.headers.get('authorization');
-    const cronSecret = process.env.CRON_SECRET;
-
-    if (cronSecret && authHeader !== `Bearer ${cronSecret}`) {
-      return NextResponse.json(
-        { error: 'Unauthorized' },
-        { status: 401 }
-      );
-    }
-
-    const results = {
-      timestamp: new Date().toISOString(),
-      warnings: {
-        response: 0,
-        resolve: 0,
-      },
-      violations: {
-        response: 0,
-        resolve: 0,
-      },
-      errors: [] as string[],
-    };
-
-    // 1. Check for tickets approaching response SLA deadline
-    try {
-      const approachingResponseTickets = await getTicketsApproachingResponseSLA();
-
-      for (const ticket of approachingResponseTickets) {
-        if (!ticket.agentEmail || !ticket.agentName || !ticket.slaResponseDeadline) {
-          console.warn(`Ticket ${ticket.id} missing required data for notification`);
-          continue;
-        }
-
-        const success = await sendSLAWarningNotification({
-          ticketId: ticket.id,
-          ticketTitle: ticket.title,
-          agentName: ticket.agentName,
-          agentEmail: ticket.agentEmail,
-          slaType: 'response',
-          deadline: ticket.slaResponseDeadline,
-        });
-
-        if (success) {
-          results.warnings.response++;
-        } else {
-          results.errors.push(`Failed to send response warning for ticket ${ticket.id}`);
-        }
-      }
-    } catch (error) {
-      const errorMsg = `Error checking approaching response SLA: ${error instanceof Error ? error.message : 'Unknown error'}`;
-      console.error(errorMsg);
-      results.errors.push(errorMsg);
-    }
-
-    // 2. Check for tickets approaching resolve SLA deadline
-    try {
-      const approachingResolveTickets = await getTicketsApproachingResolveSLA();
-
-      for (const ticket of approachingResolveTickets) {
-        if (!ticket.agentEmail || !ticket.agentName || !ticket.slaResolveDeadline) {
-          console.warn(`Ticket ${ticket.id} missing required data for notification`);
-          continue;
-        }
-
-        const success = await sendSLAWarningNotification({
-          ticketId: ticket.id,
-          ticketTitle: ticket.title,
-          agentName: ticket.agentName,
-          agentEmail: ticket.agentEmail,
-          slaType: 'resolve',
-          deadline: ticket.slaResolveDeadline,
-        });
-
-        if (success) {
-          results.warnings.resolve++;
-        } else {
-          results.errors.push(`Failed to send resolve warning for ticket ${ticket.id}`);
-        }
-      }
-    } catch (error) {
-      const errorMsg = `Error checking approaching resolve SLA: ${error instanceof Error ? error.message : 'Unknown error'}`;
-      console.error(errorMsg);
-      results.errors.push(errorMsg);
+    const unauthorized = verifyCronRequest(request);
+    if (unauthorized) {
+      return unauthorized;
     }
 
-    // 3. Check for tickets that violated response SLA
-    try {
-      const violatedResponseTickets = await getTicketsViolatedResponseSLA();
-
-      for (const ticket of violatedResponseTickets) {
-        if (!ticket.agentName || !ticket.slaResponseDeadline) {
-          console.warn(`Ticket ${ticket.id} missing required data for violation notification`);
-          continue;
-        }
-
-        const success = await sendSLAViolationNotification({
-          ticketId: ticket.id,
-          ticketTitle: ticket.title,
-          agentName: ticket.agentName,
-          slaType: 'response',
-          deadline: ticket.slaResponseDeadline,
-        });
-
-        if (success) {
-          results.violations.response++;
-        } else {
-          results.errors.push(`Failed to send response violation for ticket ${ticket.id}`);
-        }
-      }
-    } catch (error) {
-      const errorMsg = `Error checking violated response SLA: ${error instanceof Error ? error.message : 'Unknown error'}`;
-      console.error(errorMsg);
-      results.errors.push(errorMsg);
-    }
+    const run = await runWithLease(SLA_CHECK_LEASE, ({ signal }) => runSLACheck(signal));
 
-    // 4. Check for tickets that violated resolve SLA
-    try {
-      const violatedResolveTickets = await getTicketsViolatedResolveSLA();
-
-      for (const ticket of violatedResolveTickets) {
-        if (!ticket.agentName || !ticket.slaResolveDeadline) {
-          console.warn(`Ticket ${ticket.id} missing required data for violation notification`);
-          continue;
-        }
-
-        const success = await sendSLAViolationNotification({
-          ticketId: ticket.id,
-          ticketTitle: ticket.title,
-          agentName: ticket.agentName,
-          slaType: 'resolve',
-          deadline: ticket.slaResolveDeadline,
-        });
-
-        if (success) {
-          results.violations.resolve++;
-        } else {
-          results.errors.push(`Failed to send resolve violation for ticket ${ticket.id}`);
-        }
-      }
-    } catch (error) {
-      const errorMsg = `Error checking violated resolve SLA: ${error instanceof Error ? error.message : 'Unknown error'}`;
-      console.error(errorMsg);
-      results.errors.push(errorMsg);
+    // Another instance is already sweeping; this trigger is a no-op
+    if (!run.acquired) {
+      return NextResponse.json({
+        success: true,
+        skipped: true,
+        reason: 'already_running',
+        heldUntil: run.expiresAt?.toISOString() ?? null,
+        timestamp: new Date().toISOString(),
+      });
     }
 
     return NextResponse.json({
       success: true,
-      ...results,
+      skipped: false,
+      timestamp: new Date().toISOString(),
+      ...run.result,
     });
   } catch (error) {
     console.error('Fatal error in SLA check cron job:', error);
@@ -3,6 +3,10 @@ import { db } from '@/lib/db';
 import { knowledgeBases, categories } from '@/lib/db/schema';
 import { knowledgeBaseUpdateSchema } from '@/lib/validations';
 import { requireManagerOrAdmin } from '@/lib/auth-utils';
+import {
+  indexKnowledgeBase,
+  removeKnowledgeBaseFromIndex,
+} from '@/lib/services/knowledge-base-service';
 import { eq } from 'drizzle-orm';
 
 /**
@@ -124,6 +128,9 @@ export async function PATCH(
       .where(eq(knowledgeBases.id, id))
       .returning();
 
+    // Keep the retrieval index in sync
+    indexKnowledgeBase(updated);
+
     return NextResponse.json({
       success: true,
       data: updated,
@@ -183,6 +190,7 @@ export async function DELETE(
     }
 
     await db.delete(knowledgeBases).where(eq(knowledgeBases.id, id));
+    removeKnowledgeBaseFromIndex(id);
 
     return NextResponse.json({
       success: true,
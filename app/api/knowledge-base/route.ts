@@ -3,6 +3,7 @@ import { db } from '@/lib/db';
 import { knowledgeBases, categories } from '@/lib/db/schema';
 import { knowledgeBaseCreateSchema } from '@/lib/validations';
 import { requireManagerOrAdmin } from '@/lib/auth-utils';
+import { indexKnowledgeBase } from '@/lib/services/knowledge-base-service';
 import { eq, desc, and, or, ilike } from 'drizzle-orm';
 
 /**
@@ -111,6 +112,9 @@ export async function POST(request: NextRequest) {
       })
       .returning();
 
+    // Keep the retrieval index in sync
+    indexKnowledgeBase(newKnowledgeBase);
+
     return NextResponse.json(
       {
         success: true,
@@ -0,0 +1,37 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { renderMetrics } from '@/lib/metrics';
+
+/**
+ * GET /api/metrics
+ * Prometheus scrape endpoint
+ *
+ * Exposes query latency by route, per-request query counts, slow queries,
+ * event-loop lag, AI call latency and email send latency.
+ * Requires `Authorization: Bearer <METRICS_TOKEN>`; without METRICS_TOKEN
+ * the endpoint does not exist.
+ */
+export async function GET(request: NextRequest) {
+  const metricsToken = process.env.METRICS_TOKEN;
+  const authHeader = request.headers.get('authorization');
+
+  if (!metricsToken) {
+    return NextResponse.json(
+      { error: 'Not found' },
+      { status: 404 }
+    );
+  }
+
+  if (authHeader !== `Bearer ${metricsToken}`) {
+    return NextResponse.json(
+      { error: 'Unauthorized' },
+      { status: 401 }
+    );
+  }
+
+  return new NextResponse(renderMetrics(), {
+    headers: {
+      'Content-Type': 'text/plain; version=0.0.4; charset=utf-8',
+      'Cache-Control': 'no-store',
+    },
+  });
+}
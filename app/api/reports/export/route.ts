@@ -0,0 +1,67 @@
+import { NextRequest, NextResponse } from "next/server";
+import { requireManagerOrAdmin } from "@/lib/auth-utils";
+import { ticketExportSchema } from "@/lib/validations";
+import { streamTicketExport } from "@/lib/services/export-service";
+
+export const dynamic = "force-dynamic";
+
+const CONTENT_TYPES = {
+  csv: "text/csv; charset=utf-8",
+  ndjson: "application/x-ndjson; charset=utf-8",
+};
+
+/**
+ * GET /api/reports/export
+ * Stream the tickets created in a date range with SLA fields, agent,
+ * category and satisfaction rating
+ * Query params: startDate, endDate (YYYY-MM-DD), format (csv | ndjson),
+ * gzip (true | false)
+ */
+export async function GET(request: NextRequest) {
+  try {
+    await requireManagerOrAdmin();
+
+    const { searchParams } = new URL(request.url);
+    const parsed = ticketExportSchema.safeParse({
+      startDate: searchParams.get("startDate") || undefined,
+      endDate: searchParams.get("endDate") || undefined,
+      format: searchParams.get("format") || undefined,
+      gzip: searchParams.get("gzip") || undefined,
+    });
+
+    if (!parsed.success) {
+      return NextResponse.json(
+        { success: false, error: parsed.error.issues[0].message },
+        { status: 400 }
+      );
+    }
+
+    const options = parsed.data;
+    const fileName = `tickets-${options.startDate}-${options.endDate}.${options.format}${
+      options.gzip ? ".gz" : ""
+    }`;
+
+    return new Response(streamTicketExport(options), {
+      headers: {
+        "Content-Type": options.gzip ? "application/gzip" : CONTENT_TYPES[options.format],
+        "Content-Disposition": `attachment; filename="${fileName}"`,
+        "Cache-Control": "no-store",
+        "X-Accel-Buffering": "no",
+      },
+    });
+  } catch (error) {
+    console.error("Error exporting tickets:", error);
+
+    if (error instanceof Error && error.message === "Forbidden") {
+      return NextResponse.json(
+        { success: false, error: "권한이 없습니다" },
+        { status: 403 }
+      );
+    }
+
+    return NextResponse.json(
+      { success: false, error: "티켓 내보내기에 실패했습니다" },
+      { status: 500 }
+    );
+  }
+}
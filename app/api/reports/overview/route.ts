@@ -1,143 +1,152 @@
 import { NextRequest, NextResponse } from "next/server";
-import { db } from "@/lib/db";
-import { tickets, users, categories } from "@/lib/db/schema";
+import { readDb } from "@/lib/db";
+import { ticketDailyStats, users, categories } from "@/lib/db/schema";
 import { requireManagerOrAdmin } from "@/lib/auth-utils";
-import { eq, and, gte, lte, sql, isNotNull } from "drizzle-orm";
+import { ticketStatsRange } from "@/lib/services/report-rollup-service";
+import type { ReportDateRange } from "@/lib/services/report-rollup-service";
+import {
+  getCachedReport,
+  matchesETag,
+  REPORT_CACHE_CONTROL,
+} from "@/lib/services/report-cache-service";
+import { eq, and, sql, isNotNull } from "drizzle-orm";
+
+/**
+ * Sum the daily rollup rows in a date range
+ * The four aggregations are independent and run concurrently.
+ */
+async function buildOverviewReport(range: ReportDateRange) {
+  const whereClause = ticketStatsRange(range);
+  const ticketCount = sql<number>`coalesce(sum(${ticketDailyStats.ticketCount}), 0)::int`;
+
+  const [statusCounts, priorityCounts, categoryCounts, agentPerformance] =
+    await Promise.all([
+      // Ticket counts by status
+      readDb
+        .select({
+          status: ticketDailyStats.status,
+          count: ticketCount,
+        })
+        .from(ticketDailyStats)
+        .where(whereClause)
+        .groupBy(ticketDailyStats.status),
+
+      // Ticket counts by priority
+      readDb
+        .select({
+          priority: ticketDailyStats.priority,
+          count: ticketCount,
+        })
+        .from(ticketDailyStats)
+        .where(whereClause)
+        .groupBy(ticketDailyStats.priority),
+
+      // Ticket counts by category
+      readDb
+        .select({
+          categoryId: ticketDailyStats.categoryId,
+          categoryName: categories.name,
+          count: ticketCount,
+        })
+        .from(ticketDailyStats)
+        .leftJoin(categories, eq(ticketDailyStats.categoryId, categories.id))
+        .where(whereClause)
+        .groupBy(ticketDailyStats.categoryId, categories.name),
+
+      // Agent performance
+      readDb
+        .select({
+          agentId: ticketDailyStats.agentId,
+          agentName: users.name,
+          totalAssigned: ticketCount,
+          resolved: sql<number>`coalesce(sum(${ticketDailyStats.ticketCount}) filter (where ${ticketDailyStats.status} in ('resolved', 'closed')), 0)::int`,
+          avgResolutionTime: sql<number>`sum(${ticketDailyStats.resolutionHoursSum}) / nullif(sum(${ticketDailyStats.resolutionCount}), 0)`,
+        })
+        .from(ticketDailyStats)
+        .innerJoin(users, eq(ticketDailyStats.agentId, users.id))
+        .where(and(isNotNull(ticketDailyStats.agentId), whereClause))
+        .groupBy(ticketDailyStats.agentId, users.name),
+    ]);
+
+  // Calculate total tickets
+  const totalTickets = statusCounts.reduce(
+    (sum, item) => sum + Number(item.count),
+    0
+  );
+
+  // Format response
+  const statusMap = statusCounts.reduce(
+    (acc, item) => {
+      acc[item.status] = Number(item.count);
+      return acc;
+    },
+    {} as Record<string, number>
+  );
+
+  const priorityMap = priorityCounts.reduce(
+    (acc, item) => {
+      acc[item.priority] = Number(item.count);
+      return acc;
+    },
+    {} as Record<string, number>
+  );
+
+  return {
+    total: totalTickets,
+    byStatus: {
+      open: statusMap.open || 0,
+      in_progress: statusMap.in_progress || 0,
+      resolved: statusMap.resolved || 0,
+      closed: statusMap.closed || 0,
+    },
+    byPriority: {
+      low: priorityMap.low || 0,
+      medium: priorityMap.medium || 0,
+      high: priorityMap.high || 0,
+    },
+    byCategory: categoryCounts.map((item) => ({
+      categoryId: item.categoryId,
+      categoryName: item.categoryName || "미분류",
+      count: Number(item.count),
+    })),
+    agentPerformance: agentPerformance.map((item) => ({
+      agentId: item.agentId,
+      agentName: item.agentName,
+      totalAssigned: Number(item.totalAssigned),
+      resolved: Number(item.resolved),
+      avgResolutionTime: item.avgResolutionTime
+        ? Number(item.avgResolutionTime.toFixed(2))
+        : 0,
+    })),
+  };
+}
 
 /**
  * GET /api/reports/overview
  * Get overall ticket statistics
  * Query params: startDate, endDate (YYYY-MM-DD format)
+ * Responses carry an ETag; If-None-Match yields 304 Not Modified
  */
 export async function GET(request: NextRequest) {
   try {
     await requireManagerOrAdmin();
 
     const { searchParams } = new URL(request.url);
-    const startDate = searchParams.get("startDate");
-    const endDate = searchParams.get("endDate");
-
-    // Build date filter
-    const dateFilter = [];
-    if (startDate) {
-      dateFilter.push(gte(tickets.createdAt, new Date(startDate)));
-    }
-    if (endDate) {
-      // Include the entire end date
-      const endDateTime = new Date(endDate);
-      endDateTime.setHours(23, 59, 59, 999);
-      dateFilter.push(lte(tickets.createdAt, endDateTime));
-    }
+    const range = {
+      startDate: searchParams.get("startDate"),
+      endDate: searchParams.get("endDate"),
+    };
 
-    const whereClause = dateFilter.length > 0 ? and(...dateFilter) : undefined;
-
-    // Get ticket counts by status
-    const statusCounts = await db
-      .select({
-        status: tickets.status,
-        count: sql<number>`count(*)::int`,
-      })
-      .from(tickets)
-      .where(whereClause)
-      .groupBy(tickets.status);
-
-    // Get ticket counts by priority
-    const priorityCounts = await db
-      .select({
-        priority: tickets.priority,
-        count: sql<number>`count(*)::int`,
-      })
-      .from(tickets)
-      .where(whereClause)
-      .groupBy(tickets.priority);
-
-    // Get ticket counts by category
-    const categoryCounts = await db
-      .select({
-        categoryId: tickets.categoryId,
-        categoryName: categories.name,
-        count: sql<number>`count(*)::int`,
-      })
-      .from(tickets)
-      .leftJoin(categories, eq(tickets.categoryId, categories.id))
-      .where(whereClause)
-      .groupBy(tickets.categoryId, categories.name);
-
-    // Get agent performance
-    const agentPerformance = await db
-      .select({
-        agentId: tickets.agentId,
-        agentName: users.name,
-        totalAssigned: sql<number>`count(*)::int`,
-        resolved: sql<number>`count(case when ${tickets.status} = 'resolved' or ${tickets.status} = 'closed' then 1 end)::int`,
-        avgResolutionTime: sql<number>`
-          avg(
-            case
-              when ${tickets.resolvedAt} is not null
-              then extract(epoch from (${tickets.resolvedAt} - ${tickets.createdAt})) / 3600
-            end
-          )
-        `,
-      })
-      .from(tickets)
-      .innerJoin(users, eq(tickets.agentId, users.id))
-      .where(and(isNotNull(tickets.agentId), whereClause))
-      .groupBy(tickets.agentId, users.name);
-
-    // Calculate total tickets
-    const totalTickets = statusCounts.reduce(
-      (sum, item) => sum + Number(item.count),
-      0
+    const { data, etag } = await getCachedReport("overview", range, () =>
+      buildOverviewReport(range)
     );
+    const headers = { ETag: etag, "Cache-Control": REPORT_CACHE_CONTROL };
 
-    // Format response
-    const statusMap = statusCounts.reduce(
-      (acc, item) => {
-        acc[item.status] = Number(item.count);
-        return acc;
-      },
-      {} as Record<string, number>
-    );
-
-    const priorityMap = priorityCounts.reduce(
-      (acc, item) => {
-        acc[item.priority] = Number(item.count);
-        return acc;
-      },
-      {} as Record<string, number>
-    );
+    if (matchesETag(request.headers.get("if-none-match"), etag)) {
+      return new NextResponse(null, { status: 304, headers });
+    }
 
-    return NextResponse.json({
-      success: true,
-      data: {
-        total: totalTickets,
-        byStatus: {
-          open: statusMap.open || 0,
-          in_progress: statusMap.in_progress || 0,
-          resolved: statusMap.resolved || 0,
-          closed: statusMap.closed || 0,
-        },
-        byPriority: {
-          low: priorityMap.low || 0,
-          medium: priorityMap.medium || 0,
-          high: priorityMap.high || 0,
-        },
-        byCategory: categoryCounts.map((item) => ({
-          categoryId: item.categoryId,
-          categoryName: item.categoryName || "미분류",
-          count: Number(item.count),
-        })),
-        agentPerformance: agentPerformance.map((item) => ({
-          agentId: item.agentId,
-          agentName: item.agentName,
-          totalAssigned: Number(item.totalAssigned),
-          resolved: Number(item.resolved),
-          avgResolutionTime: item.avgResolutionTime
-            ? Number(item.avgResolutionTime.toFixed(2))
-            : 0,
-        })),
-      },
-    });
+    return NextResponse.json({ success: true, data }, { headers });
   } catch (error) {
     console.error("Error fetching overview report:", error);
 
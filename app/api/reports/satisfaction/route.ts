@@ -1,120 +1,139 @@
 import { NextRequest, NextResponse } from "next/server";
-import { db } from "@/lib/db";
-import { customerSatisfactions, tickets, users, categories } from "@/lib/db/schema";
+import { readDb } from "@/lib/db";
+import { satisfactionDailyStats, users, categories } from "@/lib/db/schema";
 import { requireManagerOrAdmin } from "@/lib/auth-utils";
-import { eq, and, gte, lte, sql } from "drizzle-orm";
+import { satisfactionStatsRange } from "@/lib/services/report-rollup-service";
+import type { ReportDateRange } from "@/lib/services/report-rollup-service";
+import {
+  getCachedReport,
+  matchesETag,
+  REPORT_CACHE_CONTROL,
+} from "@/lib/services/report-cache-service";
+import { eq, sql } from "drizzle-orm";
 
 /**
- * GET /api/reports/satisfaction
- * Get satisfaction statistics
- * Query params: startDate, endDate (YYYY-MM-DD format)
+ * Sum the daily satisfaction rollup rows in a date range
+ * The four aggregations are independent and run concurrently.
  */
-export async function GET(request: NextRequest) {
-  try {
-    await requireManagerOrAdmin();
-
-    const { searchParams } = new URL(request.url);
-    const startDate = searchParams.get("startDate");
-    const endDate = searchParams.get("endDate");
-
-    // Build date filter
-    const dateFilter = [];
-    if (startDate) {
-      dateFilter.push(gte(customerSatisfactions.createdAt, new Date(startDate)));
-    }
-    if (endDate) {
-      // Include the entire end date
-      const endDateTime = new Date(endDate);
-      endDateTime.setHours(23, 59, 59, 999);
-      dateFilter.push(lte(customerSatisfactions.createdAt, endDateTime));
-    }
+async function buildSatisfactionReport(range: ReportDateRange) {
+  const whereClause = satisfactionStatsRange(range);
+  const ratingCount = sql<number>`coalesce(sum(${satisfactionDailyStats.ratingCount}), 0)::int`;
+  const averageRating = sql<number>`sum(${satisfactionDailyStats.rating} * ${satisfactionDailyStats.ratingCount})::float8 / nullif(sum(${satisfactionDailyStats.ratingCount}), 0)`;
 
-    const whereClause = dateFilter.length > 0 ? and(...dateFilter) : undefined;
-
-    // Get average satisfaction score
-    const [averageResult] = await db
+  const [
+    [averageResult],
+    ratingDistribution,
+    satisfactionByCategory,
+    satisfactionByAgent,
+  ] = await Promise.all([
+    // Average satisfaction score
+    readDb
       .select({
-        average: sql<number>`avg(${customerSatisfactions.rating})`,
-        total: sql<number>`count(*)::int`,
+        average: averageRating,
+        total: ratingCount,
       })
-      .from(customerSatisfactions)
-      .where(whereClause);
+      .from(satisfactionDailyStats)
+      .where(whereClause),
 
-    // Get rating distribution (1-5 stars)
-    const ratingDistribution = await db
+    // Rating distribution (1-5 stars)
+    readDb
       .select({
-        rating: customerSatisfactions.rating,
-        count: sql<number>`count(*)::int`,
+        rating: satisfactionDailyStats.rating,
+        count: ratingCount,
       })
-      .from(customerSatisfactions)
+      .from(satisfactionDailyStats)
       .where(whereClause)
-      .groupBy(customerSatisfactions.rating)
-      .orderBy(customerSatisfactions.rating);
+      .groupBy(satisfactionDailyStats.rating)
+      .orderBy(satisfactionDailyStats.rating),
 
-    // Get satisfaction by category
-    const satisfactionByCategory = await db
+    // Satisfaction by category
+    readDb
       .select({
-        categoryId: tickets.categoryId,
+        categoryId: satisfactionDailyStats.categoryId,
         categoryName: categories.name,
-        average: sql<number>`avg(${customerSatisfactions.rating})`,
-        count: sql<number>`count(*)::int`,
+        average: averageRating,
+        count: ratingCount,
       })
-      .from(customerSatisfactions)
-      .innerJoin(tickets, eq(customerSatisfactions.ticketId, tickets.id))
-      .leftJoin(categories, eq(tickets.categoryId, categories.id))
+      .from(satisfactionDailyStats)
+      .leftJoin(categories, eq(satisfactionDailyStats.categoryId, categories.id))
       .where(whereClause)
-      .groupBy(tickets.categoryId, categories.name);
+      .groupBy(satisfactionDailyStats.categoryId, categories.name),
 
-    // Get satisfaction by agent
-    const satisfactionByAgent = await db
+    // Satisfaction by agent
+    readDb
       .select({
-        agentId: tickets.agentId,
+        agentId: satisfactionDailyStats.agentId,
         agentName: users.name,
-        average: sql<number>`avg(${customerSatisfactions.rating})`,
-        count: sql<number>`count(*)::int`,
+        average: averageRating,
+        count: ratingCount,
       })
-      .from(customerSatisfactions)
-      .innerJoin(tickets, eq(customerSatisfactions.ticketId, tickets.id))
-      .innerJoin(users, eq(tickets.agentId, users.id))
+      .from(satisfactionDailyStats)
+      .innerJoin(users, eq(satisfactionDailyStats.agentId, users.id))
       .where(whereClause)
-      .groupBy(tickets.agentId, users.name);
+      .groupBy(satisfactionDailyStats.agentId, users.name),
+  ]);
+
+  // Format rating distribution to include all 1-5 ratings
+  const ratingMap = ratingDistribution.reduce(
+    (acc, item) => {
+      acc[item.rating] = Number(item.count);
+      return acc;
+    },
+    {} as Record<number, number>
+  );
+
+  const distribution = [1, 2, 3, 4, 5].map((rating) => ({
+    rating,
+    count: ratingMap[rating] || 0,
+  }));
 
-    // Format rating distribution to include all 1-5 ratings
-    const ratingMap = ratingDistribution.reduce(
-      (acc, item) => {
-        acc[item.rating] = Number(item.count);
-        return acc;
-      },
-      {} as Record<number, number>
+  return {
+    average: averageResult.average
+      ? Number(averageResult.average.toFixed(1))
+      : 0,
+    total: Number(averageResult.total),
+    distribution,
+    byCategory: satisfactionByCategory.map((item) => ({
+      categoryId: item.categoryId,
+      categoryName: item.categoryName || "미분류",
+      average: item.average ? Number(item.average.toFixed(1)) : 0,
+      count: Number(item.count),
+    })),
+    byAgent: satisfactionByAgent.map((item) => ({
+      agentId: item.agentId,
+      agentName: item.agentName,
+      average: item.average ? Number(item.average.toFixed(1)) : 0,
+      count: Number(item.count),
+    })),
+  };
+}
+
+/**
+ * GET /api/reports/satisfaction
+ * Get satisfaction statistics
+ * Query params: startDate, endDate (YYYY-MM-DD format)
+ * Responses carry an ETag; If-None-Match yields 304 Not Modified
+ */
+export async function GET(request: NextRequest) {
+  try {
+    await requireManagerOrAdmin();
+
+    const { searchParams } = new URL(request.url);
+    const range = {
+      startDate: searchParams.get("startDate"),
+      endDate: searchParams.get("endDate"),
+    };
+
+    const { data, etag } = await getCachedReport("satisfaction", range, () =>
+      buildSatisfactionReport(range)
     );
+    const headers = { ETag: etag, "Cache-Control": REPORT_CACHE_CONTROL };
 
-    const distribution = [1, 2, 3, 4, 5].map((rating) => ({
-      rating,
-      count: ratingMap[rating] || 0,
-    }));
+    if (matchesETag(request.headers.get("if-none-match"), etag)) {
+      return new NextResponse(null, { status: 304, headers });
+    }
 
-    return NextResponse.json({
-      success: true,
-      data: {
-        average: averageResult.average
-          ? Number(averageResult.average.toFixed(1))
-          : 0,
-        total: Number(averageResult.total),
-        distribution,
-        byCategory: satisfactionByCategory.map((item) => ({
-          categoryId: item.categoryId,
-          categoryName: item.categoryName || "미분류",
-          average: item.average ? Number(item.average.toFixed(1)) : 0,
-          count: Number(item.count),
-        })),
-        byAgent: satisfactionByAgent.map((item) => ({
-          agentId: item.agentId,
-          agentName: item.agentName,
-          average: item.average ? Number(item.average.toFixed(1)) : 0,
-          count: Number(item.count),
-        })),
-      },
-    });
+    return NextResponse.json({ success: true, data }, { headers });
   } catch (error) {
     console.error("Error fetching satisfaction report:", error);
 
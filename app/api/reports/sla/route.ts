@@ -1,206 +1,208 @@
 import { NextRequest, NextResponse } from "next/server";
-import { db } from "@/lib/db";
-import { tickets, users, categories } from "@/lib/db/schema";
+import { readDb } from "@/lib/db";
+import { ticketDailyStats, users, categories } from "@/lib/db/schema";
 import { requireManagerOrAdmin } from "@/lib/auth-utils";
-import { eq, and, gte, lte, sql, isNotNull } from "drizzle-orm";
+import { ticketStatsRange } from "@/lib/services/report-rollup-service";
+import type { ReportDateRange } from "@/lib/services/report-rollup-service";
+import {
+  getCachedReport,
+  matchesETag,
+  REPORT_CACHE_CONTROL,
+} from "@/lib/services/report-cache-service";
+import { eq, and, sql, isNotNull } from "drizzle-orm";
 
 /**
- * GET /api/reports/sla
- * Get SLA performance statistics
- * Query params: startDate, endDate (YYYY-MM-DD format)
+ * Sum the SLA outcomes of the daily rollup rows in a date range
+ * The overall, per-agent and per-category aggregations run concurrently.
  */
-export async function GET(request: NextRequest) {
-  try {
-    await requireManagerOrAdmin();
-
-    const { searchParams } = new URL(request.url);
-    const startDate = searchParams.get("startDate");
-    const endDate = searchParams.get("endDate");
-
-    // Build date filter
-    const dateFilter = [];
-    if (startDate) {
-      dateFilter.push(gte(tickets.createdAt, new Date(startDate)));
-    }
-    if (endDate) {
-      // Include the entire end date
-      const endDateTime = new Date(endDate);
-      endDateTime.setHours(23, 59, 59, 999);
-      dateFilter.push(lte(tickets.createdAt, endDateTime));
-    }
+async function buildSlaReport(range: ReportDateRange) {
+  const whereClause = ticketStatsRange(range);
+  const slaTotals = {
+    totalWithResponseSLA: sql<number>`coalesce(sum(${ticketDailyStats.responseMet} + ${ticketDailyStats.responseViolated}), 0)::int`,
+    responseMet: sql<number>`coalesce(sum(${ticketDailyStats.responseMet}), 0)::int`,
+    responseViolated: sql<number>`coalesce(sum(${ticketDailyStats.responseViolated}), 0)::int`,
+    totalWithResolveSLA: sql<number>`coalesce(sum(${ticketDailyStats.resolveMet} + ${ticketDailyStats.resolveViolated}), 0)::int`,
+    resolveMet: sql<number>`coalesce(sum(${ticketDailyStats.resolveMet}), 0)::int`,
+    resolveViolated: sql<number>`coalesce(sum(${ticketDailyStats.resolveViolated}), 0)::int`,
+  };
 
-    const whereClause = dateFilter.length > 0 ? and(...dateFilter) : undefined;
+  const [[overallSLA], slaByAgent, slaByCategory] = await Promise.all([
+    // Overall SLA statistics
+    readDb.select(slaTotals).from(ticketDailyStats).where(whereClause),
 
-    // Get overall SLA statistics
-    const [overallSLA] = await db
+    // SLA performance by agent
+    readDb
       .select({
-        totalWithResponseSLA: sql<number>`count(case when ${tickets.slaResponseMet} is not null then 1 end)::int`,
-        responseMet: sql<number>`count(case when ${tickets.slaResponseMet} = true then 1 end)::int`,
-        responseViolated: sql<number>`count(case when ${tickets.slaResponseMet} = false then 1 end)::int`,
-        totalWithResolveSLA: sql<number>`count(case when ${tickets.slaResolveMet} is not null then 1 end)::int`,
-        resolveMet: sql<number>`count(case when ${tickets.slaResolveMet} = true then 1 end)::int`,
-        resolveViolated: sql<number>`count(case when ${tickets.slaResolveMet} = false then 1 end)::int`,
-      })
-      .from(tickets)
-      .where(whereClause);
-
-    // Calculate percentages
-    const totalWithResponseSLA = Number(overallSLA.totalWithResponseSLA);
-    const responseMet = Number(overallSLA.responseMet);
-    const responseViolated = Number(overallSLA.responseViolated);
-    const totalWithResolveSLA = Number(overallSLA.totalWithResolveSLA);
-    const resolveMet = Number(overallSLA.resolveMet);
-    const resolveViolated = Number(overallSLA.resolveViolated);
-
-    const responseMetPercentage =
-      totalWithResponseSLA > 0
-        ? Number(((responseMet / totalWithResponseSLA) * 100).toFixed(1))
-        : 0;
-
-    const resolveMetPercentage =
-      totalWithResolveSLA > 0
-        ? Number(((resolveMet / totalWithResolveSLA) * 100).toFixed(1))
-        : 0;
-
-    // Get SLA performance by agent
-    const slaByAgent = await db
-      .select({
-        agentId: tickets.agentId,
+        agentId: ticketDailyStats.agentId,
         agentName: users.name,
-        totalWithResponseSLA: sql<number>`count(case when ${tickets.slaResponseMet} is not null then 1 end)::int`,
-        responseMet: sql<number>`count(case when ${tickets.slaResponseMet} = true then 1 end)::int`,
-        responseViolated: sql<number>`count(case when ${tickets.slaResponseMet} = false then 1 end)::int`,
-        totalWithResolveSLA: sql<number>`count(case when ${tickets.slaResolveMet} is not null then 1 end)::int`,
-        resolveMet: sql<number>`count(case when ${tickets.slaResolveMet} = true then 1 end)::int`,
-        resolveViolated: sql<number>`count(case when ${tickets.slaResolveMet} = false then 1 end)::int`,
+        ...slaTotals,
       })
-      .from(tickets)
-      .innerJoin(users, eq(tickets.agentId, users.id))
-      .where(and(isNotNull(tickets.agentId), whereClause))
-      .groupBy(tickets.agentId, users.name);
+      .from(ticketDailyStats)
+      .innerJoin(users, eq(ticketDailyStats.agentId, users.id))
+      .where(and(isNotNull(ticketDailyStats.agentId), whereClause))
+      .groupBy(ticketDailyStats.agentId, users.name),
 
-    // Get SLA performance by category
-    const slaByCategory = await db
+    // SLA performance by category
+    readDb
       .select({
-        categoryId: tickets.categoryId,
+        categoryId: ticketDailyStats.categoryId,
         categoryName: categories.name,
-        totalWithResponseSLA: sql<number>`count(case when ${tickets.slaResponseMet} is not null then 1 end)::int`,
-        responseMet: sql<number>`count(case when ${tickets.slaResponseMet} = true then 1 end)::int`,
-        responseViolated: sql<number>`count(case when ${tickets.slaResponseMet} = false then 1 end)::int`,
-        totalWithResolveSLA: sql<number>`count(case when ${tickets.slaResolveMet} is not null then 1 end)::int`,
-        resolveMet: sql<number>`count(case when ${tickets.slaResolveMet} = true then 1 end)::int`,
-        resolveViolated: sql<number>`count(case when ${tickets.slaResolveMet} = false then 1 end)::int`,
+        ...slaTotals,
       })
-      .from(tickets)
-      .leftJoin(categories, eq(tickets.categoryId, categories.id))
+      .from(ticketDailyStats)
+      .leftJoin(categories, eq(ticketDailyStats.categoryId, categories.id))
       .where(whereClause)
-      .groupBy(tickets.categoryId, categories.name);
-
-    return NextResponse.json({
-      success: true,
-      data: {
-        overall: {
-          response: {
-            total: totalWithResponseSLA,
-            met: responseMet,
-            violated: responseViolated,
-            metPercentage: responseMetPercentage,
-            violatedPercentage:
-              totalWithResponseSLA > 0
-                ? Number(
-                    ((responseViolated / totalWithResponseSLA) * 100).toFixed(1)
-                  )
-                : 0,
-          },
-          resolve: {
-            total: totalWithResolveSLA,
-            met: resolveMet,
-            violated: resolveViolated,
-            metPercentage: resolveMetPercentage,
-            violatedPercentage:
-              totalWithResolveSLA > 0
-                ? Number(
-                    ((resolveViolated / totalWithResolveSLA) * 100).toFixed(1)
-                  )
-                : 0,
-          },
-        },
-        byAgent: slaByAgent.map((item) => {
-          const agentResponseTotal = Number(item.totalWithResponseSLA);
-          const agentResolveTotal = Number(item.totalWithResolveSLA);
-
-          return {
-            agentId: item.agentId,
-            agentName: item.agentName,
-            response: {
-              total: agentResponseTotal,
-              met: Number(item.responseMet),
-              violated: Number(item.responseViolated),
-              metPercentage:
-                agentResponseTotal > 0
-                  ? Number(
-                      (
-                        (Number(item.responseMet) / agentResponseTotal) *
-                        100
-                      ).toFixed(1)
-                    )
-                  : 0,
-            },
-            resolve: {
-              total: agentResolveTotal,
-              met: Number(item.resolveMet),
-              violated: Number(item.resolveViolated),
-              metPercentage:
-                agentResolveTotal > 0
-                  ? Number(
-                      (
-                        (Number(item.resolveMet) / agentResolveTotal) *
-                        100
-                      ).toFixed(1)
-                    )
-                  : 0,
-            },
-          };
-        }),
-        byCategory: slaByCategory.map((item) => {
-          const categoryResponseTotal = Number(item.totalWithResponseSLA);
-          const categoryResolveTotal = Number(item.totalWithResolveSLA);
-
-          return {
-            categoryId: item.categoryId,
-            categoryName: item.categoryName || "미분류",
-            response: {
-              total: categoryResponseTotal,
-              met: Number(item.responseMet),
-              violated: Number(item.responseViolated),
-              metPercentage:
-                categoryResponseTotal > 0
-                  ? Number(
-                      (
-                        (Number(item.responseMet) / categoryResponseTotal) *
-                        100
-                      ).toFixed(1)
-                    )
-                  : 0,
-            },
-            resolve: {
-              total: categoryResolveTotal,
-              met: Number(item.resolveMet),
-              violated: Number(item.resolveViolated),
-              metPercentage:
-                categoryResolveTotal > 0
-                  ? Number(
-                      (
-                        (Number(item.resolveMet) / categoryResolveTotal) *
-                        100
-                      ).toFixed(1)
-                    )
-                  : 0,
-            },
-          };
-        }),
+      .groupBy(ticketDailyStats.categoryId, categories.name),
+  ]);
+
+  // Calculate percentages
+  const totalWithResponseSLA = Number(overallSLA.totalWithResponseSLA);
+  const responseMet = Number(overallSLA.responseMet);
+  const responseViolated = Number(overallSLA.responseViolated);
+  const totalWithResolveSLA = Number(overallSLA.totalWithResolveSLA);
+  const resolveMet = Number(overallSLA.resolveMet);
+  const resolveViolated = Number(overallSLA.resolveViolated);
+
+  const responseMetPercentage =
+    totalWithResponseSLA > 0
+      ? Number(((responseMet / totalWithResponseSLA) * 100).toFixed(1))
+      : 0;
+
+  const resolveMetPercentage =
+    totalWithResolveSLA > 0
+      ? Number(((resolveMet / totalWithResolveSLA) * 100).toFixed(1))
+      : 0;
+
+  return {
+    overall: {
+      response: {
+        total: totalWithResponseSLA,
+        met: responseMet,
+        violated: responseViolated,
+        metPercentage: responseMetPercentage,
+        violatedPercentage:
+          totalWithResponseSLA > 0
+            ? Number(
+                ((responseViolated / totalWithResponseSLA) * 100).toFixed(1)
+              )
+            : 0,
+      },
+      resolve: {
+        total: totalWithResolveSLA,
+        met: resolveMet,
+        violated: resolveViolated,
+        metPercentage: resolveMetPercentage,
+        violatedPercentage:
+          totalWithResolveSLA > 0
+            ? Number(
+                ((resolveViolated / totalWithResolveSLA) * 100).toFixed(1)
+              )
+            : 0,
       },
-    });
+    },
+    byAgent: slaByAgent.map((item) => {
+      const agentResponseTotal = Number(item.totalWithResponseSLA);
+      const agentResolveTotal = Number(item.totalWithResolveSLA);
+
+      return {
+        agentId: item.agentId,
+        agentName: item.agentName,
+        response: {
+          total: agentResponseTotal,
+          met: Number(item.responseMet),
+          violated: Number(item.responseViolated),
+          metPercentage:
+            agentResponseTotal > 0
+              ? Number(
+                  (
+                    (Number(item.responseMet) / agentResponseTotal) *
+                    100
+                  ).toFixed(1)
+                )
+              : 0,
+        },
+        resolve: {
+          total: agentResolveTotal,
+          met: Number(item.resolveMet),
+          violated: Number(item.resolveViolated),
+          metPercentage:
+            agentResolveTotal > 0
+              ? Number(
+                  (
+                    (Number(item.resolveMet) / agentResolveTotal) *
+                    100
+                  ).toFixed(1)
+                )
+              : 0,
+        },
+      };
+    }),
+    byCategory: slaByCategory.map((item) => {
+      const categoryResponseTotal = Number(item.totalWithResponseSLA);
+      const categoryResolveTotal = Number(item.totalWithResolveSLA);
+
+      return {
+        categoryId: item.categoryId,
+        categoryName: item.categoryName || "미분류",
+        response: {
+          total: categoryResponseTotal,
+          met: Number(item.responseMet),
+          violated: Number(item.responseViolated),
+          metPercentage:
+            categoryResponseTotal > 0
+              ? Number(
+                  (
+                    (Number(item.responseMet) / categoryResponseTotal) *
+                    100
+                  ).toFixed(1)
+                )
+              : 0,
+        },
+        resolve: {
+          total: categoryResolveTotal,
+          met: Number(item.resolveMet),
+          violated: Number(item.resolveViolated),
+          metPercentage:
+            categoryResolveTotal > 0
+              ? Number(
+                  (
+                    (Number(item.resolveMet) / categoryResolveTotal) *
+                    100
+                  ).toFixed(1)
+                )
+              : 0,
+        },
+      };
+    }),
+  };
+}
+
+/**
+ * GET /api/reports/sla
+ * Get SLA performance statistics
+ * Query params: startDate, endDate (YYYY-MM-DD format)
+ * Responses carry an ETag; If-None-Match yields 304 Not Modified
+ */
+export async function GET(request: NextRequest) {
+  try {
+    await requireManagerOrAdmin();
+
+    const { searchParams } = new URL(request.url);
+    const range = {
+      startDate: searchParams.get("startDate"),
+      endDate: searchParams.get("endDate"),
+    };
+
+    const { data, etag } = await getCachedReport("sla", range, () =>
+      buildSlaReport(range)
+    );
+    const headers = { ETag: etag, "Cache-Control": REPORT_CACHE_CONTROL };
+
+    if (matchesETag(request.headers.get("if-none-match"), etag)) {
+      return new NextResponse(null, { status: 304, headers });
+    }
+
+    return NextResponse.json({ success: true, data }, { headers });
   } catch (error) {
     console.error("Error fetching SLA report:", error);
 
@@ -3,6 +3,7 @@ import { db } from '@/lib/db';
 import { aiPromptTemplates, categories } from '@/lib/db/schema';
 import { aiTemplateUpdateSchema } from '@/lib/validations';
 import { requireAdmin } from '@/lib/auth-utils';
+import { invalidateReferenceData } from '@/lib/services/reference-data-service';
 import { eq } from 'drizzle-orm';
 
 /**
@@ -119,6 +120,8 @@ export async function PATCH(
       .where(eq(aiPromptTemplates.id, id))
       .returning();
 
+    await invalidateReferenceData('promptTemplates');
+
     return NextResponse.json({
       success: true,
       data: updated,
@@ -178,6 +181,7 @@ export async function DELETE(
     }
 
     await db.delete(aiPromptTemplates).where(eq(aiPromptTemplates.id, id));
+    await invalidateReferenceData('promptTemplates');
 
     return NextResponse.json({
       success: true,
@@ -3,6 +3,7 @@ import { db } from '@/lib/db';
 import { aiPromptTemplates, categories } from '@/lib/db/schema';
 import { aiTemplateCreateSchema } from '@/lib/validations';
 import { requireAdmin } from '@/lib/auth-utils';
+import { invalidateReferenceData } from '@/lib/services/reference-data-service';
 import { eq, desc, isNull } from 'drizzle-orm';
 
 /**
@@ -108,6 +109,8 @@ export async function POST(request: NextRequest) {
       })
       .returning();
 
+    await invalidateReferenceData('promptTemplates');
+
     return NextResponse.json(
       {
         success: true,
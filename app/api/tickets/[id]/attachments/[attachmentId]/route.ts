@@ -2,14 +2,19 @@ import { NextRequest, NextResponse } from 'next/server';
 import { db } from '@/lib/db';
 import { ticketAttachments } from '@/lib/db/schema';
 import { requireAuth } from '@/lib/auth-utils';
-import { getTicketById } from '@/lib/services/ticket-service';
-import { eq } from 'drizzle-orm';
-import { readFile, unlink } from 'fs/promises';
-import path from 'path';
+import { getTicketAccess } from '@/lib/services/ticket-service';
+import { deleteAttachment, getAccessibleAttachment } from '@/lib/services/attachment-service';
+import { createFileStream, parseRangeHeader, resolveUploadPath } from '@/lib/upload';
+import { and, eq } from 'drizzle-orm';
+import { stat } from 'fs/promises';
 
 /**
  * GET /api/tickets/[id]/attachments/[attachmentId]
  * Download an attachment
+ *
+ * Streams the file from disk and supports Range requests and
+ * If-None-Match revalidation. Attachments are never modified after upload,
+ * so responses can be cached as immutable.
  */
 export async function GET(
   request: NextRequest,
@@ -19,42 +24,69 @@ export async function GET(
     const user = await requireAuth();
     const { id, attachmentId } = await params;
 
-    // Check if user has access to this ticket
-    const ticket = await getTicketById(id, user.id, user.role);
+    // Get attachment and check access to its ticket in one query
+    const attachment = await getAccessibleAttachment(id, attachmentId, user.id, user.role);
 
-    if (!ticket) {
+    if (!attachment) {
       return NextResponse.json(
-        { success: false, error: '티켓을 찾을 수 없거나 접근 권한이 없습니다' },
+        { success: false, error: '첨부파일을 찾을 수 없거나 접근 권한이 없습니다' },
         { status: 404 }
       );
     }
 
-    // Get attachment
-    const [attachment] = await db
-      .select()
-      .from(ticketAttachments)
-      .where(eq(ticketAttachments.id, attachmentId))
-      .limit(1);
+    const etag = `"${attachment.id}"`;
+    const cacheHeaders = {
+      ETag: etag,
+      'Cache-Control': 'private, max-age=31536000, immutable',
+    };
 
-    if (!attachment) {
-      return NextResponse.json(
-        { success: false, error: '첨부파일을 찾을 수 없습니다' },
-        { status: 404 }
-      );
+    // Revalidation: the client already has this file
+    const ifNoneMatch = request.headers.get('if-none-match');
+    if (ifNoneMatch && ifNoneMatch.split(',').some((tag) => tag.trim() === etag || tag.trim() === '*')) {
+      return new NextResponse(null, { status: 304, headers: cacheHeaders });
     }
 
-    // Read file
-    const filePath = path.join(process.cwd(), 'public', attachment.filePath);
-    const fileBuffer = await readFile(filePath);
+    const { size } = await stat(resolveUploadPath(attachment.filePath));
+
+    const headers: Record<string, string> = {
+      ...cacheHeaders,
+      'Content-Type': attachment.mimeType,
+      'Content-Disposition': `attachment; filename="${encodeURIComponent(
+        attachment.fileName
+      )}"`,
+      'Accept-Ranges': 'bytes',
+    };
+
+    // Only honour Range if If-Range (when present) still matches
+    const ifRange = request.headers.get('if-range');
+    const range =
+      !ifRange || ifRange === etag
+        ? parseRangeHeader(request.headers.get('range'), size)
+        : null;
+
+    if (range === 'unsatisfiable') {
+      return new NextResponse(null, {
+        status: 416,
+        headers: { ...headers, 'Content-Range': `bytes */${size}` },
+      });
+    }
+
+    if (range) {
+      return new NextResponse(createFileStream(attachment.filePath, range), {
+        status: 206,
+        headers: {
+          ...headers,
+          'Content-Range': `bytes ${range.start}-${range.end}/${size}`,
+          'Content-Length': (range.end - range.start + 1).toString(),
+        },
+      });
+    }
 
     // Return file
-    return new NextResponse(fileBuffer, {
+    return new NextResponse(createFileStream(attachment.filePath), {
       headers: {
-        'Content-Type': attachment.mimeType,
-        'Content-Disposition': `attachment; filename="${encodeURIComponent(
-          attachment.fileName
-        )}"`,
-        'Content-Length': attachment.fileSize.toString(),
+        ...headers,
+        'Content-Length': size.toString(),
       },
     });
   } catch (error) {
@@ -87,7 +119,7 @@ export async function DELETE(
     const { id, attachmentId } = await params;
 
     // Check if user has access to this ticket
-    const ticket = await getTicketById(id, user.id, user.role);
+    const ticket = await getTicketAccess(id, user.id, user.role);
 
     if (!ticket) {
       return NextResponse.json(
@@ -111,7 +143,7 @@ export async function DELETE(
     const [attachment] = await db
       .select()
       .from(ticketAttachments)
-      .where(eq(ticketAttachments.id, attachmentId))
+      .where(and(eq(ticketAttachments.id, attachmentId), eq(ticketAttachments.ticketId, id)))
       .limit(1);
 
     if (!attachment) {
@@ -121,17 +153,8 @@ export async function DELETE(
       );
     }
 
-    // Delete file from filesystem
-    try {
-      const filePath = path.join(process.cwd(), 'public', attachment.filePath);
-      await unlink(filePath);
-    } catch (error) {
-      console.error('Error deleting file from filesystem:', error);
-      // Continue with database deletion even if file deletion fails
-    }
-
-    // Delete from database
-    await db.delete(ticketAttachments).where(eq(ticketAttachments.id, attachmentId));
+    // Delete from database, and the file once no attachment references it
+    await deleteAttachment(attachment);
 
     return NextResponse.json({
       success: true,
@@ -0,0 +1,96 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { requireAuth } from '@/lib/auth-utils';
+import { getAccessibleAttachment } from '@/lib/services/attachment-service';
+import {
+  THUMBNAIL_CONTENT_TYPES,
+  THUMBNAIL_SIZES,
+  canHaveThumbnail,
+  ensureThumbnail,
+} from '@/lib/services/thumbnail-service';
+import type { ThumbnailFormat, ThumbnailSize } from '@/lib/services/thumbnail-service';
+import { createFileStream, resolveUploadPath } from '@/lib/upload';
+import { stat } from 'fs/promises';
+
+/**
+ * GET /api/tickets/[id]/attachments/[attachmentId]/thumbnail?size=thumb|preview
+ * Get a resized preview of an image attachment
+ *
+ * Serves WebP to browsers that accept it and JPEG otherwise. Thumbnails are
+ * derived from immutable blobs, so responses can be cached as immutable.
+ * If no thumbnail can be produced the client is redirected to the original.
+ */
+export async function GET(
+  request: NextRequest,
+  { params }: { params: Promise<{ id: string; attachmentId: string }> }
+) {
+  try {
+    const user = await requireAuth();
+    const { id, attachmentId } = await params;
+
+    const sizeParam = request.nextUrl.searchParams.get('size') || 'thumb';
+    if (!(sizeParam in THUMBNAIL_SIZES)) {
+      return NextResponse.json(
+        { success: false, error: '지원하지 않는 썸네일 크기입니다' },
+        { status: 400 }
+      );
+    }
+    const size = sizeParam as ThumbnailSize;
+
+    const attachment = await getAccessibleAttachment(id, attachmentId, user.id, user.role);
+
+    if (!attachment || !canHaveThumbnail(attachment.mimeType)) {
+      return NextResponse.json(
+        { success: false, error: '썸네일을 찾을 수 없거나 접근 권한이 없습니다' },
+        { status: 404 }
+      );
+    }
+
+    const accept = request.headers.get('accept') || '';
+    const format: ThumbnailFormat = accept.includes('image/webp') ? 'webp' : 'jpeg';
+    const etag = `"${attachment.id}-${size}-${format}"`;
+    const cacheHeaders = {
+      ETag: etag,
+      'Cache-Control': 'private, max-age=31536000, immutable',
+      Vary: 'Accept',
+    };
+
+    // Revalidation: the client already has this thumbnail
+    const ifNoneMatch = request.headers.get('if-none-match');
+    if (ifNoneMatch && ifNoneMatch.split(',').some((tag) => tag.trim() === etag || tag.trim() === '*')) {
+      return new NextResponse(null, { status: 304, headers: cacheHeaders });
+    }
+
+    const thumbnailPath = await ensureThumbnail(attachment, size, format);
+
+    if (!thumbnailPath) {
+      // Thumbnailing unavailable - fall back to the original file
+      return NextResponse.redirect(
+        new URL(`/api/tickets/${id}/attachments/${attachment.id}`, request.url)
+      );
+    }
+
+    const { size: contentLength } = await stat(resolveUploadPath(thumbnailPath));
+
+    return new NextResponse(createFileStream(thumbnailPath), {
+      headers: {
+        ...cacheHeaders,
+        'Content-Type': THUMBNAIL_CONTENT_TYPES[format],
+        'Content-Length': contentLength.toString(),
+      },
+    });
+  } catch (error) {
+    console.error('Error getting attachment thumbnail:', error);
+
+    if (error instanceof Error && error.message === 'Unauthorized') {
+      return NextResponse.json(
+        { success: false, error: '인증이 필요합니다' },
+        { status: 401 }
+      );
+    }
+
+    return NextResponse.json(
+      { success: false, error: '썸네일을 불러오는 중 오류가 발생했습니다' },
+      { status: 500 }
+    );
+  }
+}
@@ -3,7 +3,7 @@ import { db } from '@/lib/db';
 import { ticketAttachments } from '@/lib/db/schema';
 import { requireAuth } from '@/lib/auth-utils';
 import { getTicketById } from '@/lib/services/ticket-service';
-import { uploadFile } from '@/lib/upload';
+import { createAttachment } from '@/lib/services/attachment-service';
 import { eq } from 'drizzle-orm';
 
 /**
@@ -19,7 +19,7 @@ export async function GET(
     const { id } = await params;
 
     // Check if user has access to this ticket
-    const ticket = await getTicketById(id, user.id, user.role);
+    const ticket = await getTicketById(id, user.id, user.role, { includeArchived: true });
 
     if (!ticket) {
       return NextResponse.json(
@@ -87,8 +87,8 @@ export async function POST(
       );
     }
 
-    // Upload file
-    const uploadResult = await uploadFile(file);
+    // Store file (streamed, deduplicated by content) and save attachment record
+    const uploadResult = await createAttachment(id, file);
 
     if (!uploadResult.success) {
       return NextResponse.json(
@@ -97,17 +97,7 @@ export async function POST(
       );
     }
 
-    // Save attachment record
-    const [newAttachment] = await db
-      .insert(ticketAttachments)
-      .values({
-        ticketId: id,
-        fileName: uploadResult.fileName!,
-        filePath: uploadResult.filePath!,
-        fileSize: file.size,
-        mimeType: file.type,
-      })
-      .returning();
+    const newAttachment = uploadResult.attachment;
 
     return NextResponse.json(
       {
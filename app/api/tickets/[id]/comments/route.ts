@@ -1,14 +1,15 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { db } from '@/lib/db';
-import { ticketComments, users } from '@/lib/db/schema';
-import { commentCreateSchema } from '@/lib/validations';
+import { ticketComments } from '@/lib/db/schema';
+import { commentCreateSchema, commentPageSchema } from '@/lib/validations';
 import { requireAuth } from '@/lib/auth-utils';
 import { getTicketById, updateFirstResponseSLA } from '@/lib/services/ticket-service';
-import { eq, desc } from 'drizzle-orm';
+import { getCommentPage } from '@/lib/services/comment-service';
 
 /**
  * GET /api/tickets/[id]/comments
- * Get all comments for a ticket
+ * Get a page of comments for a ticket, newest page first
+ * Query params: before (id of the oldest loaded comment), limit
  */
 export async function GET(
   request: NextRequest,
@@ -19,7 +20,7 @@ export async function GET(
     const { id } = await params;
 
     // Check if user has access to this ticket
-    const ticket = await getTicketById(id, user.id, user.role);
+    const ticket = await getTicketById(id, user.id, user.role, { includeArchived: true });
 
     if (!ticket) {
       return NextResponse.json(
@@ -28,38 +29,29 @@ export async function GET(
       );
     }
 
-    // Get comments with author info
-    const comments = await db
-      .select({
-        comment: ticketComments,
-        author: users,
-      })
-      .from(ticketComments)
-      .leftJoin(users, eq(ticketComments.userId, users.id))
-      .where(eq(ticketComments.ticketId, id))
-      .orderBy(ticketComments.createdAt);
-
-    // Filter out internal comments for customers
-    const filteredComments = comments
-      .filter((c) => {
-        if (user.role === 'customer') {
-          return !c.comment.isInternal;
-        }
-        return true;
-      })
-      .map(({ comment, author }) => ({
-        ...comment,
-        author: {
-          id: author!.id,
-          name: author!.name,
-          email: author!.email,
-          role: author!.role,
-        },
-      }));
+    const { searchParams } = new URL(request.url);
+    const parsed = commentPageSchema.safeParse({
+      before: searchParams.get('before') || undefined,
+      limit: searchParams.get('limit') || undefined,
+    });
+
+    if (!parsed.success) {
+      return NextResponse.json(
+        { success: false, error: parsed.error.issues[0].message },
+        { status: 400 }
+      );
+    }
+
+    const page = await getCommentPage(id, user.role, parsed.data);
 
     return NextResponse.json({
       success: true,
-      data: filteredComments,
+      data: page.comments,
+      pagination: {
+        nextCursor: page.nextCursor,
+        hasMore: page.hasMore,
+        total: page.total,
+      },
     });
   } catch (error) {
     console.error('Error fetching comments:', error);
@@ -133,7 +125,10 @@ export async function POST(
     return NextResponse.json(
       {
         success: true,
-        data: newComment,
+        data: {
+          ...newComment,
+          author: { id: user.id, name: user.name, email: user.email, role: user.role },
+        },
         message: '댓글이 추가되었습니다',
       },
       { status: 201 }
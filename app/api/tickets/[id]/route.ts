@@ -19,7 +19,7 @@ export async function GET(
     const user = await requireAuth();
     const { id } = await params;
 
-    const ticket = await getTicketById(id, user.id, user.role);
+    const ticket = await getTicketById(id, user.id, user.role, { includeArchived: true });
 
     if (!ticket) {
       return NextResponse.json(
@@ -0,0 +1,76 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { ticketBulkUpdateSchema } from '@/lib/validations';
+import { requireAuth } from '@/lib/auth-utils';
+import { bulkUpdateTickets } from '@/lib/services/bulk-ticket-service';
+import { MAX_BULK_TICKETS } from '@/lib/constants';
+
+/**
+ * PATCH /api/tickets/bulk
+ * Change the status, assignee or priority of many tickets at once
+ *
+ * Body: { ticketIds: string[] } or { filter: {...} }, plus
+ * operation: { type: 'status', status } | { type: 'assign', agentId } |
+ * { type: 'priority', priority }. Each ticket gets its own outcome; tickets
+ * that fail their check are skipped without aborting the rest.
+ */
+export async function PATCH(request: NextRequest) {
+  try {
+    const user = await requireAuth();
+
+    const body = await request.json();
+    const parsed = ticketBulkUpdateSchema.safeParse(body);
+
+    if (!parsed.success) {
+      return NextResponse.json(
+        { success: false, error: parsed.error.issues[0].message },
+        { status: 400 }
+      );
+    }
+
+    const summary = await bulkUpdateTickets(parsed.data, user);
+
+    return NextResponse.json({
+      success: true,
+      data: summary,
+      message: `${summary.updated}개의 티켓이 변경되었습니다`,
+    });
+  } catch (error) {
+    console.error('Error updating tickets in bulk:', error);
+
+    if (error instanceof Error && error.message === 'Unauthorized') {
+      return NextResponse.json(
+        { success: false, error: '인증이 필요합니다' },
+        { status: 401 }
+      );
+    }
+
+    if (error instanceof Error && error.message === 'Forbidden') {
+      return NextResponse.json(
+        { success: false, error: '고객은 티켓을 일괄 변경할 수 없습니다' },
+        { status: 403 }
+      );
+    }
+
+    if (error instanceof Error && error.message === 'InvalidAgent') {
+      return NextResponse.json(
+        { success: false, error: '유효한 상담원이 아닙니다' },
+        { status: 400 }
+      );
+    }
+
+    if (error instanceof Error && error.message === 'TooManyTickets') {
+      return NextResponse.json(
+        {
+          success: false,
+          error: `필터에 해당하는 티켓이 ${MAX_BULK_TICKETS}개를 초과합니다. 조건을 좁혀 주세요`,
+        },
+        { status: 400 }
+      );
+    }
+
+    return NextResponse.json(
+      { success: false, error: '티켓 일괄 변경 중 오류가 발생했습니다' },
+      { status: 500 }
+    );
+  }
+}
@@ -0,0 +1,92 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { requireAuth } from '@/lib/auth-utils';
+import { subscribeToTicketEvents, ticketEventsAvailable } from '@/lib/services/ticket-event-service';
+
+export const dynamic = 'force-dynamic';
+
+const HEARTBEAT_INTERVAL = 25 * 1000; // 25 seconds
+
+/**
+ * GET /api/tickets/events
+ * Server-sent event stream of ticket changes visible to the current user
+ * Each message is a JSON-encoded TicketEvent
+ * Returns 503 when the server cannot LISTEN (transaction pooler without
+ * DATABASE_DIRECT_URL); clients then poll instead
+ */
+export async function GET(request: NextRequest) {
+  try {
+    const user = await requireAuth();
+
+    if (!ticketEventsAvailable()) {
+      return NextResponse.json(
+        { success: false, error: '실시간 이벤트를 사용할 수 없습니다' },
+        { status: 503 }
+      );
+    }
+
+    const encoder = new TextEncoder();
+    let cleanup = () => {};
+
+    const stream = new ReadableStream<Uint8Array>({
+      start(controller) {
+        const write = (chunk: string) => {
+          try {
+            controller.enqueue(encoder.encode(chunk));
+          } catch {
+            cleanup(); // Stream already closed
+          }
+        };
+
+        // Reconnect quickly after a dropped connection
+        write('retry: 3000\n\n');
+
+        const unsubscribe = subscribeToTicketEvents(user, (event) => {
+          write(`data: ${JSON.stringify(event)}\n\n`);
+        });
+
+        // Comment lines keep proxies from closing an idle connection
+        const heartbeat = setInterval(() => write(': ping\n\n'), HEARTBEAT_INTERVAL);
+
+        cleanup = () => {
+          clearInterval(heartbeat);
+          unsubscribe();
+        };
+
+        request.signal.addEventListener('abort', () => {
+          cleanup();
+          try {
+            controller.close();
+          } catch {
+            // Already closed
+          }
+        });
+      },
+      cancel() {
+        cleanup();
+      },
+    });
+
+    return new Response(stream, {
+      headers: {
+        'Content-Type': 'text/event-stream; charset=utf-8',
+        'Cache-Control': 'no-cache, no-transform',
+        Connection: 'keep-alive',
+        'X-Accel-Buffering': 'no',
+      },
+    });
+  } catch (error) {
+    console.error('Error opening ticket event stream:', error);
+
+    if (error instanceof Error && error.message === 'Unauthorized') {
+      return NextResponse.json(
+        { success: false, error: '인증이 필요합니다' },
+        { status: 401 }
+      );
+    }
+
+    return NextResponse.json(
+      { success: false, error: '이벤트 스트림 연결 중 오류가 발생했습니다' },
+      { status: 500 }
+    );
+  }
+}
@@ -1,15 +1,44 @@
-import { NextRequest, NextResponse } from 'next/server';
+import { NextRequest, NextResponse, after } from 'next/server';
 import { db } from '@/lib/db';
-import { tickets } from '@/lib/db/schema';
+import { users } from '@/lib/db/schema';
+import type { Ticket } from '@/lib/db/schema';
 import { ticketCreateSchema } from '@/lib/validations';
 import { requireAuth } from '@/lib/auth-utils';
-import { getTickets, calculateSLADeadlines } from '@/lib/services/ticket-service';
-import { autoAssignTicket } from '@/lib/services/assignment-service';
-import { recordHistory } from '@/lib/services/history-service';
+import { getTickets, createTicket } from '@/lib/services/ticket-service';
+import { getCachedCategory } from '@/lib/services/reference-data-service';
+import { sendTicketCreatedNotification } from '@/lib/services/notification-service';
+import { eq } from 'drizzle-orm';
+
+/**
+ * Email the agent a new ticket was assigned to
+ */
+async function notifyAssignedAgent(ticket: Ticket, customerName: string) {
+  if (!ticket.agentId) return;
+
+  const [agent] = await db
+    .select({ email: users.email })
+    .from(users)
+    .where(eq(users.id, ticket.agentId))
+    .limit(1);
+
+  if (!agent) return;
+
+  const category = ticket.categoryId ? await getCachedCategory(ticket.categoryId) : null;
+
+  await sendTicketCreatedNotification({
+    ticketId: ticket.id,
+    ticketTitle: ticket.title,
+    customerName,
+    priority: ticket.priority,
+    category: category?.name || '미분류',
+    agentEmail: agent.email,
+  });
+}
 
 /**
  * GET /api/tickets
  * Get tickets list with filters
+ * includeArchived=true also searches archived tickets
  */
 export async function GET(request: NextRequest) {
   try {
@@ -25,6 +54,7 @@ export async function GET(request: NextRequest) {
       agentId: searchParams.get('agentId') || undefined,
       customerId: searchParams.get('customerId') || undefined,
       search: searchParams.get('search') || undefined,
+      includeArchived: searchParams.get('includeArchived') === 'true',
       page: parseInt(searchParams.get('page') || '1'),
       pageSize: parseInt(searchParams.get('pageSize') || '10'),
     };
@@ -62,45 +92,11 @@ export async function POST(request: NextRequest) {
     const body = await request.json();
     const validated = ticketCreateSchema.parse(body);
 
-    // Calculate SLA deadlines
-    const slaDeadlines = calculateSLADeadlines();
-
-    // Create ticket
-    const [newTicket] = await db
-      .insert(tickets)
-      .values({
-        title: validated.title,
-        content: validated.content,
-        priority: validated.priority,
-        categoryId: validated.categoryId || null,
-        customerId: user.id,
-        status: 'open',
-        ...slaDeadlines,
-      })
-      .returning();
-
-    // Auto-assign to an available agent
-    const assignedAgentId = await autoAssignTicket(newTicket.id);
-
-    if (assignedAgentId) {
-      // Record assignment in history
-      await recordHistory({
-        ticketId: newTicket.id,
-        userId: user.id,
-        field: 'agent',
-        oldValue: null,
-        newValue: assignedAgentId,
-      });
-    }
+    // Insert, auto-assign and record history in one transaction
+    const newTicket = await createTicket(validated, user.id);
 
-    // Record ticket creation in history
-    await recordHistory({
-      ticketId: newTicket.id,
-      userId: user.id,
-      field: 'status',
-      oldValue: null,
-      newValue: 'open',
-    });
+    // Notify the assigned agent once the response has been sent
+    after(() => notifyAssignedAgent(newTicket, user.name));
 
     return NextResponse.json(
       {
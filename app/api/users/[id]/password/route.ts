@@ -1,5 +1,5 @@
 import { NextResponse } from "next/server";
-import bcrypt from "bcryptjs";
+import { hashPassword, verifyPassword } from "@/lib/password";
 import { db } from "@/lib/db";
 import { users } from "@/lib/db/schema";
 import { requireAuth } from "@/lib/auth-utils";
@@ -51,7 +51,7 @@ export async function PATCH(
     }
 
     // Verify current password
-    const isValidPassword = await bcrypt.compare(currentPassword, user.passwordHash);
+    const isValidPassword = await verifyPassword(currentPassword, user.passwordHash);
     if (!isValidPassword) {
       return NextResponse.json(
         { error: "현재 비밀번호가 올바르지 않습니다" },
@@ -60,7 +60,7 @@ export async function PATCH(
     }
 
     // Hash new password
-    const newPasswordHash = await bcrypt.hash(newPassword, 10);
+    const newPasswordHash = await hashPassword(newPassword);
 
     // Update password
     await db
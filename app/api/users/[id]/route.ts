@@ -1,8 +1,8 @@
 import { NextResponse } from "next/server";
-import bcrypt from "bcryptjs";
 import { db } from "@/lib/db";
 import { users } from "@/lib/db/schema";
 import { requireAdmin } from "@/lib/auth-utils";
+import { invalidateReferenceData } from "@/lib/services/reference-data-service";
 import { userUpdateSchema } from "@/lib/validations";
 import { eq } from "drizzle-orm";
 
@@ -108,6 +108,9 @@ export async function PATCH(
         updatedAt: users.updatedAt,
       });
 
+    // Name or role changes can affect the manager roster
+    await invalidateReferenceData("managers");
+
     return NextResponse.json({
       success: true,
       data: updatedUser,
@@ -154,6 +157,10 @@ export async function DELETE(
     // Delete user
     await db.delete(users).where(eq(users.id, id));
 
+    if (existingUser.role === "manager" || existingUser.role === "admin") {
+      await invalidateReferenceData("managers");
+    }
+
     return NextResponse.json({
       success: true,
       message: "사용자가 삭제되었습니다",
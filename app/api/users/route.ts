@@ -1,8 +1,9 @@
 import { NextResponse } from "next/server";
-import bcrypt from "bcryptjs";
+import { hashPassword } from "@/lib/password";
 import { db } from "@/lib/db";
 import { users } from "@/lib/db/schema";
 import { requireAdmin } from "@/lib/auth-utils";
+import { invalidateReferenceData } from "@/lib/services/reference-data-service";
 import { userCreateSchema } from "@/lib/validations";
 import { eq, or, ilike, sql, and } from "drizzle-orm";
 
@@ -112,7 +113,7 @@ export async function POST(request: Request) {
     }
 
     // Hash password
-    const passwordHash = await bcrypt.hash(password, 10);
+    const passwordHash = await hashPassword(password);
 
     // Create user
     const [newUser] = await db
@@ -134,6 +135,10 @@ export async function POST(request: Request) {
         updatedAt: users.updatedAt,
       });
 
+    if (role === "manager" || role === "admin") {
+      await invalidateReferenceData("managers");
+    }
+
     return NextResponse.json(
       {
         success: true,
@@ -21,6 +21,7 @@ interface AIResponseResult {
   response: string;
   usedKB: boolean;
   kbEntriesUsed: number;
+  promptTokens?: number;
 }
 
 interface AIResponsePanelProps {
@@ -155,6 +156,11 @@ export function AIResponsePanel({
                   지식베이스 참조 ({aiResponse.kbEntriesUsed}개)
                 </Badge>
               )}
+              {aiResponse.promptTokens !== undefined && (
+                <span className="text-xs text-muted-foreground">
+                  프롬프트 {aiResponse.promptTokens.toLocaleString()} 토큰
+                </span>
+              )}
             </div>
 
             {/* Response Text */}
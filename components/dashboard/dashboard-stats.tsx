@@ -1,20 +1,47 @@
 'use client';
 
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useMemo } from 'react';
 import { StatCard } from './stat-card';
 import { Ticket, Clock, CheckCircle, XCircle } from 'lucide-react';
 import { toast } from 'sonner';
-import type { DashboardStats } from '@/lib/types';
+import { useTicketEvents } from '@/hooks/use-ticket-events';
+import type { DashboardStats, TicketEvent, TicketStatus } from '@/lib/types';
+
+// Status of every visible ticket; the counts are derived from it
+type TicketStatuses = Map<string, TicketStatus>;
+
+function applyTicketEvent(statuses: TicketStatuses, event: TicketEvent): TicketStatuses {
+  switch (event.type) {
+    case 'ticket.created':
+    case 'ticket.assigned':
+      return new Map(statuses).set(event.ticket.id, event.ticket.status);
+    case 'ticket.status_changed':
+      return new Map(statuses).set(event.ticketId, event.status);
+    case 'ticket.removed': {
+      const next = new Map(statuses);
+      next.delete(event.ticketId);
+      return next;
+    }
+    default:
+      return statuses;
+  }
+}
+
+function countStatuses(statuses: TicketStatuses): DashboardStats {
+  const values = Array.from(statuses.values());
+  return {
+    totalTickets: values.length,
+    openTickets: values.filter((status) => status === 'open').length,
+    inProgressTickets: values.filter((status) => status === 'in_progress').length,
+    resolvedTickets: values.filter((status) => status === 'resolved').length,
+    closedTickets: values.filter((status) => status === 'closed').length,
+  };
+}
 
 export function DashboardStats() {
-  const [stats, setStats] = useState<DashboardStats>({
-    totalTickets: 0,
-    openTickets: 0,
-    inProgressTickets: 0,
-    resolvedTickets: 0,
-    closedTickets: 0,
-  });
+  const [statuses, setStatuses] = useState<TicketStatuses>(new Map());
   const [isLoading, setIsLoading] = useState(true);
+  const stats = useMemo(() => countStatuses(statuses), [statuses]);
 
   const loadStats = useCallback(async () => {
       try {
@@ -23,15 +50,8 @@ export function DashboardStats() {
         const result = await response.json();
 
         if (result.success) {
-          const tickets = result.data as Array<{ status: string }>;
-          const newStats: DashboardStats = {
-            totalTickets: tickets.length,
-            openTickets: tickets.filter((t) => t.status === 'open').length,
-            inProgressTickets: tickets.filter((t) => t.status === 'in_progress').length,
-            resolvedTickets: tickets.filter((t) => t.status === 'resolved').length,
-            closedTickets: tickets.filter((t) => t.status === 'closed').length,
-          };
-          setStats(newStats);
+          const tickets = result.data as Array<{ id: string; status: TicketStatus }>;
+          setStatuses(new Map(tickets.map((t) => [t.id, t.status])));
         }
       } catch (error) {
         console.error('Error loading stats:', error);
@@ -45,6 +65,12 @@ export function DashboardStats() {
     loadStats();
   }, [loadStats]);
 
+  // Keep the counts current without reloading the ticket list
+  useTicketEvents(
+    (event) => setStatuses((current) => applyTicketEvent(current, event)),
+    loadStats
+  );
+
   if (isLoading) {
     return (
       <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-4">
@@ -9,32 +9,66 @@ import { ArrowRight } from 'lucide-react';
 import { formatDistanceToNow } from 'date-fns';
 import { ko } from 'date-fns/locale';
 import { toast } from 'sonner';
-import type { TicketWithRelations } from '@/lib/types';
+import { useTicketEvents } from '@/hooks/use-ticket-events';
+import type { TicketEvent, TicketWithRelations } from '@/lib/types';
+
+const RECENT_COUNT = 5;
+
+/**
+ * Patch the newest-first list with a real-time event
+ */
+function applyTicketEvent(tickets: TicketWithRelations[], event: TicketEvent) {
+  switch (event.type) {
+    case 'ticket.created':
+    case 'ticket.assigned': {
+      const { ticket } = event;
+      if (tickets.some((t) => t.id === ticket.id)) {
+        return tickets.map((t) => (t.id === ticket.id ? ticket : t));
+      }
+      return [...tickets, ticket]
+        .sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime())
+        .slice(0, RECENT_COUNT);
+    }
+    case 'ticket.status_changed':
+      return tickets.map((t) =>
+        t.id === event.ticketId ? { ...t, status: event.status } : t
+      );
+    case 'ticket.removed':
+      return tickets.filter((t) => t.id !== event.ticketId);
+    default:
+      return tickets;
+  }
+}
 
 export function RecentTickets() {
   const [tickets, setTickets] = useState<TicketWithRelations[]>([]);
   const [isLoading, setIsLoading] = useState(true);
 
-  useEffect(() => {
-    const loadTickets = async () => {
-      try {
-        const response = await fetch('/api/tickets?pageSize=5');
-        const result = await response.json();
+  const loadTickets = async () => {
+    try {
+      const response = await fetch(`/api/tickets?pageSize=${RECENT_COUNT}`);
+      const result = await response.json();
 
-        if (result.success) {
-          setTickets(result.data);
-        }
-      } catch (error) {
-        console.error('Error loading tickets:', error);
-        toast.error('티켓을 불러오는데 실패했습니다');
-      } finally {
-        setIsLoading(false);
+      if (result.success) {
+        setTickets(result.data);
       }
-    };
+    } catch (error) {
+      console.error('Error loading tickets:', error);
+      toast.error('티켓을 불러오는데 실패했습니다');
+    } finally {
+      setIsLoading(false);
+    }
+  };
 
+  useEffect(() => {
     loadTickets();
   }, []);
 
+  useTicketEvents(
+    (event) => setTickets((current) => applyTicketEvent(current, event)),
+    loadTickets
+  );
+
   if (isLoading) {
     return (
       <Card>
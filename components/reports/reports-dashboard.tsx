@@ -10,7 +10,8 @@ import { TicketChart } from "./ticket-chart";
 import { Skeleton } from "@/components/ui/skeleton";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Alert, AlertDescription } from "@/components/ui/alert";
-import { AlertCircle } from "lucide-react";
+import { AlertCircle, Download } from "lucide-react";
+import { Button } from "@/components/ui/button";
 
 interface OverviewData {
   total: number;
@@ -141,10 +142,12 @@ export function ReportsDashboard() {
         endDate: format(dateRange.to, "yyyy-MM-dd"),
       });
 
+      // Revalidate cached responses with their ETag; unchanged reports come
+      // back as 304 and are served from the browser cache
       const [overviewRes, satisfactionRes, slaRes] = await Promise.all([
-        fetch(`/api/reports/overview?${params}`),
-        fetch(`/api/reports/satisfaction?${params}`),
-        fetch(`/api/reports/sla?${params}`),
+        fetch(`/api/reports/overview?${params}`, { cache: "no-cache" }),
+        fetch(`/api/reports/satisfaction?${params}`, { cache: "no-cache" }),
+        fetch(`/api/reports/sla?${params}`, { cache: "no-cache" }),
       ]);
 
       if (!overviewRes.ok || !satisfactionRes.ok || !slaRes.ok) {
@@ -198,7 +201,25 @@ export function ReportsDashboard() {
       {/* Date Range Picker */}
       <div className="flex items-center justify-between">
         <h2 className="text-2xl font-bold tracking-tight">보고서</h2>
-        <DateRangePicker value={dateRange} onChange={setDateRange} />
+        <div className="flex items-center gap-2">
+          {dateRange?.from && dateRange?.to && (
+            <Button variant="outline" asChild>
+              {/* Raw tickets in the range, streamed by the server */}
+              <a
+                href={`/api/reports/export?${new URLSearchParams({
+                  startDate: format(dateRange.from, "yyyy-MM-dd"),
+                  endDate: format(dateRange.to, "yyyy-MM-dd"),
+                  format: "csv",
+                })}`}
+                download
+              >
+                <Download className="mr-2 h-4 w-4" />
+                CSV 내보내기
+              </a>
+            </Button>
+          )}
+          <DateRangePicker value={dateRange} onChange={setDateRange} />
+        </div>
       </div>
 
       {/* Stats Overview */}
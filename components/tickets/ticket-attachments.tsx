@@ -147,7 +147,26 @@ export function TicketAttachments({ ticketId, canDelete = false }: TicketAttachm
               <CardContent className="py-4">
                 <div className="flex items-center justify-between">
                   <div className="flex items-center gap-3">
-                    <Paperclip className="h-4 w-4 text-gray-400" />
+                    {attachment.mimeType.startsWith('image/') ? (
+                      <a
+                        href={`/api/tickets/${ticketId}/attachments/${attachment.id}/thumbnail?size=preview`}
+                        target="_blank"
+                        rel="noopener noreferrer"
+                      >
+                        {/* eslint-disable-next-line @next/next/no-img-element */}
+                        <img
+                          src={`/api/tickets/${ticketId}/attachments/${attachment.id}/thumbnail?size=thumb`}
+                          alt={attachment.fileName}
+                          width={48}
+                          height={48}
+                          loading="lazy"
+                          decoding="async"
+                          className="h-12 w-12 rounded object-cover border"
+                        />
+                      </a>
+                    ) : (
+                      <Paperclip className="h-4 w-4 text-gray-400" />
+                    )}
                     <div>
                       <p className="font-medium">{attachment.fileName}</p>
                       <p className="text-sm text-gray-500">
@@ -15,16 +15,38 @@ import { toast } from 'sonner';
 import { formatDistanceToNow } from 'date-fns';
 import { ko } from 'date-fns/locale';
 import { Lock } from 'lucide-react';
+import { useTicketEvents } from '@/hooks/use-ticket-events';
 import type { CommentWithAuthor } from '@/lib/types';
 
+interface CommentThread {
+  comments: CommentWithAuthor[];
+  total: number;
+}
+
+/**
+ * Append a comment unless it is already shown (own comments arrive twice:
+ * in the POST response and as a real-time event)
+ */
+function appendComment(thread: CommentThread, comment: CommentWithAuthor): CommentThread {
+  if (thread.comments.some((c) => c.id === comment.id)) {
+    return thread;
+  }
+  return { comments: [...thread.comments, comment], total: thread.total + 1 };
+}
+
 interface TicketCommentsProps {
   ticketId: string;
   userRole: string;
 }
 
 export function TicketComments({ ticketId, userRole }: TicketCommentsProps) {
-  const [comments, setComments] = useState<CommentWithAuthor[]>([]);
+  const [{ comments, total }, setThread] = useState<CommentThread>({
+    comments: [],
+    total: 0,
+  });
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingOlder, setIsLoadingOlder] = useState(false);
   const [isSubmitting, setIsSubmitting] = useState(false);
 
   const {
@@ -45,13 +67,18 @@ export function TicketComments({ ticketId, userRole }: TicketCommentsProps) {
   const isInternal = watch('isInternal');
   const canCreateInternalNotes = ['agent', 'manager', 'admin'].includes(userRole);
 
+  // Loads the newest page; older pages are prepended on demand
   const loadComments = async () => {
     try {
       const response = await fetch(`/api/tickets/${ticketId}/comments`);
       const result = await response.json();
 
       if (result.success) {
-        setComments(result.data);
+        setThread({
+          comments: result.data,
+          total: result.pagination.total ?? result.data.length,
+        });
+        setNextCursor(result.pagination.nextCursor);
       } else {
         throw new Error(result.error);
       }
@@ -63,11 +90,45 @@ export function TicketComments({ ticketId, userRole }: TicketCommentsProps) {
     }
   };
 
+  const loadOlderComments = async () => {
+    if (!nextCursor) return;
+    setIsLoadingOlder(true);
+
+    try {
+      const response = await fetch(
+        `/api/tickets/${ticketId}/comments?before=${nextCursor}`
+      );
+      const result = await response.json();
+
+      if (result.success) {
+        setThread((current) => ({
+          ...current,
+          comments: [...result.data, ...current.comments],
+        }));
+        setNextCursor(result.pagination.nextCursor);
+      } else {
+        throw new Error(result.error);
+      }
+    } catch (error) {
+      console.error('Error loading older comments:', error);
+      toast.error('댓글을 불러오는데 실패했습니다');
+    } finally {
+      setIsLoadingOlder(false);
+    }
+  };
+
   useEffect(() => {
     loadComments();
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [ticketId]);
 
+  // New comments from others arrive as real-time events
+  useTicketEvents((event) => {
+    if (event.type === 'comment.added' && event.ticketId === ticketId) {
+      setThread((current) => appendComment(current, event.comment));
+    }
+  }, loadComments);
+
   const onSubmit = async (data: CommentCreateInput) => {
     setIsSubmitting(true);
 
@@ -86,7 +147,7 @@ export function TicketComments({ ticketId, userRole }: TicketCommentsProps) {
 
       toast.success('댓글이 추가되었습니다');
       reset();
-      loadComments();
+      setThread((current) => appendComment(current, result.data));
     } catch (error) {
       console.error('Error creating comment:', error);
       toast.error(
@@ -100,7 +161,7 @@ export function TicketComments({ ticketId, userRole }: TicketCommentsProps) {
   return (
     <div className="space-y-6">
       <div className="space-y-4">
-        <h3 className="text-lg font-semibold">댓글 ({comments.length})</h3>
+        <h3 className="text-lg font-semibold">댓글 ({total})</h3>
 
         {comments.length === 0 ? (
           <Card>
@@ -110,6 +171,16 @@ export function TicketComments({ ticketId, userRole }: TicketCommentsProps) {
           </Card>
         ) : (
           <div className="space-y-4">
+            {nextCursor && (
+              <Button
+                variant="outline"
+                className="w-full"
+                onClick={loadOlderComments}
+                disabled={isLoadingOlder}
+              >
+                {isLoadingOlder ? '불러오는 중...' : '이전 댓글 더 보기'}
+              </Button>
+            )}
             {comments.map((comment) => (
               <Card
                 key={comment.id}
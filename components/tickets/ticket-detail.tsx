@@ -38,7 +38,9 @@ export function TicketDetail({ ticket: initialTicket, userRole, canReopenTicket:
   const [isUpdating, setIsUpdating] = useState(false);
   const [commentDraft, setCommentDraft] = useState('');
 
-  const canChangeStatus = ['agent', 'manager', 'admin'].includes(userRole);
+  // Archived tickets are read-only
+  const canChangeStatus =
+    !ticket.isArchived && ['agent', 'manager', 'admin'].includes(userRole);
   const isAgent = ['agent', 'manager', 'admin'].includes(userRole);
 
   const handleStatusChange = async (newStatus: string) => {
@@ -116,6 +118,11 @@ export function TicketDetail({ ticket: initialTicket, userRole, canReopenTicket:
                   {ticket.sentiment && (
                     <SentimentBadge sentiment={ticket.sentiment as SentimentType} />
                   )}
+                  {ticket.isArchived && (
+                    <span className="text-xs px-2 py-1 bg-gray-100 text-gray-600 rounded">
+                      보관됨
+                    </span>
+                  )}
                 </div>
                 <CardTitle className="text-2xl">{ticket.title}</CardTitle>
               </div>
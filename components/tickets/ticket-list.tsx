@@ -7,15 +7,111 @@ import { Pagination } from '@/components/common/pagination';
 import { EmptyState } from '@/components/common/empty-state';
 import { Loading } from '@/components/common/loading';
 import { toast } from 'sonner';
-import type { TicketWithRelations, TicketFilters as Filters } from '@/lib/types';
+import { useTicketEvents } from '@/hooks/use-ticket-events';
+import type {
+  TicketEvent,
+  TicketWithRelations,
+  TicketFilters as Filters,
+} from '@/lib/types';
+
+const PAGE_SIZE = 10;
+
+interface TicketPage {
+  tickets: TicketWithRelations[];
+  total: number;
+}
+
+function matchesFilters(ticket: TicketWithRelations, filters: Filters) {
+  return (
+    !filters.search &&
+    (!filters.status || ticket.status === filters.status) &&
+    (!filters.priority || ticket.priority === filters.priority) &&
+    (!filters.categoryId || ticket.categoryId === filters.categoryId)
+  );
+}
+
+/**
+ * Insert a ticket into a newest-first page if it falls within the page
+ */
+function insertByCreatedAt(tickets: TicketWithRelations[], ticket: TicketWithRelations) {
+  const createdAt = new Date(ticket.createdAt).getTime();
+  const index = tickets.findIndex((t) => new Date(t.createdAt).getTime() < createdAt);
+
+  if (index === -1) {
+    return tickets.length < PAGE_SIZE ? [...tickets, ticket] : tickets;
+  }
+  return [...tickets.slice(0, index), ticket, ...tickets.slice(index)].slice(0, PAGE_SIZE);
+}
+
+/**
+ * Patch the loaded page with a real-time event
+ */
+function applyTicketEvent(
+  current: TicketPage,
+  event: TicketEvent,
+  page: number,
+  filters: Filters
+): TicketPage {
+  const { tickets, total } = current;
+
+  switch (event.type) {
+    case 'ticket.created':
+    case 'ticket.assigned': {
+      const { ticket } = event;
+      const isNew = event.type === 'ticket.created' || event.added;
+
+      if (tickets.some((t) => t.id === ticket.id)) {
+        return { tickets: tickets.map((t) => (t.id === ticket.id ? ticket : t)), total };
+      }
+      if (!isNew || !matchesFilters(ticket, filters)) {
+        return current;
+      }
+      // Only the first page can be patched without knowing its neighbours
+      return {
+        tickets: page === 1 ? insertByCreatedAt(tickets, ticket) : tickets,
+        total: total + 1,
+      };
+    }
+
+    case 'ticket.status_changed': {
+      if (!tickets.some((t) => t.id === event.ticketId)) {
+        return current;
+      }
+      if (filters.status && filters.status !== event.status) {
+        return { tickets: tickets.filter((t) => t.id !== event.ticketId), total: total - 1 };
+      }
+      return {
+        tickets: tickets.map((t) =>
+          t.id === event.ticketId ? { ...t, status: event.status } : t
+        ),
+        total,
+      };
+    }
+
+    case 'comment.added':
+      return {
+        tickets: tickets.map((t) =>
+          t.id === event.ticketId
+            ? { ...t, commentsCount: (t.commentsCount || 0) + 1 }
+            : t
+        ),
+        total,
+      };
+
+    case 'ticket.removed':
+      if (!tickets.some((t) => t.id === event.ticketId)) {
+        return current;
+      }
+      return { tickets: tickets.filter((t) => t.id !== event.ticketId), total: total - 1 };
+  }
+}
 
 export function TicketList() {
-  const [tickets, setTickets] = useState<TicketWithRelations[]>([]);
+  const [{ tickets, total }, setTicketPage] = useState<TicketPage>({ tickets: [], total: 0 });
   const [isLoading, setIsLoading] = useState(true);
   const [page, setPage] = useState(1);
-  const [totalPages, setTotalPages] = useState(1);
-  const [total, setTotal] = useState(0);
   const [filters, setFilters] = useState<Filters>({});
+  const totalPages = Math.ceil(total / PAGE_SIZE);
 
   const loadTickets = useCallback(async () => {
     setIsLoading(true);
@@ -23,7 +119,7 @@ export function TicketList() {
     try {
       const params = new URLSearchParams({
         page: page.toString(),
-        pageSize: '10',
+        pageSize: PAGE_SIZE.toString(),
         ...(filters.status ? { status: filters.status } : {}),
         ...(filters.priority ? { priority: filters.priority } : {}),
         ...(filters.categoryId ? { categoryId: filters.categoryId } : {}),
@@ -34,9 +130,7 @@ export function TicketList() {
       const result = await response.json();
 
       if (result.success) {
-        setTickets(result.data);
-        setTotalPages(result.totalPages);
-        setTotal(result.total);
+        setTicketPage({ tickets: result.data, total: result.total });
       } else {
         throw new Error(result.error);
       }
@@ -52,6 +146,12 @@ export function TicketList() {
     loadTickets();
   }, [loadTickets]);
 
+  // Apply real-time changes instead of refetching; resync after a reconnect
+  useTicketEvents(
+    (event) => setTicketPage((current) => applyTicketEvent(current, event, page, filters)),
+    loadTickets
+  );
+
   const handleFilterChange = useCallback((newFilters: Filters) => {
     setFilters(newFilters);
     setPage(1); // Reset to first page when filters change
@@ -116,7 +216,7 @@ export function TicketList() {
             <Pagination
               currentPage={page}
               totalPages={totalPages}
-              pageSize={10}
+              pageSize={PAGE_SIZE}
               totalItems={total}
               onPageChange={setPage}
             />
@@ -0,0 +1 @@
+CREATE INDEX "attachments_file_path_idx" ON "ticket_attachments" USING btree ("file_path");
\ No newline at end of file
@@ -0,0 +1,74 @@
+CREATE TABLE "report_rollup_dirty_days" (
+	"day" date PRIMARY KEY NOT NULL,
+	"marked_at" timestamp DEFAULT now() NOT NULL
+);
+--> statement-breakpoint
+CREATE TABLE "satisfaction_daily_stats" (
+	"day" date NOT NULL,
+	"category_id" uuid,
+	"agent_id" uuid,
+	"rating" integer NOT NULL,
+	"rating_count" integer DEFAULT 0 NOT NULL
+);
+--> statement-breakpoint
+CREATE TABLE "ticket_daily_stats" (
+	"day" date NOT NULL,
+	"category_id" uuid,
+	"agent_id" uuid,
+	"priority" "ticket_priority" NOT NULL,
+	"status" "ticket_status" NOT NULL,
+	"ticket_count" integer DEFAULT 0 NOT NULL,
+	"response_met" integer DEFAULT 0 NOT NULL,
+	"response_violated" integer DEFAULT 0 NOT NULL,
+	"resolve_met" integer DEFAULT 0 NOT NULL,
+	"resolve_violated" integer DEFAULT 0 NOT NULL,
+	"resolution_count" integer DEFAULT 0 NOT NULL,
+	"resolution_hours_sum" double precision DEFAULT 0 NOT NULL
+);
+--> statement-breakpoint
+CREATE INDEX "satisfaction_daily_stats_day_idx" ON "satisfaction_daily_stats" USING btree ("day");--> statement-breakpoint
+CREATE INDEX "ticket_daily_stats_day_idx" ON "ticket_daily_stats" USING btree ("day");--> statement-breakpoint
+-- Mark the creation day of a changed ticket (and the day of its rating) dirty
+CREATE OR REPLACE FUNCTION "mark_ticket_rollup_dirty"() RETURNS trigger AS $$
+BEGIN
+	IF TG_OP IN ('UPDATE', 'DELETE') THEN
+		INSERT INTO "report_rollup_dirty_days" ("day") VALUES (OLD."created_at"::date) ON CONFLICT DO NOTHING;
+	END IF;
+	IF TG_OP IN ('INSERT', 'UPDATE') THEN
+		INSERT INTO "report_rollup_dirty_days" ("day") VALUES (NEW."created_at"::date) ON CONFLICT DO NOTHING;
+	END IF;
+	IF TG_OP = 'UPDATE' AND (OLD."agent_id" IS DISTINCT FROM NEW."agent_id" OR OLD."category_id" IS DISTINCT FROM NEW."category_id") THEN
+		INSERT INTO "report_rollup_dirty_days" ("day")
+			SELECT "created_at"::date FROM "customer_satisfactions" WHERE "ticket_id" = NEW."id"
+			ON CONFLICT DO NOTHING;
+	END IF;
+	RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+--> statement-breakpoint
+CREATE TRIGGER "tickets_rollup_dirty"
+	AFTER INSERT OR DELETE OR UPDATE OF "status", "priority", "category_id", "agent_id", "resolved_at", "sla_response_met", "sla_resolve_met", "created_at"
+	ON "tickets" FOR EACH ROW EXECUTE FUNCTION "mark_ticket_rollup_dirty"();
+--> statement-breakpoint
+CREATE OR REPLACE FUNCTION "mark_satisfaction_rollup_dirty"() RETURNS trigger AS $$
+BEGIN
+	IF TG_OP IN ('UPDATE', 'DELETE') THEN
+		INSERT INTO "report_rollup_dirty_days" ("day") VALUES (OLD."created_at"::date) ON CONFLICT DO NOTHING;
+	END IF;
+	IF TG_OP IN ('INSERT', 'UPDATE') THEN
+		INSERT INTO "report_rollup_dirty_days" ("day") VALUES (NEW."created_at"::date) ON CONFLICT DO NOTHING;
+	END IF;
+	RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+--> statement-breakpoint
+CREATE TRIGGER "customer_satisfactions_rollup_dirty"
+	AFTER INSERT OR DELETE OR UPDATE
+	ON "customer_satisfactions" FOR EACH ROW EXECUTE FUNCTION "mark_satisfaction_rollup_dirty"();
+--> statement-breakpoint
+-- Backfill: every existing day is built by the first rollup refresh
+INSERT INTO "report_rollup_dirty_days" ("day")
+	SELECT "created_at"::date FROM "tickets"
+	UNION
+	SELECT "created_at"::date FROM "customer_satisfactions"
+	ON CONFLICT DO NOTHING;
\ No newline at end of file
@@ -0,0 +1,2 @@
+CREATE INDEX "comments_ticket_created_at_idx" ON "ticket_comments" USING btree ("ticket_id","created_at");--> statement-breakpoint
+DROP INDEX "comments_ticket_idx";
\ No newline at end of file
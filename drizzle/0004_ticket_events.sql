@@ -0,0 +1,59 @@
+-- Publish ticket changes on the "ticket_events" channel (delivered on commit)
+CREATE OR REPLACE FUNCTION "notify_ticket_event"() RETURNS trigger AS $$
+BEGIN
+	IF TG_OP = 'INSERT' THEN
+		PERFORM pg_notify('ticket_events', json_build_object(
+			'type', 'ticket.created',
+			'ticketId', NEW."id",
+			'customerId', NEW."customer_id",
+			'agentId', NEW."agent_id",
+			'status', NEW."status"
+		)::text);
+		RETURN NULL;
+	END IF;
+	IF OLD."agent_id" IS DISTINCT FROM NEW."agent_id" THEN
+		PERFORM pg_notify('ticket_events', json_build_object(
+			'type', 'ticket.assigned',
+			'ticketId', NEW."id",
+			'customerId', NEW."customer_id",
+			'agentId', NEW."agent_id",
+			'previousAgentId', OLD."agent_id",
+			'status', NEW."status"
+		)::text);
+	END IF;
+	IF OLD."status" IS DISTINCT FROM NEW."status" THEN
+		PERFORM pg_notify('ticket_events', json_build_object(
+			'type', 'ticket.status_changed',
+			'ticketId', NEW."id",
+			'customerId', NEW."customer_id",
+			'agentId', NEW."agent_id",
+			'status', NEW."status",
+			'previousStatus', OLD."status"
+		)::text);
+	END IF;
+	RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+--> statement-breakpoint
+CREATE TRIGGER "tickets_notify_event"
+	AFTER INSERT OR UPDATE OF "agent_id", "status"
+	ON "tickets" FOR EACH ROW EXECUTE FUNCTION "notify_ticket_event"();
+--> statement-breakpoint
+CREATE OR REPLACE FUNCTION "notify_comment_event"() RETURNS trigger AS $$
+BEGIN
+	PERFORM pg_notify('ticket_events', json_build_object(
+		'type', 'comment.added',
+		'ticketId', NEW."ticket_id",
+		'customerId', t."customer_id",
+		'agentId', t."agent_id",
+		'commentId', NEW."id",
+		'isInternal', NEW."is_internal"
+	)::text)
+	FROM "tickets" t WHERE t."id" = NEW."ticket_id";
+	RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+--> statement-breakpoint
+CREATE TRIGGER "ticket_comments_notify_event"
+	AFTER INSERT
+	ON "ticket_comments" FOR EACH ROW EXECUTE FUNCTION "notify_comment_event"();
\ No newline at end of file
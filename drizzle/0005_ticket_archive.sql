@@ -0,0 +1,47 @@
+ALTER TABLE "ticket_comments" DROP CONSTRAINT "ticket_comments_ticket_id_tickets_id_fk";
+--> statement-breakpoint
+ALTER TABLE "ticket_attachments" DROP CONSTRAINT "ticket_attachments_ticket_id_tickets_id_fk";
+--> statement-breakpoint
+ALTER TABLE "customer_satisfactions" DROP CONSTRAINT "customer_satisfactions_ticket_id_tickets_id_fk";
+--> statement-breakpoint
+CREATE TABLE "tickets_archive" (
+	"id" uuid PRIMARY KEY NOT NULL,
+	"title" varchar(200) NOT NULL,
+	"content" text NOT NULL,
+	"status" "ticket_status" NOT NULL,
+	"priority" "ticket_priority" NOT NULL,
+	"category_id" uuid,
+	"customer_id" uuid NOT NULL,
+	"agent_id" uuid,
+	"sentiment" varchar(20),
+	"sla_response_deadline" timestamp,
+	"sla_resolve_deadline" timestamp,
+	"sla_response_met" boolean,
+	"sla_resolve_met" boolean,
+	"created_at" timestamp NOT NULL,
+	"updated_at" timestamp NOT NULL,
+	"first_response_at" timestamp,
+	"resolved_at" timestamp,
+	"closed_at" timestamp,
+	"archived_at" timestamp DEFAULT now() NOT NULL
+);
+--> statement-breakpoint
+CREATE TABLE "ticket_histories_archive" (
+	"id" uuid PRIMARY KEY NOT NULL,
+	"ticket_id" uuid NOT NULL,
+	"user_id" uuid NOT NULL,
+	"field" varchar(50) NOT NULL,
+	"old_value" text,
+	"new_value" text,
+	"created_at" timestamp NOT NULL
+);
+--> statement-breakpoint
+CREATE INDEX "tickets_archive_customer_idx" ON "tickets_archive" USING btree ("customer_id");--> statement-breakpoint
+CREATE INDEX "tickets_archive_agent_idx" ON "tickets_archive" USING btree ("agent_id");--> statement-breakpoint
+CREATE INDEX "tickets_archive_created_at_idx" ON "tickets_archive" USING btree ("created_at");--> statement-breakpoint
+CREATE INDEX "histories_archive_ticket_idx" ON "ticket_histories_archive" USING btree ("ticket_id");--> statement-breakpoint
+-- Live and archived tickets for reads that must include both
+CREATE VIEW "all_tickets" AS
+	SELECT "id", "title", "content", "status", "priority", "category_id", "customer_id", "agent_id", "sentiment", "sla_response_deadline", "sla_resolve_deadline", "sla_response_met", "sla_resolve_met", "created_at", "updated_at", "first_response_at", "resolved_at", "closed_at", NULL::timestamp AS "archived_at" FROM "tickets"
+	UNION ALL
+	SELECT "id", "title", "content", "status", "priority", "category_id", "customer_id", "agent_id", "sentiment", "sla_response_deadline", "sla_resolve_deadline", "sla_response_met", "sla_resolve_met", "created_at", "updated_at", "first_response_at", "resolved_at", "closed_at", "archived_at" FROM "tickets_archive";
\ No newline at end of file
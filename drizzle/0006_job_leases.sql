@@ -0,0 +1,6 @@
+CREATE TABLE "job_leases" (
+	"name" varchar(100) PRIMARY KEY NOT NULL,
+	"holder" varchar(100) NOT NULL,
+	"acquired_at" timestamp DEFAULT now() NOT NULL,
+	"expires_at" timestamp NOT NULL
+);
@@ -0,0 +1,97 @@
+'use client';
+
+import { useEffect, useRef } from 'react';
+import type { TicketEvent } from '@/lib/types';
+
+interface Listener {
+  onEvent: (event: TicketEvent) => void;
+  onReconnect?: () => void;
+}
+
+// Refetch interval once the server has refused the stream
+const POLL_INTERVAL = 30 * 1000; // 30 seconds
+
+// One EventSource per tab, shared by every mounted component
+const listeners = new Set<Listener>();
+let source: EventSource | null = null;
+let interrupted = false;
+let pollTimer: ReturnType<typeof setInterval> | null = null;
+
+function connect() {
+  if (source) return;
+
+  source = new EventSource('/api/tickets/events');
+
+  source.onmessage = (message) => {
+    let event: TicketEvent;
+    try {
+      event = JSON.parse(message.data);
+    } catch {
+      return;
+    }
+    listeners.forEach((listener) => listener.onEvent(event));
+  };
+
+  // EventSource reconnects by itself; events sent in between are lost, so
+  // listeners get a chance to resync once the stream is back
+  source.onerror = () => {
+    interrupted = true;
+    // CLOSED means the server refused the stream (e.g. 503 when it cannot
+    // listen for events); EventSource won't retry, so poll instead
+    if (source?.readyState === EventSource.CLOSED && !pollTimer) {
+      pollTimer = setInterval(() => {
+        listeners.forEach((listener) => listener.onReconnect?.());
+      }, POLL_INTERVAL);
+    }
+  };
+  source.onopen = () => {
+    if (!interrupted) return;
+    interrupted = false;
+    listeners.forEach((listener) => listener.onReconnect?.());
+  };
+}
+
+function disconnect() {
+  source?.close();
+  source = null;
+  interrupted = false;
+  if (pollTimer) {
+    clearInterval(pollTimer);
+    pollTimer = null;
+  }
+}
+
+/**
+ * Receive real-time ticket events while the component is mounted
+ *
+ * `onReconnect` runs after the stream recovers from a dropped connection,
+ * and periodically if the server cannot stream events; use it to refetch
+ * state that may have missed events.
+ */
+export function useTicketEvents(
+  onEvent: (event: TicketEvent) => void,
+  onReconnect?: () => void
+) {
+  const handlers = useRef({ onEvent, onReconnect });
+
+  useEffect(() => {
+    handlers.current = { onEvent, onReconnect };
+  });
+
+  useEffect(() => {
+    const listener: Listener = {
+      onEvent: (event) => handlers.current.onEvent(event),
+      onReconnect: () => handlers.current.onReconnect?.(),
+    };
+
+    listeners.add(listener);
+    connect();
+
+    return () => {
+      listeners.delete(listener);
+      if (listeners.size === 0) {
+        disconnect();
+      }
+    };
+  }, []);
+}
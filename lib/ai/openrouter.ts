@@ -5,6 +5,8 @@
  * Handles authentication, error handling, and graceful degradation.
  */
 
+import { aiRequestDuration } from '@/lib/metrics';
+
 export interface Message {
   role: 'system' | 'user' | 'assistant';
   content: string;
@@ -46,6 +48,10 @@ export class OpenRouterError extends Error {
   }
 }
 
+// Overridable so load tests can point at a local stand-in server
+const OPENROUTER_BASE_URL =
+  process.env.OPENROUTER_BASE_URL || 'https://openrouter.ai/api/v1';
+
 /**
  * Check if OpenRouter API is configured and available
  */
@@ -85,9 +91,10 @@ export async function createChatCompletion(
   // Create abort controller for timeout
   const controller = new AbortController();
   const timeoutId = setTimeout(() => controller.abort(), timeout);
+  const stopTimer = aiRequestDuration.startTimer({ model });
 
   try {
-    const response = await fetch('https://openrouter.ai/api/v1/chat/completions', {
+    const response = await fetch(`${OPENROUTER_BASE_URL}/chat/completions`, {
       method: 'POST',
       headers: {
         'Authorization': `Bearer ${apiKey}`,
@@ -137,13 +144,24 @@ export async function createChatCompletion(
     }
 
     const data = await response.json();
+    stopTimer({ status: 'ok' });
     return data as ChatCompletionResponse;
 
   } catch (error) {
     clearTimeout(timeoutId);
 
+    const isTimeout = error instanceof Error && error.name === 'AbortError';
+    stopTimer({
+      status:
+        error instanceof OpenRouterError
+          ? error.code || 'API_ERROR'
+          : isTimeout
+            ? 'TIMEOUT'
+            : 'NETWORK_ERROR',
+    });
+
     // Handle abort/timeout
-    if (error instanceof Error && error.name === 'AbortError') {
+    if (isTimeout) {
       throw new OpenRouterError(
         'Request timeout - the API took too long to respond',
         408,
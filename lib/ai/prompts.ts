@@ -4,6 +4,8 @@
  * Defines system prompts and prompt building utilities for various AI tasks.
  */
 
+import type { Message } from './openrouter';
+
 export type SystemPromptRole =
   | 'customer-support'
   | 'category-classifier'
@@ -69,6 +71,140 @@ export function getSystemPrompt(role: SystemPromptRole): string {
   }
 }
 
+/**
+ * Estimate the number of tokens in a text
+ *
+ * Hangul syllables take roughly one token each, other text roughly four
+ * characters per token. Good enough for budgeting, not for billing.
+ */
+export function estimateTokens(text: string): number {
+  if (!text) return 0;
+
+  const hangul = (text.match(/[가-힣]/g) || []).length;
+  const other = text.replace(/[가-힣\s]/g, '').length;
+  const whitespace = text.length - hangul - other;
+
+  return Math.ceil(hangul + other / 4 + whitespace / 8);
+}
+
+/**
+ * Truncate text to an estimated token limit
+ *
+ * Keeps the beginning and the end of the text (error messages in pasted
+ * logs are usually at the end) and marks the omitted middle part.
+ */
+export function truncateToTokens(text: string, maxTokens: number): string {
+  const tokens = estimateTokens(text);
+  if (tokens <= maxTokens) {
+    return text;
+  }
+
+  const marker = '\n...(중략)...\n';
+  const charsPerToken = text.length / tokens;
+  const keepChars = Math.max(0, Math.floor((maxTokens - estimateTokens(marker)) * charsPerToken));
+  const headChars = Math.ceil(keepChars * 0.7);
+  const tailChars = keepChars - headChars;
+
+  return `${text.slice(0, headChars)}${marker}${tailChars > 0 ? text.slice(-tailChars) : ''}`;
+}
+
+// ============================================================================
+// Prompt Budget
+// ============================================================================
+
+export type PromptSection = 'system' | 'ticket' | 'knowledgeBase' | 'categories';
+
+/**
+ * Token budget per prompt section (estimated tokens)
+ */
+export interface PromptBudget {
+  total: number;
+  system: number;
+  ticket: number;
+  knowledgeBase: number;
+  categories: number;
+}
+
+export const DEFAULT_PROMPT_BUDGET: PromptBudget = {
+  total: 6000,
+  system: 1000,
+  ticket: 2500,
+  knowledgeBase: 1500,
+  categories: 500,
+};
+
+export interface BuiltPrompt {
+  messages: Message[];
+  estimatedTokens: number;
+  truncatedSections: PromptSection[];
+}
+
+/**
+ * Prompt builder that keeps every section within its token budget
+ *
+ * Sections are fitted one by one; `build` then enforces the total budget on
+ * the user message and reports the estimated token count of the prompt.
+ */
+export class PromptBuilder {
+  private truncated = new Set<PromptSection>();
+
+  constructor(private budget: PromptBudget = DEFAULT_PROMPT_BUDGET) {}
+
+  /**
+   * Fit free text (system prompt, ticket title/content) into a section budget
+   */
+  fit(section: PromptSection, text: string, maxTokens: number = this.budget[section]): string {
+    const fitted = truncateToTokens(text, maxTokens);
+    if (fitted !== text) {
+      this.truncated.add(section);
+    }
+    return fitted;
+  }
+
+  /**
+   * Fit ticket title and content into the ticket budget
+   *
+   * The title is small and kept as is; the content gets the rest.
+   */
+  ticket(title: string, content: string): { title: string; content: string } {
+    const titleTokens = estimateTokens(title);
+    return {
+      title,
+      content: this.fit('ticket', content, Math.max(this.budget.ticket - titleTokens, 0)),
+    };
+  }
+
+  knowledgeBase(entries: Array<{ title: string; content: string }>): string {
+    const context = buildKnowledgeBaseContext(entries, this.budget.knowledgeBase);
+    if (context !== buildKnowledgeBaseContext(entries, Infinity)) {
+      this.truncated.add('knowledgeBase');
+    }
+    return context;
+  }
+
+  categories(categories: Array<{ name: string; id: string }>): string {
+    const list = buildCategoryList(categories, this.budget.categories);
+    if (list !== buildCategoryList(categories, Infinity)) {
+      this.truncated.add('categories');
+    }
+    return list;
+  }
+
+  build(systemPrompt: string, userPrompt: string): BuiltPrompt {
+    const system = this.fit('system', systemPrompt);
+    const user = this.fit('ticket', userPrompt, Math.max(this.budget.total - estimateTokens(system), 0));
+
+    return {
+      messages: [
+        { role: 'system', content: system },
+        { role: 'user', content: user },
+      ],
+      estimatedTokens: estimateTokens(system) + estimateTokens(user),
+      truncatedSections: Array.from(this.truncated),
+    };
+  }
+}
+
 /**
  * Default template variables
  */
@@ -95,7 +231,7 @@ export function buildPromptWithTemplate(
   Object.entries(variables).forEach(([key, value]) => {
     if (value !== undefined) {
       const placeholder = new RegExp(`\\{${key}\\}`, 'g');
-      result = result.replace(placeholder, value);
+      result = result.replace(placeholder, () => value);
     }
   });
 
@@ -119,27 +255,66 @@ export const DEFAULT_ANSWER_TEMPLATE = `다음 고객 문의에 대한 답변을
 
 /**
  * Build knowledge base context for prompts
+ *
+ * Entries are taken in order until the token limit is reached; an entry
+ * that does not fit completely is truncated and the rest are dropped.
  */
 export function buildKnowledgeBaseContext(
-  knowledgeBaseEntries: Array<{ title: string; content: string }>
+  knowledgeBaseEntries: Array<{ title: string; content: string }>,
+  maxTokens: number = DEFAULT_PROMPT_BUDGET.knowledgeBase
 ): string {
   if (knowledgeBaseEntries.length === 0) {
     return '';
   }
 
-  const kbContent = knowledgeBaseEntries
-    .map((entry, index) => `[참고 자료 ${index + 1}] ${entry.title}\n${entry.content}`)
-    .join('\n\n');
+  const header = '참고 자료:';
+  let remaining = maxTokens - estimateTokens(header);
+  const blocks: string[] = [];
+
+  for (const [index, entry] of knowledgeBaseEntries.entries()) {
+    const block = `[참고 자료 ${index + 1}] ${entry.title}\n${entry.content}`;
+    const blockTokens = estimateTokens(block);
+
+    if (blockTokens <= remaining) {
+      blocks.push(block);
+      remaining -= blockTokens;
+      continue;
+    }
+
+    // Truncate the first entry that overflows if enough room is left
+    if (remaining > 50) {
+      blocks.push(truncateToTokens(block, remaining));
+    }
+    break;
+  }
+
+  if (blocks.length === 0) {
+    return '';
+  }
 
-  return `참고 자료:\n${kbContent}`;
+  return `${header}\n${blocks.join('\n\n')}`;
 }
 
 /**
  * Build category list for classification
+ *
+ * Categories are expected in display order; names beyond the token limit
+ * are left out.
  */
 export function buildCategoryList(
-  categories: Array<{ name: string; id: string }>
+  categories: Array<{ name: string; id: string }>,
+  maxTokens: number = DEFAULT_PROMPT_BUDGET.categories
 ): string {
-  const categoryNames = categories.map(c => c.name).join(', ');
-  return `다음 카테고리 중에서 선택하세요: ${categoryNames}`;
+  const prefix = '다음 카테고리 중에서 선택하세요: ';
+  let remaining = maxTokens - estimateTokens(prefix);
+  const names: string[] = [];
+
+  for (const category of categories) {
+    const nameTokens = estimateTokens(`${category.name}, `);
+    if (nameTokens > remaining) break;
+    names.push(category.name);
+    remaining -= nameTokens;
+  }
+
+  return `${prefix}${names.join(', ')}`;
 }
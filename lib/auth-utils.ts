@@ -1,14 +1,52 @@
+import { headers } from "next/headers";
 import { auth } from "./auth";
+import { SESSION_HEADER, verifySessionHeader } from "./session-header";
+import type { SessionUser } from "./session-header";
 import type { UserRole } from "./types";
 
+// Resolved user per request, keyed by the request's headers object
+const usersByRequest = new WeakMap<object, Promise<SessionUser | undefined>>();
+
 /**
- * Get current authenticated user session
+ * Resolve the user for the current request
+ *
+ * Uses the session verified by middleware when present, and decrypts the
+ * session JWT otherwise.
  */
-export async function getCurrentUser() {
+async function resolveUser(requestHeaders: Awaited<ReturnType<typeof headers>>): Promise<SessionUser | undefined> {
+  const forwarded = await verifySessionHeader(requestHeaders.get(SESSION_HEADER));
+  if (forwarded) {
+    return forwarded;
+  }
+
   const session = await auth();
   return session?.user;
 }
 
+/**
+ * Get current authenticated user session
+ *
+ * The result is computed once per request, so repeated calls from
+ * requireAuth/requireRole and services are free.
+ */
+export async function getCurrentUser(): Promise<SessionUser | undefined> {
+  let requestHeaders: Awaited<ReturnType<typeof headers>>;
+  try {
+    requestHeaders = await headers();
+  } catch {
+    // Outside a request scope (scripts, background jobs)
+    const session = await auth();
+    return session?.user;
+  }
+
+  let user = usersByRequest.get(requestHeaders);
+  if (!user) {
+    user = resolveUser(requestHeaders);
+    usersByRequest.set(requestHeaders, user);
+  }
+  return user;
+}
+
 /**
  * Get current user session or throw error if not authenticated
  */
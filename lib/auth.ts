@@ -1,9 +1,8 @@
 import NextAuth from "next-auth";
 import Credentials from "next-auth/providers/credentials";
-import bcrypt from "bcryptjs";
 import { db } from "./db";
 import { users } from "./db/schema";
-import { eq } from "drizzle-orm";
+import { and, eq } from "drizzle-orm";
 import { loginSchema } from "./validations";
 import type { UserRole } from "./types";
 
@@ -25,6 +24,25 @@ declare module "next-auth" {
   }
 }
 
+/**
+ * Replace a stored hash with one using the configured cost
+ *
+ * Only updates the row if the hash has not changed in the meantime.
+ */
+function rehashPassword(userId: string, oldHash: string, password: string) {
+  import("./password")
+    .then(({ hashPassword }) => hashPassword(password))
+    .then((passwordHash) =>
+      db
+        .update(users)
+        .set({ passwordHash })
+        .where(and(eq(users.id, userId), eq(users.passwordHash, oldHash)))
+    )
+    .catch((error) => {
+      console.error("Password rehash error:", error);
+    });
+}
+
 // JWT token extension is handled through the next-auth callbacks
 // No separate module augmentation needed for v5
 
@@ -56,12 +74,18 @@ export const { handlers, auth, signIn, signOut } = NextAuth({
             return null;
           }
 
-          // Verify password
-          const isValidPassword = await bcrypt.compare(password, user.passwordHash);
+          // Verify password (loaded lazily so that middleware does not pull in the worker pool)
+          const { verifyPassword, needsRehash } = await import("./password");
+          const isValidPassword = await verifyPassword(password, user.passwordHash);
           if (!isValidPassword) {
             return null;
           }
 
+          // Upgrade hashes made with an outdated cost without delaying login
+          if (needsRehash(user.passwordHash)) {
+            rehashPassword(user.id, user.passwordHash, password);
+          }
+
           // Return user object (without password hash)
           return {
             id: user.id,
@@ -89,6 +89,9 @@ export const FILE_TYPE_LABELS: Record<string, string> = {
 export const DEFAULT_PAGE_SIZE = 10;
 export const MAX_PAGE_SIZE = 100;
 
+// Upper bound for one bulk ticket operation (ids or filter matches)
+export const MAX_BULK_TICKETS = 500;
+
 // ============================================================================
 // SENTIMENT CONSTANTS
 // ============================================================================
@@ -0,0 +1,35 @@
+/**
+ * Cron Request Verification
+ *
+ * Middleware lets /api/cron/* through without a session, so every cron
+ * route must check `Authorization: Bearer <CRON_SECRET>` itself. Requests
+ * are refused when CRON_SECRET is not configured.
+ */
+
+import { NextResponse } from 'next/server';
+
+/**
+ * Check the cron secret on a request
+ *
+ * Returns the error response to send, or null when the request may run.
+ */
+export function verifyCronRequest(request: Request): NextResponse | null {
+  const cronSecret = process.env.CRON_SECRET;
+
+  if (!cronSecret) {
+    console.error('CRON_SECRET is not set; refusing cron request');
+    return NextResponse.json(
+      { error: 'Cron jobs are not configured' },
+      { status: 503 }
+    );
+  }
+
+  if (request.headers.get('authorization') !== `Bearer ${cronSecret}`) {
+    return NextResponse.json(
+      { error: 'Unauthorized' },
+      { status: 401 }
+    );
+  }
+
+  return null;
+}
@@ -1,6 +1,10 @@
 import { drizzle } from 'drizzle-orm/postgres-js';
+import type { PostgresJsDatabase } from 'drizzle-orm/postgres-js';
+import { sql } from 'drizzle-orm';
 import postgres from 'postgres';
+import type { Sql } from 'postgres';
 import * as schema from './schema';
+import { instrumentClient } from './instrumentation';
 
 // Next.js automatically loads .env.local in development
 // No need for dotenv in runtime (only needed for drizzle-kit CLI)
@@ -10,7 +14,165 @@ if (!process.env.DATABASE_URL) {
 
 const connectionString = process.env.DATABASE_URL;
 
-// Disable prefetch for better compatibility
-const client = postgres(connectionString, { prepare: false });
+// ============================================================================
+// Pool configuration
+// ============================================================================
 
-export const db = drizzle(client, { schema });
+function envInt(name: string, fallback: number): number {
+  const value = parseInt(process.env[name] || '', 10);
+  return Number.isFinite(value) && value >= 0 ? value : fallback;
+}
+
+/**
+ * Detect PgBouncer (or a compatible pooler) in transaction mode
+ *
+ * Named prepared statements are bound to a server connection, which a
+ * transaction-mode pooler does not keep for a client, so they must be off.
+ */
+export function isTransactionPooler(url: string): boolean {
+  if (process.env.DB_POOL_MODE) {
+    return process.env.DB_POOL_MODE === 'transaction';
+  }
+  try {
+    const parsed = new URL(url);
+    // pgbouncer=true is the Prisma/Supabase convention, 6543 the Supabase pooler port
+    return parsed.searchParams.get('pgbouncer') === 'true' || parsed.port === '6543';
+  } catch {
+    return false;
+  }
+}
+
+/**
+ * Prepared statements are on unless disabled or behind a transaction pooler
+ */
+function usePreparedStatements(url: string): boolean {
+  if (process.env.DB_PREPARE) {
+    return process.env.DB_PREPARE !== 'false';
+  }
+  return !isTransactionPooler(url);
+}
+
+function stripPoolerParams(url: string): string {
+  // postgres.js would pass unknown URL parameters to the server
+  try {
+    const parsed = new URL(url);
+    parsed.searchParams.delete('pgbouncer');
+    return parsed.toString();
+  } catch {
+    return url;
+  }
+}
+
+/**
+ * Create a postgres.js client
+ *
+ * The statement timeout bounds how long one query can hold a connection
+ * (ms, 0 = no limit). It is sent as a startup parameter, except behind a
+ * transaction pooler: PgBouncer rejects unknown startup parameters (or
+ * silently drops them via ignore_startup_parameters). There the timeout is
+ * applied with SET LOCAL at the start of every transaction (see
+ * `withTransactionTimeout`), and queries outside a transaction rely on a
+ * role-level default: ALTER ROLE <app_user> SET statement_timeout = '15s'.
+ */
+function createClient(url: string, options: { max: number; statementTimeout: number }) {
+  return postgres(stripPoolerParams(url), {
+    prepare: usePreparedStatements(url),
+    max: options.max,
+    idle_timeout: envInt('DB_IDLE_TIMEOUT', 20), // seconds
+    max_lifetime: envInt('DB_MAX_LIFETIME', 30 * 60), // seconds
+    connect_timeout: envInt('DB_CONNECT_TIMEOUT', 10), // seconds
+    connection: isTransactionPooler(url)
+      ? {}
+      : { statement_timeout: options.statementTimeout },
+  });
+}
+
+/**
+ * Behind a transaction pooler, start every transaction with
+ * SET LOCAL statement_timeout (it ends with the transaction, so the pooled
+ * server connection is left unchanged for the next client)
+ */
+function withTransactionTimeout<T extends PostgresJsDatabase<typeof schema>>(
+  database: T,
+  url: string,
+  statementTimeout: number
+): T {
+  if (!isTransactionPooler(url) || statementTimeout <= 0) {
+    return database;
+  }
+
+  const transaction = database.transaction.bind(database);
+  database.transaction = ((run, config) =>
+    transaction(async (tx) => {
+      await tx.execute(sql.raw(`set local statement_timeout = ${statementTimeout}`));
+      return run(tx);
+    }, config)) as T['transaction'];
+
+  return database;
+}
+
+// ============================================================================
+// Clients
+// ============================================================================
+
+const statementTimeout = envInt('DB_STATEMENT_TIMEOUT_MS', 15000);
+
+// Queries are timed and tagged for /api/metrics
+export const client = instrumentClient(
+  createClient(connectionString, {
+    max: envInt('DB_POOL_MAX', 10),
+    statementTimeout,
+  })
+);
+
+export const db = withTransactionTimeout(
+  drizzle(client, { schema }),
+  connectionString,
+  statementTimeout
+);
+
+// A transaction handle, for services that accept either `db` or `tx`
+export type Transaction = Parameters<Parameters<typeof db.transaction>[0]>[0];
+
+// Reporting queries use their own pool so that long aggregations cannot
+// starve request handling. DATABASE_READ_URL may point at a replica.
+const readConnectionString = process.env.DATABASE_READ_URL || connectionString;
+
+const reportStatementTimeout = envInt('DB_REPORT_STATEMENT_TIMEOUT_MS', 60000);
+
+export const readClient = instrumentClient(
+  createClient(readConnectionString, {
+    max: envInt('DB_READ_POOL_MAX', 5),
+    statementTimeout: reportStatementTimeout,
+  })
+);
+
+export const readDb = withTransactionTimeout(
+  drizzle(readClient, { schema }),
+  readConnectionString,
+  reportStatementTimeout
+);
+
+// LISTEN needs a session that stays on one server connection, which a
+// transaction pooler does not provide: behind one, the listen connection
+// goes to DATABASE_DIRECT_URL (Postgres itself). Without it there is no
+// listener; real-time events are off and caches rely on their TTLs.
+// NOTIFY is a plain query and works through the pooler.
+const listenConnectionString = isTransactionPooler(connectionString)
+  ? process.env.DATABASE_DIRECT_URL || null
+  : connectionString;
+
+export const listenClient: Sql | null =
+  listenConnectionString === connectionString
+    ? client
+    : listenConnectionString
+      ? createClient(listenConnectionString, { max: 1, statementTimeout: 0 })
+      : null;
+
+if (!listenClient) {
+  console.error(
+    'DATABASE_URL points at a transaction pooler and DATABASE_DIRECT_URL is not set: ' +
+      'LISTEN is unavailable, so real-time ticket events are disabled and ' +
+      'cache invalidation falls back to TTL expiry'
+  );
+}
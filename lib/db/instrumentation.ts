@@ -0,0 +1,178 @@
+/**
+ * Query Instrumentation
+ *
+ * Wraps the postgres.js client so that every query drizzle issues is timed
+ * and tagged with the API route, which middleware passes in a request
+ * header. Per-request query counts make N+1 patterns visible, and queries
+ * slower than DB_SLOW_QUERY_MS are logged.
+ *
+ * DB_QUERY_CALLERS=1 also labels queries with the calling service function,
+ * taken from a stack trace. That costs a stack capture per query and only
+ * resolves in unbundled builds (`next dev`), so it is off by default.
+ */
+
+import type { Sql } from 'postgres';
+import { headers } from 'next/headers';
+import { after } from 'next/server';
+import { dbQueryDuration, dbQueriesPerRequest, dbSlowQueries } from '../metrics';
+import { ROUTE_HEADER } from '../request-route';
+
+const SLOW_QUERY_MS = parseInt(process.env.DB_SLOW_QUERY_MS || '', 10) || 200;
+const TRACK_CALLERS = process.env.DB_QUERY_CALLERS === '1';
+
+// ============================================================================
+// Caller detection
+// ============================================================================
+
+const CALLER_FRAME = /at (?:async )?(?:Object\.)?([\w$.]+) \((?:[^)]*?)(lib\/services\/[\w-]+|lib\/[\w-]+|app\/api\/[^\s)]*?route)\.[jt]sx?/;
+
+/**
+ * Find the nearest application function on the stack (DB_QUERY_CALLERS=1)
+ *
+ * Relies on V8 async stack traces, so it is best effort.
+ */
+function getQueryCaller(): string | undefined {
+  if (!TRACK_CALLERS) return undefined;
+
+  const previousLimit = Error.stackTraceLimit;
+  Error.stackTraceLimit = 40;
+  const stack = new Error().stack || '';
+  Error.stackTraceLimit = previousLimit;
+
+  for (const line of stack.split('\n')) {
+    if (line.includes('node_modules') || line.includes('lib/db/instrumentation')) continue;
+    const match = CALLER_FRAME.exec(line);
+    if (match) {
+      return `${match[2].replace(/^.*\//, '')}.${match[1].replace(/^.*\./, '')}`;
+    }
+  }
+  return 'unknown';
+}
+
+// ============================================================================
+// Per-request query counts
+// ============================================================================
+
+type RequestHeaders = Awaited<ReturnType<typeof headers>>;
+
+// Query count per request, keyed by the request's headers object
+const requestCounts = new WeakMap<RequestHeaders, { route: string; count: number }>();
+
+async function getRequestHeaders(): Promise<RequestHeaders | null> {
+  try {
+    return await headers();
+  } catch {
+    return null; // Not inside a request (scripts, background work)
+  }
+}
+
+function countRequestQuery(requestHeaders: RequestHeaders, route: string): void {
+  const entry = requestCounts.get(requestHeaders);
+  if (entry) {
+    entry.count++;
+    return;
+  }
+
+  const created = { route, count: 1 };
+  requestCounts.set(requestHeaders, created);
+  try {
+    after(() => {
+      dbQueriesPerRequest.observe({ route: created.route }, created.count);
+    });
+  } catch {
+    // after() is unavailable in this context; the count is dropped
+  }
+}
+
+// ============================================================================
+// Client wrapper
+// ============================================================================
+
+async function recordQuery(caller: string | undefined, query: string, seconds: number, failed: boolean) {
+  const requestHeaders = await getRequestHeaders();
+  const route = requestHeaders?.get(ROUTE_HEADER) || 'none';
+  const labels = caller === undefined ? { route } : { route, caller };
+
+  dbQueryDuration.observe({ ...labels, status: failed ? 'error' : 'ok' }, seconds);
+
+  if (seconds * 1000 >= SLOW_QUERY_MS) {
+    dbSlowQueries.inc(labels);
+    console.warn(
+      `Slow query (${Math.round(seconds * 1000)}ms) in ${caller ?? 'query'} [${route}]: ${query.slice(0, 500)}`
+    );
+  }
+
+  if (requestHeaders) {
+    countRequestQuery(requestHeaders, route);
+  }
+}
+
+/**
+ * Time a postgres.js query without changing when it runs
+ *
+ * postgres.js queries are lazy promises that start on the first `then`, and
+ * drizzle may call `.values()` on them first, so timing hooks into `then`.
+ */
+function instrumentQuery<T extends PromiseLike<unknown>>(query: T, text: string): T {
+  const caller = getQueryCaller();
+  const originalThen = query.then.bind(query);
+  let recorded = false;
+
+  (query as { then: PromiseLike<unknown>['then'] }).then = (onFulfilled, onRejected) => {
+    const start = process.hrtime.bigint();
+    const finish = (failed: boolean) => {
+      if (recorded) return;
+      recorded = true;
+      void recordQuery(caller, text, Number(process.hrtime.bigint() - start) / 1e9, failed);
+    };
+
+    return originalThen(
+      (value) => {
+        finish(false);
+        return onFulfilled ? onFulfilled(value) : (value as never);
+      },
+      (error) => {
+        finish(true);
+        if (onRejected) return onRejected(error);
+        throw error;
+      }
+    );
+  };
+
+  return query;
+}
+
+/**
+ * Instrument a postgres.js client (and the clients it hands to transactions)
+ */
+export function instrumentClient<T extends Sql>(sql: T): T {
+  const unsafe = sql.unsafe.bind(sql);
+  sql.unsafe = ((query: string, ...rest: unknown[]) =>
+    instrumentQuery(
+      (unsafe as (query: string, ...rest: unknown[]) => PromiseLike<unknown>)(query, ...rest),
+      query
+    )) as T['unsafe'];
+
+  // Transaction clients are separate objects; instrument them as well
+  if (typeof sql.begin === 'function') {
+    const begin = sql.begin.bind(sql) as (...args: unknown[]) => Promise<unknown>;
+    sql.begin = ((...args: unknown[]) => {
+      const callback = args[args.length - 1] as (tx: Sql) => unknown;
+      const options = args.slice(0, -1);
+      return begin(...options, (tx: Sql) => callback(instrumentClient(tx)));
+    }) as T['begin'];
+  }
+
+  const savepoint = (sql as unknown as { savepoint?: (...args: unknown[]) => Promise<unknown> }).savepoint;
+  if (typeof savepoint === 'function') {
+    (sql as unknown as { savepoint: (...args: unknown[]) => Promise<unknown> }).savepoint = (
+      ...args: unknown[]
+    ) => {
+      const callback = args[args.length - 1] as (tx: Sql) => unknown;
+      const options = args.slice(0, -1);
+      return savepoint.call(sql, ...options, (tx: Sql) => callback(instrumentClient(tx)));
+    };
+  }
+
+  return sql;
+}
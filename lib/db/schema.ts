@@ -7,7 +7,10 @@ import {
   timestamp,
   pgEnum,
   integer,
-  index
+  index,
+  date,
+  doublePrecision,
+  pgView
 } from 'drizzle-orm/pg-core';
 
 // ============================================================================
@@ -89,14 +92,16 @@ export const tickets = pgTable('tickets', {
 // 4. Ticket Comments
 export const ticketComments = pgTable('ticket_comments', {
   id: uuid('id').defaultRandom().primaryKey(),
-  ticketId: uuid('ticket_id').notNull().references(() => tickets.id, { onDelete: 'cascade' }),
+  // No foreign key: the ticket may live in tickets or tickets_archive
+  ticketId: uuid('ticket_id').notNull(),
   userId: uuid('user_id').notNull().references(() => users.id),
   content: text('content').notNull(),
   isInternal: boolean('is_internal').notNull().default(false),
   createdAt: timestamp('created_at').notNull().defaultNow(),
 }, (table) => {
   return {
-    ticketIdx: index('comments_ticket_idx').on(table.ticketId),
+    // Serves per-ticket lookups and the newest-first comment pages
+    ticketCreatedAtIdx: index('comments_ticket_created_at_idx').on(table.ticketId, table.createdAt),
     createdAtIdx: index('comments_created_at_idx').on(table.createdAt),
   };
 });
@@ -104,12 +109,17 @@ export const ticketComments = pgTable('ticket_comments', {
 // 5. Ticket Attachments
 export const ticketAttachments = pgTable('ticket_attachments', {
   id: uuid('id').defaultRandom().primaryKey(),
-  ticketId: uuid('ticket_id').notNull().references(() => tickets.id, { onDelete: 'cascade' }),
+  // No foreign key: the ticket may live in tickets or tickets_archive
+  ticketId: uuid('ticket_id').notNull(),
   fileName: varchar('file_name', { length: 255 }).notNull(),
   filePath: varchar('file_path', { length: 500 }).notNull(),
   fileSize: integer('file_size').notNull(),
   mimeType: varchar('mime_type', { length: 100 }).notNull(),
   createdAt: timestamp('created_at').notNull().defaultNow(),
+}, (table) => {
+  return {
+    filePathIdx: index('attachments_file_path_idx').on(table.filePath),
+  };
 });
 
 // 6. Ticket Histories
@@ -157,12 +167,144 @@ export const knowledgeBases = pgTable('knowledge_bases', {
 // 9. Customer Satisfactions
 export const customerSatisfactions = pgTable('customer_satisfactions', {
   id: uuid('id').defaultRandom().primaryKey(),
-  ticketId: uuid('ticket_id').notNull().references(() => tickets.id, { onDelete: 'cascade' }).unique(),
+  // No foreign key: the ticket may live in tickets or tickets_archive
+  ticketId: uuid('ticket_id').notNull().unique(),
   rating: integer('rating').notNull(),
   feedback: text('feedback'),
   createdAt: timestamp('created_at').notNull().defaultNow(),
 });
 
+// ============================================================================
+// REPORTING ROLLUPS
+// ============================================================================
+
+// 10. Ticket Daily Stats (tickets pre-aggregated by creation day)
+// Rebuilt per day from tickets; see lib/services/report-rollup-service.ts
+export const ticketDailyStats = pgTable('ticket_daily_stats', {
+  day: date('day').notNull(),
+  categoryId: uuid('category_id'),
+  agentId: uuid('agent_id'),
+  priority: ticketPriorityEnum('priority').notNull(),
+  status: ticketStatusEnum('status').notNull(),
+  ticketCount: integer('ticket_count').notNull().default(0),
+  responseMet: integer('response_met').notNull().default(0),
+  responseViolated: integer('response_violated').notNull().default(0),
+  resolveMet: integer('resolve_met').notNull().default(0),
+  resolveViolated: integer('resolve_violated').notNull().default(0),
+  resolutionCount: integer('resolution_count').notNull().default(0),
+  resolutionHoursSum: doublePrecision('resolution_hours_sum').notNull().default(0),
+}, (table) => {
+  return {
+    dayIdx: index('ticket_daily_stats_day_idx').on(table.day),
+  };
+});
+
+// 11. Satisfaction Daily Stats (ratings pre-aggregated by rating day)
+export const satisfactionDailyStats = pgTable('satisfaction_daily_stats', {
+  day: date('day').notNull(),
+  categoryId: uuid('category_id'),
+  agentId: uuid('agent_id'),
+  rating: integer('rating').notNull(),
+  ratingCount: integer('rating_count').notNull().default(0),
+}, (table) => {
+  return {
+    dayIdx: index('satisfaction_daily_stats_day_idx').on(table.day),
+  };
+});
+
+// 12. Days whose rollup rows are out of date (filled by triggers)
+export const reportRollupDirtyDays = pgTable('report_rollup_dirty_days', {
+  day: date('day').primaryKey(),
+  markedAt: timestamp('marked_at').notNull().defaultNow(),
+});
+
+// ============================================================================
+// ARCHIVE
+// ============================================================================
+
+// 13. Tickets Archive (tickets closed longer than the retention window)
+// Moved by lib/services/archive-service.ts together with their histories;
+// comments, attachments and ratings stay where they are
+export const ticketsArchive = pgTable('tickets_archive', {
+  id: uuid('id').primaryKey(),
+  title: varchar('title', { length: 200 }).notNull(),
+  content: text('content').notNull(),
+  status: ticketStatusEnum('status').notNull(),
+  priority: ticketPriorityEnum('priority').notNull(),
+  categoryId: uuid('category_id'),
+  customerId: uuid('customer_id').notNull(),
+  agentId: uuid('agent_id'),
+  sentiment: varchar('sentiment', { length: 20 }),
+  slaResponseDeadline: timestamp('sla_response_deadline'),
+  slaResolveDeadline: timestamp('sla_resolve_deadline'),
+  slaResponseMet: boolean('sla_response_met'),
+  slaResolveMet: boolean('sla_resolve_met'),
+  createdAt: timestamp('created_at').notNull(),
+  updatedAt: timestamp('updated_at').notNull(),
+  firstResponseAt: timestamp('first_response_at'),
+  resolvedAt: timestamp('resolved_at'),
+  closedAt: timestamp('closed_at'),
+  archivedAt: timestamp('archived_at').notNull().defaultNow(),
+}, (table) => {
+  return {
+    customerIdx: index('tickets_archive_customer_idx').on(table.customerId),
+    agentIdx: index('tickets_archive_agent_idx').on(table.agentId),
+    createdAtIdx: index('tickets_archive_created_at_idx').on(table.createdAt),
+  };
+});
+
+// 14. Ticket Histories Archive
+export const ticketHistoriesArchive = pgTable('ticket_histories_archive', {
+  id: uuid('id').primaryKey(),
+  ticketId: uuid('ticket_id').notNull(),
+  userId: uuid('user_id').notNull(),
+  field: varchar('field', { length: 50 }).notNull(),
+  oldValue: text('old_value'),
+  newValue: text('new_value'),
+  createdAt: timestamp('created_at').notNull(),
+}, (table) => {
+  return {
+    ticketIdx: index('histories_archive_ticket_idx').on(table.ticketId),
+  };
+});
+
+// Live and archived tickets together (read-only, created by migration);
+// archived_at is null for live tickets
+export const allTickets = pgView('all_tickets', {
+  id: uuid('id').notNull(),
+  title: varchar('title', { length: 200 }).notNull(),
+  content: text('content').notNull(),
+  status: ticketStatusEnum('status').notNull(),
+  priority: ticketPriorityEnum('priority').notNull(),
+  categoryId: uuid('category_id'),
+  customerId: uuid('customer_id').notNull(),
+  agentId: uuid('agent_id'),
+  sentiment: varchar('sentiment', { length: 20 }),
+  slaResponseDeadline: timestamp('sla_response_deadline'),
+  slaResolveDeadline: timestamp('sla_resolve_deadline'),
+  slaResponseMet: boolean('sla_response_met'),
+  slaResolveMet: boolean('sla_resolve_met'),
+  createdAt: timestamp('created_at').notNull(),
+  updatedAt: timestamp('updated_at').notNull(),
+  firstResponseAt: timestamp('first_response_at'),
+  resolvedAt: timestamp('resolved_at'),
+  closedAt: timestamp('closed_at'),
+  archivedAt: timestamp('archived_at'),
+}).existing();
+
+// ============================================================================
+// BACKGROUND JOBS
+// ============================================================================
+
+// 15. Job Leases (one row per singleton job; see lib/services/job-lease-service.ts)
+// A lease is free once expires_at has passed, so a crashed holder is replaced
+export const jobLeases = pgTable('job_leases', {
+  name: varchar('name', { length: 100 }).primaryKey(),
+  holder: varchar('holder', { length: 100 }).notNull(),
+  acquiredAt: timestamp('acquired_at').notNull().defaultNow(),
+  expiresAt: timestamp('expires_at').notNull(),
+});
+
 // ============================================================================
 // TYPE EXPORTS (for TypeScript inference)
 // ============================================================================
@@ -193,3 +335,6 @@ export type NewKnowledgeBase = typeof knowledgeBases.$inferInsert;
 
 export type CustomerSatisfaction = typeof customerSatisfactions.$inferSelect;
 export type NewCustomerSatisfaction = typeof customerSatisfactions.$inferInsert;
+
+export type TicketDailyStat = typeof ticketDailyStats.$inferSelect;
+export type SatisfactionDailyStat = typeof satisfactionDailyStats.$inferSelect;
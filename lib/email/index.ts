@@ -1,13 +1,18 @@
-import nodemailer from 'nodemailer';
 import type { Transporter } from 'nodemailer';
+import { emailSendDuration } from '@/lib/metrics';
+
+export { renderEmail } from './render';
 
 // Email transporter singleton
 let transporter: Transporter | null = null;
 
 /**
  * Get or create the email transporter instance
+ *
+ * nodemailer is imported on first use so that routes which never send mail
+ * do not pay for loading it on a cold start.
  */
-export function getEmailTransporter(): Transporter {
+export async function getEmailTransporter(): Promise<Transporter> {
   if (transporter) {
     return transporter;
   }
@@ -33,6 +38,7 @@ export function getEmailTransporter(): Transporter {
   }
 
   try {
+    const { default: nodemailer } = await import('nodemailer');
     transporter = nodemailer.createTransport({
       host: smtpHost,
       port: parseInt(smtpPort, 10),
@@ -73,8 +79,10 @@ export async function sendEmail({
   html: string;
   text?: string;
 }): Promise<boolean> {
+  const stopTimer = emailSendDuration.startTimer();
+
   try {
-    const transporter = getEmailTransporter();
+    const transporter = await getEmailTransporter();
     const from = process.env.SMTP_FROM || 'noreply@ai-helpdesk.com';
 
     await transporter.sendMail({
@@ -85,8 +93,10 @@ export async function sendEmail({
       text: text || undefined,
     });
 
+    stopTimer({ status: 'ok' });
     return true;
   } catch (error) {
+    stopTimer({ status: 'error' });
     console.error('Failed to send email:', {
       error: error instanceof Error ? error.message : 'Unknown error',
       to,
@@ -0,0 +1,38 @@
+import type { ReactElement } from 'react';
+
+/**
+ * Email templates, loaded on first use
+ *
+ * Templates pull in React and @react-email/components, which most requests
+ * never need; importing them lazily keeps them out of route cold starts.
+ */
+const templates = {
+  ticketCreated: () => import('./templates/ticket-created'),
+  ticketReply: () => import('./templates/ticket-reply'),
+  slaWarning: () => import('./templates/sla-warning'),
+  slaViolated: () => import('./templates/sla-violated'),
+  slaWarningDigest: () => import('./templates/sla-warning-digest'),
+  slaViolatedDigest: () => import('./templates/sla-violated-digest'),
+};
+
+export type EmailTemplate = keyof typeof templates;
+
+type TemplateProps<T extends EmailTemplate> = Parameters<
+  Awaited<ReturnType<(typeof templates)[T]>>['default']
+>[0];
+
+/**
+ * Render an email template to HTML
+ */
+export async function renderEmail<T extends EmailTemplate>(
+  template: T,
+  props: TemplateProps<T>
+): Promise<string> {
+  const [{ default: Template }, { render }] = await Promise.all([
+    templates[template](),
+    import('@react-email/components'),
+  ]);
+
+  const Component = Template as (props: TemplateProps<T>) => ReactElement;
+  return render(Component(props));
+}
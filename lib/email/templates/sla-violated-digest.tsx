@@ -0,0 +1,209 @@
+import * as React from 'react';
+import {
+  Html,
+  Head,
+  Body,
+  Container,
+  Section,
+  Text,
+  Button,
+  Link,
+  Hr,
+} from '@react-email/components';
+
+export interface SLAViolatedDigestItem {
+  ticketId: string;
+  ticketTitle: string;
+  agentName: string;
+  slaType: 'response' | 'resolve';
+  violatedBy: number; // minutes overdue
+  ticketUrl: string;
+}
+
+interface SLAViolatedDigestEmailProps {
+  items: SLAViolatedDigestItem[]; // longest overdue first
+  ticketsUrl: string;
+}
+
+function formatOverdue(violatedBy: number) {
+  const hours = Math.floor(violatedBy / 60);
+  const minutes = violatedBy % 60;
+  return hours > 0 ? `${hours}시간 ${minutes}분` : `${minutes}분`;
+}
+
+// Rendered once per sweep and sent to every manager, so it has no personal greeting
+export function SLAViolatedDigestEmail({ items, ticketsUrl }: SLAViolatedDigestEmailProps) {
+  return (
+    <Html lang="ko">
+      <Head />
+      <Body style={main}>
+        <Container style={container}>
+          <Section style={header}>
+            <Text style={headerText}>🚨 SLA 위반 발생 ({items.length}건)</Text>
+          </Section>
+
+          <Section style={content}>
+            <Text style={greeting}>관리자님, 안녕하세요</Text>
+            <Text style={violationText}>
+              티켓 <strong>{items.length}건</strong>의 SLA 마감 시간이 초과되었습니다.
+            </Text>
+
+            {items.map((item) => (
+              <Section key={`${item.ticketId}-${item.slaType}`} style={ticketInfo}>
+                <Text style={infoRow}>
+                  <strong>[{item.ticketId.slice(0, 8)}]</strong>{' '}
+                  <Link href={item.ticketUrl} style={ticketLink}>
+                    {item.ticketTitle}
+                  </Link>
+                </Text>
+                <Text style={infoRow}>
+                  {item.slaType === 'response' ? '응답' : '해결'} SLA · {formatOverdue(item.violatedBy)} 초과 · 담당자: {item.agentName}
+                </Text>
+              </Section>
+            ))}
+
+            <Section style={alertBox}>
+              <Text style={alertTitle}>필요한 조치</Text>
+              <Text style={alertText}>
+                • 담당자와 즉시 연락하여 상황을 파악하세요
+              </Text>
+              <Text style={alertText}>
+                • 필요 시 티켓을 재할당하거나 지원을 제공하세요
+              </Text>
+            </Section>
+
+            <Section style={buttonContainer}>
+              <Button style={button} href={ticketsUrl}>
+                티켓 목록 보기
+              </Button>
+            </Section>
+
+            <Hr style={hr} />
+
+            <Text style={footer}>
+              이 이메일은 AI Help Desk 시스템에서 자동으로 발송되었습니다.
+            </Text>
+          </Section>
+        </Container>
+      </Body>
+    </Html>
+  );
+}
+
+export default SLAViolatedDigestEmail;
+
+// Styles
+const main = {
+  backgroundColor: '#f6f9fc',
+  fontFamily:
+    '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Ubuntu, sans-serif',
+};
+
+const container = {
+  backgroundColor: '#ffffff',
+  margin: '0 auto',
+  padding: '20px 0',
+  maxWidth: '600px',
+};
+
+const header = {
+  backgroundColor: '#dc2626',
+  padding: '20px',
+  textAlign: 'center' as const,
+};
+
+const headerText = {
+  color: '#ffffff',
+  fontSize: '24px',
+  fontWeight: 'bold',
+  margin: '0',
+};
+
+const content = {
+  padding: '30px',
+};
+
+const greeting = {
+  fontSize: '16px',
+  marginBottom: '10px',
+};
+
+const violationText = {
+  fontSize: '16px',
+  lineHeight: '1.6',
+  color: '#991b1b',
+  backgroundColor: '#fee2e2',
+  padding: '15px',
+  borderRadius: '6px',
+  margin: '20px 0',
+  textAlign: 'center' as const,
+};
+
+const ticketInfo = {
+  backgroundColor: '#f9fafb',
+  borderRadius: '8px',
+  padding: '12px 20px',
+  margin: '10px 0',
+};
+
+const infoRow = {
+  fontSize: '14px',
+  lineHeight: '1.6',
+  margin: '2px 0',
+  color: '#1f2937',
+};
+
+const ticketLink = {
+  color: '#1f2937',
+  textDecoration: 'underline',
+};
+
+const alertBox = {
+  backgroundColor: '#fef2f2',
+  border: '2px solid #f87171',
+  borderRadius: '8px',
+  padding: '20px',
+  margin: '20px 0',
+};
+
+const alertTitle = {
+  fontSize: '16px',
+  fontWeight: 'bold',
+  color: '#991b1b',
+  marginBottom: '10px',
+};
+
+const alertText = {
+  fontSize: '14px',
+  color: '#7f1d1d',
+  margin: '8px 0',
+  lineHeight: '1.6',
+};
+
+const buttonContainer = {
+  textAlign: 'center' as const,
+  margin: '30px 0',
+};
+
+const button = {
+  backgroundColor: '#dc2626',
+  borderRadius: '6px',
+  color: '#ffffff',
+  fontSize: '16px',
+  fontWeight: 'bold',
+  textDecoration: 'none',
+  textAlign: 'center' as const,
+  display: 'inline-block',
+  padding: '12px 30px',
+};
+
+const hr = {
+  borderColor: '#e5e7eb',
+  margin: '30px 0',
+};
+
+const footer = {
+  fontSize: '12px',
+  color: '#6b7280',
+  textAlign: 'center' as const,
+};
@@ -0,0 +1,173 @@
+import * as React from 'react';
+import {
+  Html,
+  Head,
+  Body,
+  Container,
+  Section,
+  Text,
+  Button,
+  Link,
+  Hr,
+} from '@react-email/components';
+
+export interface SLAWarningDigestItem {
+  ticketId: string;
+  ticketTitle: string;
+  slaType: 'response' | 'resolve';
+  minutesRemaining: number;
+  ticketUrl: string;
+}
+
+interface SLAWarningDigestEmailProps {
+  agentName: string;
+  items: SLAWarningDigestItem[]; // most urgent first
+  ticketsUrl: string;
+}
+
+export function SLAWarningDigestEmail({
+  agentName,
+  items,
+  ticketsUrl,
+}: SLAWarningDigestEmailProps) {
+  return (
+    <Html lang="ko">
+      <Head />
+      <Body style={main}>
+        <Container style={container}>
+          <Section style={header}>
+            <Text style={headerText}>⚠️ SLA 마감 임박 경고 ({items.length}건)</Text>
+          </Section>
+
+          <Section style={content}>
+            <Text style={greeting}>안녕하세요, {agentName}님</Text>
+            <Text style={warningText}>
+              담당 티켓 <strong>{items.length}건</strong>의 SLA 마감 시간이 임박했습니다.
+            </Text>
+
+            {items.map((item) => (
+              <Section key={`${item.ticketId}-${item.slaType}`} style={ticketInfo}>
+                <Text style={infoRow}>
+                  <strong>[{item.ticketId.slice(0, 8)}]</strong>{' '}
+                  <Link href={item.ticketUrl} style={ticketLink}>
+                    {item.ticketTitle}
+                  </Link>
+                </Text>
+                <Text style={infoRow}>
+                  {item.slaType === 'response' ? '응답' : '해결'} SLA · 약 {item.minutesRemaining}분 남음
+                </Text>
+              </Section>
+            ))}
+
+            <Section style={buttonContainer}>
+              <Button style={button} href={ticketsUrl}>
+                티켓 목록 보기
+              </Button>
+            </Section>
+
+            <Hr style={hr} />
+
+            <Text style={footer}>
+              이 이메일은 AI Help Desk 시스템에서 자동으로 발송되었습니다.
+            </Text>
+          </Section>
+        </Container>
+      </Body>
+    </Html>
+  );
+}
+
+export default SLAWarningDigestEmail;
+
+// Styles
+const main = {
+  backgroundColor: '#f6f9fc',
+  fontFamily:
+    '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Ubuntu, sans-serif',
+};
+
+const container = {
+  backgroundColor: '#ffffff',
+  margin: '0 auto',
+  padding: '20px 0',
+  maxWidth: '600px',
+};
+
+const header = {
+  backgroundColor: '#f59e0b',
+  padding: '20px',
+  textAlign: 'center' as const,
+};
+
+const headerText = {
+  color: '#ffffff',
+  fontSize: '24px',
+  fontWeight: 'bold',
+  margin: '0',
+};
+
+const content = {
+  padding: '30px',
+};
+
+const greeting = {
+  fontSize: '16px',
+  marginBottom: '10px',
+};
+
+const warningText = {
+  fontSize: '16px',
+  lineHeight: '1.6',
+  color: '#b45309',
+  backgroundColor: '#fef3c7',
+  padding: '15px',
+  borderRadius: '6px',
+  margin: '20px 0',
+};
+
+const ticketInfo = {
+  backgroundColor: '#f9fafb',
+  borderRadius: '8px',
+  padding: '12px 20px',
+  margin: '10px 0',
+};
+
+const infoRow = {
+  fontSize: '14px',
+  lineHeight: '1.6',
+  margin: '2px 0',
+  color: '#1f2937',
+};
+
+const ticketLink = {
+  color: '#1f2937',
+  textDecoration: 'underline',
+};
+
+const buttonContainer = {
+  textAlign: 'center' as const,
+  margin: '30px 0',
+};
+
+const button = {
+  backgroundColor: '#f59e0b',
+  borderRadius: '6px',
+  color: '#ffffff',
+  fontSize: '16px',
+  fontWeight: 'bold',
+  textDecoration: 'none',
+  textAlign: 'center' as const,
+  display: 'inline-block',
+  padding: '12px 30px',
+};
+
+const hr = {
+  borderColor: '#e5e7eb',
+  margin: '30px 0',
+};
+
+const footer = {
+  fontSize: '12px',
+  color: '#6b7280',
+  textAlign: 'center' as const,
+};
@@ -0,0 +1,207 @@
+/**
+ * Metrics
+ *
+ * Minimal in-process Prometheus registry: counters, gauges and histograms
+ * with labels, rendered in the text exposition format by /api/metrics.
+ * Values are per process; Prometheus aggregates across instances.
+ */
+
+import { monitorEventLoopDelay } from 'perf_hooks';
+
+type Labels = Record<string, string>;
+
+// Seconds; tuned for DB queries and HTTP calls
+const DEFAULT_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+
+// ============================================================================
+// Metric types
+// ============================================================================
+
+function labelKey(labels: Labels): string {
+  return Object.keys(labels)
+    .sort()
+    .map((name) => `${name}="${String(labels[name]).replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n')}"`)
+    .join(',');
+}
+
+function formatLabels(key: string, extra?: string): string {
+  const all = [key, extra].filter(Boolean).join(',');
+  return all ? `{${all}}` : '';
+}
+
+interface Metric {
+  name: string;
+  help: string;
+  render(): string[];
+}
+
+export class Counter implements Metric {
+  private values = new Map<string, number>();
+
+  constructor(readonly name: string, readonly help: string) {}
+
+  inc(labels: Labels = {}, value = 1): void {
+    const key = labelKey(labels);
+    this.values.set(key, (this.values.get(key) || 0) + value);
+  }
+
+  render(): string[] {
+    return [
+      `# HELP ${this.name} ${this.help}`,
+      `# TYPE ${this.name} counter`,
+      ...Array.from(this.values, ([key, value]) => `${this.name}${formatLabels(key)} ${value}`),
+    ];
+  }
+}
+
+export class Gauge implements Metric {
+  private values = new Map<string, number>();
+
+  constructor(
+    readonly name: string,
+    readonly help: string,
+    private collect?: (gauge: Gauge) => void
+  ) {}
+
+  set(labels: Labels, value: number): void {
+    this.values.set(labelKey(labels), value);
+  }
+
+  render(): string[] {
+    this.collect?.(this);
+    return [
+      `# HELP ${this.name} ${this.help}`,
+      `# TYPE ${this.name} gauge`,
+      ...Array.from(this.values, ([key, value]) => `${this.name}${formatLabels(key)} ${value}`),
+    ];
+  }
+}
+
+interface HistogramSeries {
+  buckets: number[];
+  sum: number;
+  count: number;
+}
+
+export class Histogram implements Metric {
+  private series = new Map<string, HistogramSeries>();
+
+  constructor(
+    readonly name: string,
+    readonly help: string,
+    private bounds: number[] = DEFAULT_BUCKETS
+  ) {}
+
+  observe(labels: Labels, value: number): void {
+    const key = labelKey(labels);
+    let series = this.series.get(key);
+    if (!series) {
+      series = { buckets: new Array(this.bounds.length).fill(0), sum: 0, count: 0 };
+      this.series.set(key, series);
+    }
+
+    for (let i = 0; i < this.bounds.length; i++) {
+      if (value <= this.bounds[i]) {
+        series.buckets[i]++;
+      }
+    }
+    series.sum += value;
+    series.count++;
+  }
+
+  /**
+   * Start a timer; call the returned function to record the elapsed seconds
+   */
+  startTimer(labels: Labels = {}): (extraLabels?: Labels) => number {
+    const start = process.hrtime.bigint();
+    return (extraLabels = {}) => {
+      const seconds = Number(process.hrtime.bigint() - start) / 1e9;
+      this.observe({ ...labels, ...extraLabels }, seconds);
+      return seconds;
+    };
+  }
+
+  render(): string[] {
+    const lines = [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} histogram`];
+
+    for (const [key, series] of this.series) {
+      this.bounds.forEach((bound, i) => {
+        lines.push(`${this.name}_bucket${formatLabels(key, `le="${bound}"`)} ${series.buckets[i]}`);
+      });
+      lines.push(`${this.name}_bucket${formatLabels(key, 'le="+Inf"')} ${series.count}`);
+      lines.push(`${this.name}_sum${formatLabels(key)} ${series.sum}`);
+      lines.push(`${this.name}_count${formatLabels(key)} ${series.count}`);
+    }
+
+    return lines;
+  }
+}
+
+// ============================================================================
+// Registry
+// ============================================================================
+
+// Kept on globalThis so that dev-mode module reloads do not reset metrics
+const globalForMetrics = globalThis as unknown as { __helpdeskMetrics?: Map<string, Metric> };
+const registry = (globalForMetrics.__helpdeskMetrics ??= new Map<string, Metric>());
+
+function register<T extends Metric>(metric: T): T {
+  const existing = registry.get(metric.name);
+  if (existing) {
+    return existing as T;
+  }
+  registry.set(metric.name, metric);
+  return metric;
+}
+
+/**
+ * Render all metrics in the Prometheus text exposition format
+ */
+export function renderMetrics(): string {
+  return Array.from(registry.values())
+    .flatMap((metric) => metric.render())
+    .join('\n') + '\n';
+}
+
+// ============================================================================
+// Application metrics
+// ============================================================================
+
+export const dbQueryDuration = register(
+  new Histogram('helpdesk_db_query_duration_seconds', 'Database query latency by route (and calling function with DB_QUERY_CALLERS=1)')
+);
+
+export const dbQueriesPerRequest = register(
+  new Histogram(
+    'helpdesk_db_queries_per_request',
+    'Number of database queries issued per HTTP request',
+    [1, 2, 3, 5, 10, 20, 50, 100]
+  )
+);
+
+export const dbSlowQueries = register(
+  new Counter('helpdesk_db_slow_queries_total', 'Database queries slower than DB_SLOW_QUERY_MS')
+);
+
+export const aiRequestDuration = register(
+  new Histogram('helpdesk_ai_request_duration_seconds', 'OpenRouter chat completion latency', [
+    0.25, 0.5, 1, 2, 5, 10, 20, 30, 60,
+  ])
+);
+
+export const emailSendDuration = register(
+  new Histogram('helpdesk_email_send_duration_seconds', 'SMTP send latency')
+);
+
+// Event-loop lag, sampled continuously at 20ms resolution
+const eventLoopDelay = monitorEventLoopDelay({ resolution: 20 });
+eventLoopDelay.enable();
+
+register(
+  new Gauge('helpdesk_event_loop_lag_seconds', 'Event loop delay since the last scrape', (gauge) => {
+    gauge.set({ quantile: '0.5' }, eventLoopDelay.percentile(50) / 1e9);
+    gauge.set({ quantile: '0.99' }, eventLoopDelay.percentile(99) / 1e9);
+    gauge.set({ quantile: 'max' }, eventLoopDelay.max / 1e9);
+    eventLoopDelay.reset();
+  })
+);
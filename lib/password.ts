@@ -0,0 +1,213 @@
+/**
+ * Password Hashing
+ *
+ * bcrypt is deliberately slow, and bcryptjs runs it in pure JavaScript. To
+ * keep logins from stalling every other request on the instance, hashing and
+ * verification run on a small pool of worker threads with a bounded queue.
+ *
+ * The cost factor is set with BCRYPT_COST. Hashes made with a different cost
+ * are upgraded on the next successful login (see `needsRehash`).
+ */
+
+import { Worker } from 'worker_threads';
+import { availableParallelism } from 'os';
+import bcrypt from 'bcryptjs';
+
+// ============================================================================
+// Configuration
+// ============================================================================
+
+const DEFAULT_COST = 10;
+
+export const PASSWORD_HASH_COST = parseCost(process.env.BCRYPT_COST);
+
+const POOL_SIZE = Math.max(
+  1,
+  parseInt(process.env.PASSWORD_HASH_WORKERS || '', 10) ||
+    Math.min(4, Math.max(availableParallelism() - 1, 1))
+);
+const MAX_QUEUE_LENGTH = parseInt(process.env.PASSWORD_HASH_MAX_QUEUE || '', 10) || 200;
+
+function parseCost(value: string | undefined): number {
+  const cost = parseInt(value || '', 10);
+  // bcrypt accepts 4-31; anything above 15 would take seconds per login
+  return cost >= 4 && cost <= 15 ? cost : DEFAULT_COST;
+}
+
+// ============================================================================
+// Worker pool
+// ============================================================================
+
+type PasswordTask =
+  | { op: 'hash'; password: string; cost: number }
+  | { op: 'compare'; password: string; hash: string };
+
+interface QueuedTask {
+  task: PasswordTask;
+  resolve: (value: string | boolean) => void;
+  reject: (error: Error) => void;
+}
+
+interface PoolWorker {
+  worker: Worker;
+  current: QueuedTask | null;
+  replied: boolean;
+}
+
+// Evaluated as CommonJS in the worker, so it does not depend on the bundler.
+// bcryptjs must therefore be resolvable from node_modules at runtime; it is
+// listed in `serverExternalPackages` (next.config.ts) so builds trace it.
+const WORKER_SOURCE = `
+const { parentPort } = require('worker_threads');
+const bcrypt = require('bcryptjs');
+parentPort.on('message', (task) => {
+  try {
+    const result = task.op === 'hash'
+      ? bcrypt.hashSync(task.password, task.cost)
+      : bcrypt.compareSync(task.password, task.hash);
+    parentPort.postMessage({ ok: true, result });
+  } catch (error) {
+    parentPort.postMessage({ ok: false, error: String(error && error.message || error) });
+  }
+});
+`;
+
+const workers: PoolWorker[] = [];
+const queue: QueuedTask[] = [];
+let workersUnavailable = false;
+
+function spawnWorker(): PoolWorker | null {
+  let worker: Worker;
+  try {
+    worker = new Worker(WORKER_SOURCE, { eval: true });
+  } catch (error) {
+    console.error('Failed to start password hashing worker, hashing on main thread:', error);
+    workersUnavailable = true;
+    return null;
+  }
+
+  const entry: PoolWorker = { worker, current: null, replied: false };
+  // Idle workers must not keep scripts alive
+  worker.unref();
+
+  worker.on('message', (message: { ok: boolean; result?: string | boolean; error?: string }) => {
+    const task = entry.current;
+    entry.current = null;
+    entry.replied = true;
+    worker.unref();
+
+    if (task) {
+      if (message.ok) {
+        task.resolve(message.result as string | boolean);
+      } else {
+        task.reject(new Error(message.error));
+      }
+    }
+    dispatch();
+  });
+
+  worker.on('error', (error) => {
+    workers.splice(workers.indexOf(entry), 1);
+    const task = entry.current;
+    entry.current = null;
+
+    if (!entry.replied) {
+      // The worker could not even start (e.g. bcryptjs is missing from the
+      // build output); a new one would fail the same way
+      console.error('Password hashing worker failed to start, hashing on main thread:', error);
+      workersUnavailable = true;
+      if (task) {
+        queue.unshift(task);
+      }
+    } else {
+      console.error('Password hashing worker crashed:', error);
+      task?.reject(error);
+    }
+    dispatch();
+  });
+
+  workers.push(entry);
+  return entry;
+}
+
+/**
+ * Hand queued tasks to idle workers, starting workers up to the pool size
+ */
+function dispatch(): void {
+  while (queue.length > 0) {
+    let entry = workers.find((w) => w.current === null) || null;
+    if (!entry && !workersUnavailable && workers.length < POOL_SIZE) {
+      entry = spawnWorker();
+    }
+    if (!entry) {
+      break;
+    }
+
+    const next = queue.shift()!;
+    entry.current = next;
+    entry.worker.ref();
+    entry.worker.postMessage(next.task);
+  }
+
+  if (workersUnavailable) {
+    // Fallback: bcryptjs async API (still on the main thread, but chunked)
+    for (const { task, resolve, reject } of queue.splice(0)) {
+      const pending =
+        task.op === 'hash'
+          ? bcrypt.hash(task.password, task.cost)
+          : bcrypt.compare(task.password, task.hash);
+      pending.then(resolve, reject);
+    }
+  }
+}
+
+function runTask<T extends string | boolean>(task: PasswordTask): Promise<T> {
+  if (queue.length >= MAX_QUEUE_LENGTH) {
+    return Promise.reject(new Error('Password hashing queue is full'));
+  }
+
+  return new Promise<T>((resolve, reject) => {
+    queue.push({ task, resolve: resolve as (value: string | boolean) => void, reject });
+    dispatch();
+  });
+}
+
+// ============================================================================
+// Public API
+// ============================================================================
+
+/**
+ * Hash a password with the configured cost
+ */
+export function hashPassword(password: string, cost: number = PASSWORD_HASH_COST): Promise<string> {
+  return runTask<string>({ op: 'hash', password, cost });
+}
+
+/**
+ * Check a password against a stored bcrypt hash
+ */
+export function verifyPassword(password: string, hash: string): Promise<boolean> {
+  return runTask<boolean>({ op: 'compare', password, hash });
+}
+
+/**
+ * Check whether a stored hash was made with a different cost than configured
+ */
+export function needsRehash(hash: string): boolean {
+  try {
+    return bcrypt.getRounds(hash) !== PASSWORD_HASH_COST;
+  } catch {
+    return false;
+  }
+}
+
+/**
+ * Current pool state (for benchmarks and diagnostics)
+ */
+export function getPasswordPoolStats(): { workers: number; busy: number; queued: number } {
+  return {
+    workers: workers.length,
+    busy: workers.filter((w) => w.current !== null).length,
+    queued: queue.length,
+  };
+}
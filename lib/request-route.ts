@@ -0,0 +1,21 @@
+/**
+ * Request Route Label
+ *
+ * Middleware stores the normalized API route of each request (ids replaced
+ * with `[id]`) in a request header, so that query metrics can be labelled by
+ * route without inspecting stack traces. Incoming copies of the header are
+ * always stripped.
+ *
+ * Has no dependencies, so it runs in both the middleware and Node runtimes.
+ */
+
+export const ROUTE_HEADER = "x-api-route";
+
+const UUID_PATTERN = /[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}/gi;
+
+/**
+ * Route label for a pathname, e.g. `/api/tickets/[id]`
+ */
+export function routeLabel(pathname: string): string {
+  return pathname.replace(UUID_PATTERN, "[id]");
+}
@@ -7,23 +7,26 @@
  */
 
 import { db } from '@/lib/db';
-import { tickets, categories, knowledgeBases, aiPromptTemplates } from '@/lib/db/schema';
+import { tickets } from '@/lib/db/schema';
 import { eq, and, ilike, or, desc, ne } from 'drizzle-orm';
+import type { ChatCompletionResponse } from '@/lib/ai/openrouter';
+import type { BuiltPrompt, PromptBudget, TemplateVariables } from '@/lib/ai/prompts';
 import {
-  createChatCompletion,
-  extractContent,
-  isOpenRouterAvailable,
-  OpenRouterError,
-  type Message,
-} from '@/lib/ai/openrouter';
-import {
-  getSystemPrompt,
-  buildPromptWithTemplate,
-  buildKnowledgeBaseContext,
-  buildCategoryList,
-  DEFAULT_ANSWER_TEMPLATE,
-  type TemplateVariables,
-} from '@/lib/ai/prompts';
+  getActiveCategories,
+  getCachedCategory,
+  getPromptTemplateForCategory,
+} from '@/lib/services/reference-data-service';
+
+// ============================================================================
+// Lazy Dependencies
+// ============================================================================
+
+// The OpenRouter client, the prompt builder and the knowledge base index load
+// on first use, so similar-ticket search and calls that return early (no API
+// key) do not pay for them on a cold start
+const loadOpenRouter = () => import('@/lib/ai/openrouter');
+const loadPrompts = () => import('@/lib/ai/prompts');
+const loadKnowledgeBase = () => import('@/lib/services/knowledge-base-service');
 
 // ============================================================================
 // Type Definitions
@@ -34,12 +37,15 @@ export interface CategoryClassification {
   categoryName: string | null;
   confidence: number;
   reason: string;
+  promptTokens?: number;
 }
 
 export interface AnswerGeneration {
   response: string;
   usedKB: boolean;
   kbEntriesUsed: number;
+  promptTokens: number;
+  truncatedSections: string[];
 }
 
 export type SentimentType = 'positive' | 'neutral' | 'negative';
@@ -48,6 +54,15 @@ export interface SentimentAnalysis {
   sentiment: SentimentType;
   confidence: number;
   reason: string;
+  promptTokens?: number;
+}
+
+/**
+ * Prompt token count for a call: the provider's count when reported,
+ * otherwise our estimate
+ */
+function getPromptTokens(response: ChatCompletionResponse, prompt: BuiltPrompt): number {
+  return response.usage?.prompt_tokens ?? prompt.estimatedTokens;
 }
 
 export interface SimilarTicket {
@@ -69,6 +84,9 @@ export async function classifyCategory(
   title: string,
   content: string
 ): Promise<CategoryClassification> {
+  const { isOpenRouterAvailable, createChatCompletion, extractContent, OpenRouterError } =
+    await loadOpenRouter();
+
   // Check if AI is available
   if (!isOpenRouterAvailable()) {
     return {
@@ -80,12 +98,8 @@ export async function classifyCategory(
   }
 
   try {
-    // Get all active categories
-    const allCategories = await db
-      .select({ id: categories.id, name: categories.name })
-      .from(categories)
-      .where(eq(categories.isActive, true))
-      .orderBy(categories.sortOrder);
+    // Get all active categories (cached)
+    const allCategories = await getActiveCategories();
 
     if (allCategories.length === 0) {
       return {
@@ -96,28 +110,24 @@ export async function classifyCategory(
       };
     }
 
-    // Build category list
-    const categoryList = buildCategoryList(allCategories);
+    // Build prompt within the token budget
+    const { PromptBuilder, getSystemPrompt } = await loadPrompts();
+    const builder = new PromptBuilder();
+    const categoryList = builder.categories(allCategories);
+    const ticket = builder.ticket(title, content);
 
-    // Create messages
-    const messages: Message[] = [
-      {
-        role: 'system',
-        content: getSystemPrompt('category-classifier'),
-      },
-      {
-        role: 'user',
-        content: `${categoryList}
+    const prompt = builder.build(
+      getSystemPrompt('category-classifier'),
+      `${categoryList}
 
-제목: ${title}
-내용: ${content}
+제목: ${ticket.title}
+내용: ${ticket.content}
 
-위 티켓을 가장 적절한 카테고리로 분류해주세요.`,
-      },
-    ];
+위 티켓을 가장 적절한 카테고리로 분류해주세요.`
+    );
 
     // Call AI
-    const response = await createChatCompletion(messages, {
+    const response = await createChatCompletion(prompt.messages, {
       temperature: 0.3,
       maxTokens: 200,
     });
@@ -137,6 +147,7 @@ export async function classifyCategory(
       categoryName: parsed.categoryName || null,
       confidence: parsed.confidence || 0,
       reason: parsed.reason || '',
+      promptTokens: getPromptTokens(response, prompt),
     };
 
   } catch (error) {
@@ -168,6 +179,8 @@ interface GenerateResponseOptions {
   useCustomPrompt?: boolean;
   temperature?: number;
   maxTokens?: number;
+  kbLimit?: number;
+  budget?: PromptBudget;
 }
 
 /**
@@ -177,11 +190,22 @@ export async function generateResponse(
   ticketId: string,
   options: GenerateResponseOptions = {}
 ): Promise<AnswerGeneration> {
+  const { isOpenRouterAvailable, createChatCompletion, extractContent, OpenRouterError } =
+    await loadOpenRouter();
+
   // Check if AI is available
   if (!isOpenRouterAvailable()) {
     throw new Error('AI 서비스가 설정되지 않았습니다.');
   }
 
+  const [prompts, { searchKnowledgeBase }] = await Promise.all([
+    loadPrompts(),
+    loadKnowledgeBase(),
+  ]);
+  const { PromptBuilder, getSystemPrompt, buildPromptWithTemplate, DEFAULT_ANSWER_TEMPLATE } = prompts;
+
+  const budget = options.budget ?? prompts.DEFAULT_PROMPT_BUDGET;
+
   try {
     // Get ticket details
     const [ticket] = await db
@@ -194,48 +218,32 @@ export async function generateResponse(
       throw new Error('티켓을 찾을 수 없습니다.');
     }
 
-    // Get category name
+    // Get category name (cached)
     let categoryName = '미분류';
     if (ticket.categoryId) {
-      const [category] = await db
-        .select()
-        .from(categories)
-        .where(eq(categories.id, ticket.categoryId))
-        .limit(1);
+      const category = await getCachedCategory(ticket.categoryId);
       if (category) {
         categoryName = category.name;
       }
     }
 
-    // Get relevant knowledge base entries
-    let kbEntries: Array<{ title: string; content: string }> = [];
-    if (ticket.categoryId) {
-      const kbResults = await db
-        .select({ title: knowledgeBases.title, content: knowledgeBases.content })
-        .from(knowledgeBases)
-        .where(
-          and(
-            eq(knowledgeBases.categoryId, ticket.categoryId),
-            eq(knowledgeBases.isActive, true)
-          )
-        )
-        .limit(3);
-      kbEntries = kbResults;
-    }
+    // Get the most relevant knowledge base passages (in-memory index)
+    const kbEntries = await searchKnowledgeBase(`${ticket.title}\n${ticket.content}`, {
+      categoryId: ticket.categoryId,
+      limit: options.kbLimit ?? 3,
+      tokenBudget: budget.knowledgeBase,
+    });
 
     // Build knowledge base context
-    const kbContext = buildKnowledgeBaseContext(kbEntries);
+    const builder = new PromptBuilder(budget);
+    const kbContext = builder.knowledgeBase(kbEntries);
 
     // Get custom prompt template if exists
     let userPrompt = DEFAULT_ANSWER_TEMPLATE;
     let systemPrompt = getSystemPrompt('customer-support');
 
     if (options.useCustomPrompt && ticket.categoryId) {
-      const [template] = await db
-        .select()
-        .from(aiPromptTemplates)
-        .where(eq(aiPromptTemplates.categoryId, ticket.categoryId))
-        .limit(1);
+      const template = await getPromptTemplateForCategory(ticket.categoryId);
 
       if (template) {
         systemPrompt = template.systemPrompt;
@@ -244,23 +252,19 @@ export async function generateResponse(
     }
 
     // Build prompt with variables
+    const fitted = builder.ticket(ticket.title, ticket.content);
     const variables: TemplateVariables = {
-      title: ticket.title,
-      content: ticket.content,
+      title: fitted.title,
+      content: fitted.content,
       category: categoryName,
       knowledge_base: kbContext,
     };
 
     const finalUserPrompt = buildPromptWithTemplate(userPrompt, variables);
-
-    // Create messages
-    const messages: Message[] = [
-      { role: 'system', content: systemPrompt },
-      { role: 'user', content: finalUserPrompt },
-    ];
+    const prompt = builder.build(systemPrompt, finalUserPrompt);
 
     // Call AI
-    const response = await createChatCompletion(messages, {
+    const response = await createChatCompletion(prompt.messages, {
       temperature: options.temperature ?? 0.7,
       maxTokens: options.maxTokens ?? 1000,
     });
@@ -271,6 +275,8 @@ export async function generateResponse(
       response: aiContent,
       usedKB: kbEntries.length > 0,
       kbEntriesUsed: kbEntries.length,
+      promptTokens: getPromptTokens(response, prompt),
+      truncatedSections: prompt.truncatedSections,
     };
 
   } catch (error) {
@@ -292,6 +298,8 @@ export async function generateResponse(
  * Analyze sentiment of ticket content
  */
 export async function analyzeSentiment(content: string): Promise<SentimentAnalysis> {
+  const { isOpenRouterAvailable, createChatCompletion, extractContent } = await loadOpenRouter();
+
   // Check if AI is available
   if (!isOpenRouterAvailable()) {
     return {
@@ -302,20 +310,16 @@ export async function analyzeSentiment(content: string): Promise<SentimentAnalys
   }
 
   try {
-    // Create messages
-    const messages: Message[] = [
-      {
-        role: 'system',
-        content: getSystemPrompt('sentiment-analyzer'),
-      },
-      {
-        role: 'user',
-        content: `다음 텍스트의 감정을 분석해주세요:\n\n${content}`,
-      },
-    ];
+    // Build prompt within the token budget
+    const { PromptBuilder, getSystemPrompt } = await loadPrompts();
+    const builder = new PromptBuilder();
+    const prompt = builder.build(
+      getSystemPrompt('sentiment-analyzer'),
+      `다음 텍스트의 감정을 분석해주세요:\n\n${builder.fit('ticket', content)}`
+    );
 
     // Call AI
-    const response = await createChatCompletion(messages, {
+    const response = await createChatCompletion(prompt.messages, {
       temperature: 0.3,
       maxTokens: 200,
     });
@@ -329,6 +333,7 @@ export async function analyzeSentiment(content: string): Promise<SentimentAnalys
       sentiment: parsed.sentiment || 'neutral',
       confidence: parsed.confidence || 0,
       reason: parsed.reason || '',
+      promptTokens: getPromptTokens(response, prompt),
     };
 
   } catch (error) {
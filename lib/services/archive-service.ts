@@ -0,0 +1,75 @@
+/**
+ * Ticket Archival
+ *
+ * Tickets closed for longer than TICKET_ARCHIVE_AFTER_DAYS are moved, with
+ * their histories, from tickets/ticket_histories into tickets_archive and
+ * ticket_histories_archive. The live tables and their indexes then only hold
+ * the working set that the ticket list and the SLA scans touch.
+ *
+ * Comments, attachments and ratings stay in place (they reference the ticket
+ * id without a foreign key). Reads that must include archived tickets use
+ * the all_tickets view: getTicketById with `includeArchived`, the ticket
+ * list with `includeArchived`, report rollups and exports.
+ */
+
+import { db } from '@/lib/db';
+import { tickets, ticketHistories, ticketsArchive, ticketHistoriesArchive } from '@/lib/db/schema';
+import { getTableColumns, sql } from 'drizzle-orm';
+import type { PgTable } from 'drizzle-orm/pg-core';
+
+const ARCHIVE_AFTER_DAYS = parseInt(process.env.TICKET_ARCHIVE_AFTER_DAYS || '', 10) || 365;
+const ARCHIVE_BATCH_SIZE = 500;
+
+/**
+ * Comma-separated column list of a table, for INSERT ... SELECT
+ */
+function columnList(table: PgTable) {
+  return sql.raw(
+    Object.values(getTableColumns(table))
+      .map((column) => `"${column.name}"`)
+      .join(', ')
+  );
+}
+
+/**
+ * Move one batch of long-closed tickets into the archive
+ *
+ * Rows are claimed with SKIP LOCKED, copied and deleted in one transaction,
+ * so a ticket is always in exactly one of the two tables. Returns the number
+ * of tickets archived; call repeatedly until it returns 0.
+ */
+export async function archiveClosedTickets(): Promise<number> {
+  return db.transaction(async (tx) => {
+    const claimed = await tx.execute<{ id: string }>(sql`
+      select id from ${tickets}
+      where status = 'closed'
+        and closed_at < now() - make_interval(days => ${ARCHIVE_AFTER_DAYS})
+      order by closed_at
+      limit ${ARCHIVE_BATCH_SIZE}
+      for update skip locked
+    `);
+
+    const ids = Array.from(claimed, (row) => row.id);
+    if (ids.length === 0) {
+      return 0;
+    }
+
+    const idList = sql`${sql.join(ids.map((id) => sql`${id}::uuid`), sql`, `)}`;
+    const historyColumns = columnList(ticketHistories);
+    const ticketColumns = columnList(tickets);
+
+    await tx.execute(sql`
+      insert into ${ticketHistoriesArchive} (${historyColumns})
+      select ${historyColumns} from ${ticketHistories} where ticket_id in (${idList})
+    `);
+    await tx.execute(sql`
+      insert into ${ticketsArchive} (${ticketColumns})
+      select ${ticketColumns} from ${tickets} where id in (${idList})
+    `);
+
+    // Histories go with the ticket (on delete cascade)
+    await tx.execute(sql`delete from ${tickets} where id in (${idList})`);
+
+    return ids.length;
+  });
+}
@@ -1,6 +1,6 @@
 import { db } from '@/lib/db';
 import { users, tickets } from '@/lib/db/schema';
-import { eq, and, isNull, count, ne } from 'drizzle-orm';
+import { eq, and, count, ne, notInArray, asc } from 'drizzle-orm';
 
 /**
  * Get all online agents who are not away
@@ -18,41 +18,38 @@ export async function getAvailableAgents() {
     );
 }
 
+/**
+ * Query for the available agent with the fewest open/in-progress tickets
+ *
+ * One grouped query instead of one count per agent. The result can be
+ * awaited or embedded as a subquery (see createTicket).
+ */
+export function nextAgentQuery() {
+  return db
+    .select({ id: users.id })
+    .from(users)
+    .leftJoin(
+      tickets,
+      and(eq(tickets.agentId, users.id), notInArray(tickets.status, ['closed', 'resolved']))
+    )
+    .where(
+      and(
+        eq(users.role, 'agent'),
+        eq(users.isOnline, true),
+        eq(users.isAway, false)
+      )
+    )
+    .groupBy(users.id)
+    .orderBy(asc(count(tickets.id)))
+    .limit(1);
+}
+
 /**
  * Get agent with least assigned open/in-progress tickets
  */
 export async function getNextAgentByRoundRobin(): Promise<string | null> {
-  const availableAgents = await getAvailableAgents();
-
-  if (availableAgents.length === 0) {
-    return null;
-  }
-
-  // Count open/in_progress tickets for each agent
-  const agentTicketCounts = await Promise.all(
-    availableAgents.map(async (agent) => {
-      const [result] = await db
-        .select({ count: count() })
-        .from(tickets)
-        .where(
-          and(
-            eq(tickets.agentId, agent.id),
-            ne(tickets.status, 'closed'),
-            ne(tickets.status, 'resolved')
-          )
-        );
-
-      return {
-        agentId: agent.id,
-        ticketCount: result?.count || 0,
-      };
-    })
-  );
-
-  // Sort by ticket count (ascending) and return the agent with least tickets
-  agentTicketCounts.sort((a, b) => a.ticketCount - b.ticketCount);
-
-  return agentTicketCounts[0]?.agentId || null;
+  const [agent] = await nextAgentQuery();
+  return agent?.id || null;
 }
 
 /**
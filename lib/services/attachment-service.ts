@@ -0,0 +1,168 @@
+import { db } from '@/lib/db';
+import type { Transaction } from '@/lib/db';
+import { ticketAttachments, allTickets } from '@/lib/db/schema';
+import type { TicketAttachment } from '@/lib/db/schema';
+import type { UserRole } from '@/lib/types';
+import { and, eq, count, sql } from 'drizzle-orm';
+import { unlink } from 'fs/promises';
+import {
+  stageUpload,
+  commitStagedUpload,
+  discardStagedUpload,
+  getContentPath,
+  resolveUploadPath,
+} from '@/lib/upload';
+import { hasTicketAccess } from './ticket-service';
+import { scheduleThumbnails, deleteThumbnails } from './thumbnail-service';
+
+/**
+ * Serialize blob creation and removal for one stored file
+ *
+ * Without it, a delete could remove a blob that a concurrent upload of the
+ * same content has just decided to reuse.
+ */
+async function lockBlob(tx: Transaction, filePath: string): Promise<void> {
+  await tx.execute(sql`select pg_advisory_xact_lock(hashtext(${filePath}))`);
+}
+
+/**
+ * Delete a blob and its thumbnails once no attachment row references it
+ *
+ * Call only after the transaction that removed the last reference has
+ * committed. The check and the unlink run under `lockBlob`, so a concurrent
+ * upload cannot reuse the blob in between; the transaction itself writes
+ * nothing, so nothing is lost if it fails after the unlink.
+ */
+async function removeBlobIfUnreferenced(filePath: string): Promise<void> {
+  const unreferenced = await db.transaction(async (tx) => {
+    await lockBlob(tx, filePath);
+
+    const [{ references }] = await tx
+      .select({ references: count() })
+      .from(ticketAttachments)
+      .where(eq(ticketAttachments.filePath, filePath));
+
+    if (references > 0) {
+      return false;
+    }
+
+    try {
+      await unlink(resolveUploadPath(filePath));
+    } catch (error) {
+      console.error('Error deleting file from filesystem:', error);
+    }
+    return true;
+  });
+
+  if (unreferenced) {
+    try {
+      await deleteThumbnails(filePath);
+    } catch (error) {
+      console.error('Error deleting thumbnails:', error);
+    }
+  }
+}
+
+/**
+ * Get an attachment if the user may access its ticket
+ *
+ * Loads the attachment and the ticket fields needed for the access check in
+ * a single query. Attachments of archived tickets stay downloadable.
+ */
+export async function getAccessibleAttachment(
+  ticketId: string,
+  attachmentId: string,
+  userId: string,
+  role: UserRole
+): Promise<TicketAttachment | null> {
+  const [result] = await db
+    .select({
+      attachment: ticketAttachments,
+      customerId: allTickets.customerId,
+      agentId: allTickets.agentId,
+    })
+    .from(ticketAttachments)
+    .innerJoin(allTickets, eq(ticketAttachments.ticketId, allTickets.id))
+    .where(and(eq(ticketAttachments.id, attachmentId), eq(ticketAttachments.ticketId, ticketId)))
+    .limit(1);
+
+  if (!result || !hasTicketAccess(result, userId, role)) {
+    return null;
+  }
+
+  return result.attachment;
+}
+
+/**
+ * Store an uploaded file and attach it to a ticket
+ *
+ * Identical content is stored once; every attachment row that points to
+ * the same blob counts as a reference.
+ */
+export async function createAttachment(
+  ticketId: string,
+  file: File
+): Promise<{ success: boolean; attachment?: TicketAttachment; error?: string }> {
+  const result = await stageUpload(file);
+  if (!result.success || !result.staged) {
+    return { success: false, error: result.error };
+  }
+
+  const staged = result.staged;
+  // Set once the blob is in the content store
+  let committedPath = null as string | null;
+
+  try {
+    const attachment = await db.transaction(async (tx) => {
+      await lockBlob(tx, getContentPath(staged.contentHash));
+      const filePath = await commitStagedUpload(staged);
+      committedPath = filePath;
+
+      const [newAttachment] = await tx
+        .insert(ticketAttachments)
+        .values({
+          ticketId,
+          fileName: staged.fileName,
+          filePath,
+          fileSize: staged.fileSize,
+          mimeType: file.type,
+        })
+        .returning();
+
+      return newAttachment;
+    });
+
+    // Thumbnails are generated in the background
+    scheduleThumbnails(attachment);
+
+    return { success: true, attachment };
+  } catch (error) {
+    await discardStagedUpload(staged);
+
+    // The insert failed after the blob was stored: don't leave it orphaned
+    if (committedPath) {
+      await removeBlobIfUnreferenced(committedPath).catch((cleanupError) => {
+        console.error('Error removing unreferenced upload:', cleanupError);
+      });
+    }
+
+    throw error;
+  }
+}
+
+/**
+ * Delete an attachment and its blob once no other attachment references it
+ */
+export async function deleteAttachment(attachment: TicketAttachment): Promise<void> {
+  await db.transaction(async (tx) => {
+    await lockBlob(tx, attachment.filePath);
+    await tx.delete(ticketAttachments).where(eq(ticketAttachments.id, attachment.id));
+  });
+
+  // Files are removed only once the row is gone for good
+  try {
+    await removeBlobIfUnreferenced(attachment.filePath);
+  } catch (error) {
+    console.error('Error removing attachment blob:', error);
+  }
+}
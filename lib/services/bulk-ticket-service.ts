@@ -0,0 +1,249 @@
+/**
+ * Bulk Ticket Operations
+ *
+ * Changes the status, assignee or priority of many tickets in one
+ * transaction: the targeted tickets are locked and read with one query,
+ * each is checked individually (access, TICKET_STATUS_FLOW, reopen window),
+ * the valid ones are changed with one set-based UPDATE and all history rows
+ * are written with one insert.
+ */
+
+import { db } from '@/lib/db';
+import { tickets, users } from '@/lib/db/schema';
+import { and, eq, inArray, sql } from 'drizzle-orm';
+import type { PgUpdateSetSource } from 'drizzle-orm/pg-core';
+import { MAX_BULK_TICKETS, TICKET_STATUS_FLOW } from '@/lib/constants';
+import type { TicketBulkUpdateInput } from '@/lib/validations';
+import type { TicketStatus, UserRole } from '@/lib/types';
+import { canReopenTicket, hasTicketAccess } from './ticket-service';
+import { recordHistories } from './history-service';
+
+export type BulkTicketOutcome =
+  | 'updated'
+  | 'unchanged'
+  | 'not_found'
+  | 'invalid_transition';
+
+export interface BulkTicketResult {
+  ticketId: string;
+  outcome: BulkTicketOutcome;
+  oldValue?: string | null;
+  newValue?: string | null;
+  error?: string;
+}
+
+export interface BulkUpdateSummary {
+  results: BulkTicketResult[];
+  updated: number;
+  unchanged: number;
+  failed: number;
+}
+
+type Operation = TicketBulkUpdateInput['operation'];
+
+const OPERATION_FIELDS = {
+  status: 'status',
+  assign: 'agent',
+  priority: 'priority',
+} as const;
+
+interface TargetTicket {
+  id: string;
+  customerId: string;
+  agentId: string | null;
+  status: TicketStatus;
+  priority: string;
+  closedAt: Date | null;
+}
+
+function currentValue(ticket: TargetTicket, operation: Operation): string | null {
+  switch (operation.type) {
+    case 'status':
+      return ticket.status;
+    case 'assign':
+      return ticket.agentId;
+    case 'priority':
+      return ticket.priority;
+  }
+}
+
+function newValue(operation: Operation): string {
+  switch (operation.type) {
+    case 'status':
+      return operation.status;
+    case 'assign':
+      return operation.agentId;
+    case 'priority':
+      return operation.priority;
+  }
+}
+
+/**
+ * Why a status change is not allowed for a ticket, or null if it is
+ */
+function statusTransitionError(ticket: TargetTicket, status: TicketStatus): string | null {
+  if (!TICKET_STATUS_FLOW[ticket.status].includes(status)) {
+    return `'${ticket.status}'에서 '${status}'(으)로 변경할 수 없습니다`;
+  }
+  if (ticket.status === 'closed' && !canReopenTicket(ticket.closedAt)) {
+    return '티켓은 닫힌 후 3일 이내에만 재오픈할 수 있습니다';
+  }
+  return null;
+}
+
+/**
+ * Column changes for the set-based UPDATE
+ *
+ * Resolution fills resolved_at and the resolve SLA per row, like
+ * `updateResolveSLA` does for a single ticket.
+ */
+function updateSet(operation: Operation, now: Date): PgUpdateSetSource<typeof tickets> {
+  switch (operation.type) {
+    case 'assign':
+      return { agentId: operation.agentId, updatedAt: now };
+    case 'priority':
+      return { priority: operation.priority, updatedAt: now };
+    case 'status': {
+      const set: PgUpdateSetSource<typeof tickets> = {
+        status: operation.status,
+        updatedAt: now,
+      };
+      if (operation.status === 'resolved') {
+        set.resolvedAt = now;
+        set.slaResolveMet = sql`case when ${tickets.slaResolveDeadline} is null then null else ${tickets.slaResolveDeadline} >= ${now} end`;
+      } else if (operation.status === 'closed') {
+        set.closedAt = now;
+      } else if (operation.status === 'open') {
+        // Reopen
+        set.closedAt = null;
+      }
+      return set;
+    }
+  }
+}
+
+/**
+ * Apply one operation to many tickets
+ *
+ * Throws 'Forbidden' for customers and 'InvalidAgent' when the assignee is
+ * not an agent. Tickets the user cannot access are reported as not_found,
+ * exactly like the single-ticket routes.
+ */
+export async function bulkUpdateTickets(
+  input: TicketBulkUpdateInput,
+  user: { id: string; role: UserRole }
+): Promise<BulkUpdateSummary> {
+  if (user.role === 'customer') {
+    throw new Error('Forbidden');
+  }
+
+  const { operation } = input;
+
+  if (operation.type === 'assign') {
+    const [agent] = await db
+      .select({ id: users.id })
+      .from(users)
+      .where(and(eq(users.id, operation.agentId), eq(users.role, 'agent')))
+      .limit(1);
+
+    if (!agent) {
+      throw new Error('InvalidAgent');
+    }
+  }
+
+  return db.transaction(async (tx) => {
+    const filter = input.filter ?? {};
+    const selection = input.ticketIds
+      ? inArray(tickets.id, input.ticketIds)
+      : and(
+          filter.status ? eq(tickets.status, filter.status) : undefined,
+          filter.priority ? eq(tickets.priority, filter.priority) : undefined,
+          filter.categoryId ? eq(tickets.categoryId, filter.categoryId) : undefined,
+          filter.agentId ? eq(tickets.agentId, filter.agentId) : undefined,
+          // Agents only ever reach their own tickets
+          user.role === 'agent' ? eq(tickets.agentId, user.id) : undefined
+        );
+
+    // Rows stay locked until commit so the checks below hold for the UPDATE
+    const rows: TargetTicket[] = await tx
+      .select({
+        id: tickets.id,
+        customerId: tickets.customerId,
+        agentId: tickets.agentId,
+        status: tickets.status,
+        priority: tickets.priority,
+        closedAt: tickets.closedAt,
+      })
+      .from(tickets)
+      .where(selection)
+      .orderBy(tickets.id)
+      .limit(MAX_BULK_TICKETS + 1)
+      .for('update');
+
+    if (!input.ticketIds && rows.length > MAX_BULK_TICKETS) {
+      throw new Error('TooManyTickets');
+    }
+
+    const byId = new Map(rows.map((row) => [row.id, row]));
+    const requestedIds = input.ticketIds
+      ? Array.from(new Set(input.ticketIds))
+      : rows.map((row) => row.id);
+    const target = newValue(operation);
+
+    const results: BulkTicketResult[] = [];
+
+    for (const ticketId of requestedIds) {
+      const ticket = byId.get(ticketId);
+      if (!ticket || !hasTicketAccess(ticket, user.id, user.role)) {
+        results.push({ ticketId, outcome: 'not_found', error: '티켓을 찾을 수 없거나 접근 권한이 없습니다' });
+        continue;
+      }
+
+      const oldValue = currentValue(ticket, operation);
+      if (oldValue === target) {
+        results.push({ ticketId, outcome: 'unchanged', oldValue, newValue: target });
+        continue;
+      }
+
+      if (operation.type === 'status') {
+        const error = statusTransitionError(ticket, operation.status);
+        if (error) {
+          results.push({ ticketId, outcome: 'invalid_transition', oldValue, newValue: target, error });
+          continue;
+        }
+      }
+
+      results.push({ ticketId, outcome: 'updated', oldValue, newValue: target });
+    }
+
+    const updated = results.filter((result) => result.outcome === 'updated');
+
+    if (updated.length > 0) {
+      await tx
+        .update(tickets)
+        .set(updateSet(operation, new Date()))
+        .where(inArray(tickets.id, updated.map((result) => result.ticketId)));
+    }
+
+    await recordHistories(
+      updated.map((result) => ({
+        ticketId: result.ticketId,
+        userId: user.id,
+        field: OPERATION_FIELDS[operation.type],
+        oldValue: result.oldValue ?? null,
+        newValue: result.newValue ?? null,
+      })),
+      tx
+    );
+
+    const count = (outcome: BulkTicketOutcome) =>
+      results.filter((result) => result.outcome === outcome).length;
+
+    return {
+      results,
+      updated: updated.length,
+      unchanged: count('unchanged'),
+      failed: count('not_found') + count('invalid_transition'),
+    };
+  });
+}
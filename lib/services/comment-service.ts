@@ -0,0 +1,112 @@
+import { db } from '@/lib/db';
+import { ticketComments, users } from '@/lib/db/schema';
+import type { TicketComment } from '@/lib/db/schema';
+import type { UserRole } from '@/lib/types';
+import { and, count, desc, eq, sql } from 'drizzle-orm';
+
+export const COMMENT_PAGE_SIZE = 30;
+export const MAX_COMMENT_PAGE_SIZE = 100;
+
+export interface CommentAuthor {
+  id: string;
+  name: string;
+  email: string;
+  role: UserRole;
+}
+
+export interface CommentPage {
+  comments: Array<TicketComment & { author: CommentAuthor }>;
+  nextCursor: string | null; // id of the oldest comment in the page
+  hasMore: boolean;
+  total?: number; // only on the first page
+}
+
+/**
+ * Get one page of a ticket's comments, newest first
+ *
+ * Internal notes are filtered in SQL for customers. `before` is the id of
+ * the oldest comment the client already has; the page continues from there
+ * on the (ticket_id, created_at) index. Comments in the page are returned
+ * oldest first, ready to be displayed.
+ */
+export async function getCommentPage(
+  ticketId: string,
+  userRole: UserRole,
+  options: { before?: string | null; limit?: number } = {}
+): Promise<CommentPage> {
+  const limit = Math.min(
+    Math.max(options.limit || COMMENT_PAGE_SIZE, 1),
+    MAX_COMMENT_PAGE_SIZE
+  );
+
+  const visibility =
+    userRole === 'customer' ? eq(ticketComments.isInternal, false) : undefined;
+
+  // Keyset on (created_at, id); the cursor row is looked up by id so that
+  // the comparison uses the stored timestamp at full precision
+  const cursor = options.before
+    ? sql`(${ticketComments.createdAt}, ${ticketComments.id}) < (
+        select c.created_at, c.id from ticket_comments c
+        where c.id = ${options.before} and c.ticket_id = ${ticketId}
+      )`
+    : undefined;
+
+  const [rows, totalResult] = await Promise.all([
+    db
+      .select({
+        comment: ticketComments,
+        author: {
+          id: users.id,
+          name: users.name,
+          email: users.email,
+          role: users.role,
+        },
+      })
+      .from(ticketComments)
+      .innerJoin(users, eq(ticketComments.userId, users.id))
+      .where(and(eq(ticketComments.ticketId, ticketId), visibility, cursor))
+      .orderBy(desc(ticketComments.createdAt), desc(ticketComments.id))
+      .limit(limit + 1),
+    // The total is only needed for the header on first load
+    options.before
+      ? Promise.resolve(null)
+      : db
+          .select({ count: count() })
+          .from(ticketComments)
+          .where(and(eq(ticketComments.ticketId, ticketId), visibility)),
+  ]);
+
+  const hasMore = rows.length > limit;
+  const page = rows.slice(0, limit).reverse();
+
+  return {
+    comments: page.map(({ comment, author }) => ({ ...comment, author })),
+    nextCursor: hasMore ? page[0].comment.id : null,
+    hasMore,
+    total: totalResult ? Number(totalResult[0]?.count || 0) : undefined,
+  };
+}
+
+/**
+ * Get a single comment with its author
+ */
+export async function getCommentWithAuthor(
+  commentId: string
+): Promise<(TicketComment & { author: CommentAuthor }) | null> {
+  const [row] = await db
+    .select({
+      comment: ticketComments,
+      author: {
+        id: users.id,
+        name: users.name,
+        email: users.email,
+        role: users.role,
+      },
+    })
+    .from(ticketComments)
+    .innerJoin(users, eq(ticketComments.userId, users.id))
+    .where(eq(ticketComments.id, commentId))
+    .limit(1);
+
+  return row ? { ...row.comment, author: row.author } : null;
+}
@@ -0,0 +1,167 @@
+/**
+ * Ticket Export
+ *
+ * Streams raw tickets with their SLA fields, agent, category and
+ * satisfaction rating as CSV or NDJSON. Rows are read through a server-side
+ * cursor on the reporting pool and written to the response stream batch by
+ * batch; the cursor only advances when the client has consumed the previous
+ * batch, so memory stays bounded regardless of the date range. Archived
+ * tickets are included.
+ */
+
+import { readClient } from '@/lib/db';
+
+const CURSOR_BATCH_SIZE = 500;
+
+// Exports may legitimately run longer than report queries (ms, 0 = no limit)
+const EXPORT_STATEMENT_TIMEOUT_MS =
+  parseInt(process.env.DB_EXPORT_STATEMENT_TIMEOUT_MS || '', 10) || 10 * 60 * 1000;
+
+export type ExportFormat = 'csv' | 'ndjson';
+
+export interface TicketExportOptions {
+  startDate: string; // YYYY-MM-DD
+  endDate: string; // YYYY-MM-DD (inclusive)
+  format: ExportFormat;
+  gzip?: boolean;
+}
+
+interface TicketExportRow {
+  id: string;
+  title: string;
+  status: string;
+  priority: string;
+  category: string | null;
+  customer_name: string;
+  customer_email: string;
+  agent_name: string | null;
+  agent_email: string | null;
+  created_at: Date;
+  first_response_at: Date | null;
+  resolved_at: Date | null;
+  closed_at: Date | null;
+  sla_response_deadline: Date | null;
+  sla_resolve_deadline: Date | null;
+  sla_response_met: boolean | null;
+  sla_resolve_met: boolean | null;
+  satisfaction_rating: number | null;
+}
+
+const COLUMNS: Array<keyof TicketExportRow> = [
+  'id',
+  'title',
+  'status',
+  'priority',
+  'category',
+  'customer_name',
+  'customer_email',
+  'agent_name',
+  'agent_email',
+  'created_at',
+  'first_response_at',
+  'resolved_at',
+  'closed_at',
+  'sla_response_deadline',
+  'sla_resolve_deadline',
+  'sla_response_met',
+  'sla_resolve_met',
+  'satisfaction_rating',
+];
+
+// ============================================================================
+// Formatting
+// ============================================================================
+
+function csvCell(value: unknown): string {
+  if (value === null || value === undefined) return '';
+  let text = value instanceof Date ? value.toISOString() : String(value);
+
+  // Keep spreadsheet applications from evaluating user-provided text
+  if (typeof value === 'string' && /^[=+\-@\t\r]/.test(text)) {
+    text = `'${text}`;
+  }
+
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+function formatRow(row: TicketExportRow, format: ExportFormat): string {
+  if (format === 'ndjson') {
+    return JSON.stringify(row) + '\n';
+  }
+  return COLUMNS.map((column) => csvCell(row[column])).join(',') + '\r\n';
+}
+
+// ============================================================================
+// Streaming
+// ============================================================================
+
+async function writeTickets(
+  writer: WritableStreamDefaultWriter<string>,
+  options: TicketExportOptions
+): Promise<void> {
+  await readClient.begin(async (tx) => {
+    await tx.unsafe(`set local statement_timeout = ${EXPORT_STATEMENT_TIMEOUT_MS}`);
+
+    if (options.format === 'csv') {
+      // BOM so that spreadsheet applications detect UTF-8 (Korean text)
+      await writer.write('\uFEFF' + COLUMNS.join(',') + '\r\n');
+    }
+
+    const cursor = tx<TicketExportRow[]>`
+      select
+        t.id,
+        t.title,
+        t.status,
+        t.priority,
+        c.name as category,
+        cu.name as customer_name,
+        cu.email as customer_email,
+        a.name as agent_name,
+        a.email as agent_email,
+        t.created_at,
+        t.first_response_at,
+        t.resolved_at,
+        t.closed_at,
+        t.sla_response_deadline,
+        t.sla_resolve_deadline,
+        t.sla_response_met,
+        t.sla_resolve_met,
+        cs.rating as satisfaction_rating
+      from all_tickets t
+      inner join users cu on cu.id = t.customer_id
+      left join users a on a.id = t.agent_id
+      left join categories c on c.id = t.category_id
+      left join customer_satisfactions cs on cs.ticket_id = t.id
+      where t.created_at >= ${options.startDate}::date
+        and t.created_at < ${options.endDate}::date + 1
+      order by t.created_at, t.id
+    `.cursor(CURSOR_BATCH_SIZE);
+
+    for await (const rows of cursor) {
+      // Waits until the client has read enough (backpressure)
+      await writer.write(rows.map((row) => formatRow(row, options.format)).join(''));
+    }
+  });
+}
+
+/**
+ * Stream the tickets created in a date range
+ *
+ * If the client disconnects, the pending write fails, which closes the
+ * cursor and releases the connection.
+ */
+export function streamTicketExport(options: TicketExportOptions): ReadableStream<Uint8Array> {
+  const encoder = new TextEncoderStream();
+  const writer = encoder.writable.getWriter();
+
+  writeTickets(writer, options)
+    .then(() => writer.close())
+    .catch((error) => {
+      console.error('Ticket export failed:', error);
+      writer.abort(error).catch(() => {});
+    });
+
+  return options.gzip
+    ? encoder.readable.pipeThrough(new CompressionStream('gzip'))
+    : encoder.readable;
+}
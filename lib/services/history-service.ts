@@ -1,4 +1,5 @@
 import { db } from '@/lib/db';
+import type { Transaction } from '@/lib/db';
 import { ticketHistories } from '@/lib/db/schema';
 
 /**
@@ -21,7 +22,9 @@ export async function recordHistory(params: {
 }
 
 /**
- * Record multiple history entries
+ * Record multiple history entries in a single insert
+ *
+ * Pass a transaction to make the entries part of a larger change.
  */
 export async function recordHistories(
   entries: Array<{
@@ -30,8 +33,9 @@ export async function recordHistories(
     field: string;
     oldValue: string | null;
     newValue: string | null;
-  }>
+  }>,
+  executor: typeof db | Transaction = db
 ): Promise<void> {
   if (entries.length === 0) return;
-  await db.insert(ticketHistories).values(entries);
+  await executor.insert(ticketHistories).values(entries);
 }
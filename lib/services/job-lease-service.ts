@@ -0,0 +1,116 @@
+/**
+ * Job Leases
+ *
+ * Keeps singleton background jobs (the SLA sweep) from running on several
+ * instances at once. A runner claims a row in job_leases that expires after
+ * a TTL and extends it with a heartbeat while it works; another runner can
+ * only claim the job after the lease has expired, so a crashed runner is
+ * replaced within one TTL.
+ *
+ * A lease row is used instead of a session advisory lock because advisory
+ * locks do not survive a transaction-mode pooler (PgBouncer) handing the
+ * session to another client.
+ */
+
+import { randomUUID } from 'crypto';
+import { db } from '@/lib/db';
+import { sql } from 'drizzle-orm';
+
+const DEFAULT_LEASE_TTL_MS = 2 * 60 * 1000; // 2 minutes
+
+export interface LeaseContext {
+  holder: string;
+  // Aborted when a heartbeat finds the lease taken over; stop at the next safe point
+  signal: AbortSignal;
+}
+
+export type LeaseResult<T> =
+  | { acquired: true; result: T }
+  | { acquired: false; holder: string | null; expiresAt: Date | null };
+
+async function acquireLease(name: string, holder: string, ttlMs: number): Promise<boolean> {
+  const claimed = await db.execute<{ holder: string }>(sql`
+    insert into job_leases (name, holder, acquired_at, expires_at)
+    values (${name}, ${holder}, now(), now() + make_interval(secs => ${ttlMs / 1000}))
+    on conflict (name) do update
+      set holder = excluded.holder,
+          acquired_at = excluded.acquired_at,
+          expires_at = excluded.expires_at
+      where job_leases.expires_at < now()
+    returning holder
+  `);
+  return claimed.length > 0;
+}
+
+async function renewLease(name: string, holder: string, ttlMs: number): Promise<boolean> {
+  const renewed = await db.execute<{ holder: string }>(sql`
+    update job_leases
+    set expires_at = now() + make_interval(secs => ${ttlMs / 1000})
+    where name = ${name} and holder = ${holder}
+    returning holder
+  `);
+  return renewed.length > 0;
+}
+
+async function releaseLease(name: string, holder: string): Promise<void> {
+  await db.execute(sql`
+    delete from job_leases where name = ${name} and holder = ${holder}
+  `);
+}
+
+async function getLeaseHolder(name: string) {
+  const rows = await db.execute<{ holder: string; expires_at: Date }>(sql`
+    select holder, expires_at from job_leases where name = ${name}
+  `);
+  const row = rows[0];
+  return {
+    holder: row?.holder ?? null,
+    expiresAt: row ? new Date(row.expires_at) : null,
+  };
+}
+
+/**
+ * Run `job` only if no other runner holds the lease `name`
+ *
+ * The lease is renewed every third of `ttlMs` while the job runs and
+ * released when it finishes. If a renewal finds the lease gone (the runner
+ * stalled past the TTL and was replaced), `signal` is aborted.
+ */
+export async function runWithLease<T>(
+  name: string,
+  job: (lease: LeaseContext) => Promise<T>,
+  options: { ttlMs?: number } = {}
+): Promise<LeaseResult<T>> {
+  const ttlMs = options.ttlMs ?? DEFAULT_LEASE_TTL_MS;
+  const holder = randomUUID();
+
+  if (!(await acquireLease(name, holder, ttlMs))) {
+    return { acquired: false, ...(await getLeaseHolder(name)) };
+  }
+
+  const controller = new AbortController();
+  const heartbeat = setInterval(() => {
+    renewLease(name, holder, ttlMs)
+      .then((renewed) => {
+        if (!renewed) {
+          console.warn(`Lease "${name}" was taken over; stopping`);
+          controller.abort();
+        }
+      })
+      .catch((error) => {
+        // Keep working; the next heartbeat retries before the lease expires
+        console.error(`Failed to renew lease "${name}":`, error);
+      });
+  }, Math.max(Math.floor(ttlMs / 3), 1000));
+
+  try {
+    const result = await job({ holder, signal: controller.signal });
+    return { acquired: true, result };
+  } finally {
+    clearInterval(heartbeat);
+    await releaseLease(name, holder).catch((error) => {
+      // The lease simply expires
+      console.error(`Failed to release lease "${name}":`, error);
+    });
+  }
+}
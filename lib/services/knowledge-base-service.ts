@@ -0,0 +1,370 @@
+/**
+ * Knowledge Base Retrieval Service
+ *
+ * Keeps an in-memory BM25 index over active knowledge base articles so that
+ * answer generation can pick the most relevant passages without a database
+ * round trip per request. The index is loaded lazily on first use and kept
+ * up to date by the /api/knowledge-base routes.
+ */
+
+import { db } from '@/lib/db';
+import { knowledgeBases } from '@/lib/db/schema';
+import { eq } from 'drizzle-orm';
+import { estimateTokens } from '@/lib/ai/prompts';
+
+// ============================================================================
+// Configuration
+// ============================================================================
+
+const BM25_K1 = 1.2;
+const BM25_B = 0.75;
+const CATEGORY_BOOST = 1.5;
+const MAX_PASSAGE_CHARS = 800;
+// Full reload interval so that writes made on other instances are picked up
+const INDEX_REFRESH_INTERVAL = 10 * 60 * 1000; // 10 minutes
+
+// ============================================================================
+// Type Definitions
+// ============================================================================
+
+export interface KnowledgeBaseDocument {
+  id: string;
+  title: string;
+  content: string;
+  categoryId: string | null;
+  isActive: boolean;
+}
+
+export interface KnowledgeBasePassage {
+  kbId: string;
+  title: string;
+  content: string;
+  categoryId: string | null;
+  score: number;
+  tokens: number;
+}
+
+export interface KnowledgeBaseSearchOptions {
+  categoryId?: string | null;
+  limit?: number;
+  tokenBudget?: number;
+}
+
+interface IndexedPassage {
+  key: string;
+  kbId: string;
+  title: string;
+  content: string;
+  categoryId: string | null;
+  length: number;
+  termFrequencies: Map<string, number>;
+  tokens: number;
+}
+
+// ============================================================================
+// Tokenization
+// ============================================================================
+
+/**
+ * Split text into lowercase search terms
+ *
+ * Hangul words are additionally split into character bigrams so that
+ * particles (e.g. "로그인이", "로그인을") still match the base word.
+ */
+export function tokenize(text: string): string[] {
+  const words = text
+    .toLowerCase()
+    .split(/[^a-z0-9가-힣]+/)
+    .filter((word) => word.length > 0);
+
+  const terms: string[] = [];
+  for (const word of words) {
+    if (/[가-힣]/.test(word) && word.length > 2) {
+      for (let i = 0; i < word.length - 1; i++) {
+        terms.push(word.slice(i, i + 2));
+      }
+    } else if (word.length > 1 || /[가-힣]/.test(word)) {
+      terms.push(word);
+    }
+  }
+  return terms;
+}
+
+/**
+ * Split an article into passages of at most MAX_PASSAGE_CHARS characters
+ */
+function splitIntoPassages(content: string): string[] {
+  const paragraphs = content
+    .split(/\n\s*\n/)
+    .map((p) => p.trim())
+    .filter((p) => p.length > 0);
+
+  const passages: string[] = [];
+  let current = '';
+
+  for (const paragraph of paragraphs) {
+    if (current && current.length + paragraph.length + 2 > MAX_PASSAGE_CHARS) {
+      passages.push(current);
+      current = '';
+    }
+
+    if (paragraph.length > MAX_PASSAGE_CHARS) {
+      for (let i = 0; i < paragraph.length; i += MAX_PASSAGE_CHARS) {
+        passages.push(paragraph.slice(i, i + MAX_PASSAGE_CHARS));
+      }
+      continue;
+    }
+
+    current = current ? `${current}\n\n${paragraph}` : paragraph;
+  }
+
+  if (current) {
+    passages.push(current);
+  }
+
+  return passages;
+}
+
+// ============================================================================
+// Index
+// ============================================================================
+
+class KnowledgeBaseIndex {
+  private passages = new Map<string, IndexedPassage>();
+  private passageKeysByKb = new Map<string, string[]>();
+  private postings = new Map<string, Set<string>>();
+  private totalLength = 0;
+
+  get size(): number {
+    return this.passages.size;
+  }
+
+  clear() {
+    this.passages.clear();
+    this.passageKeysByKb.clear();
+    this.postings.clear();
+    this.totalLength = 0;
+  }
+
+  upsert(doc: KnowledgeBaseDocument) {
+    this.remove(doc.id);
+
+    if (!doc.isActive) {
+      return;
+    }
+
+    const keys: string[] = [];
+    splitIntoPassages(doc.content).forEach((content, index) => {
+      const key = `${doc.id}:${index}`;
+      // Title terms are indexed with every passage of the article
+      const terms = tokenize(`${doc.title} ${content}`);
+      const termFrequencies = new Map<string, number>();
+      for (const term of terms) {
+        termFrequencies.set(term, (termFrequencies.get(term) || 0) + 1);
+      }
+
+      for (const term of termFrequencies.keys()) {
+        let posting = this.postings.get(term);
+        if (!posting) {
+          posting = new Set();
+          this.postings.set(term, posting);
+        }
+        posting.add(key);
+      }
+
+      this.passages.set(key, {
+        key,
+        kbId: doc.id,
+        title: doc.title,
+        content,
+        categoryId: doc.categoryId,
+        length: terms.length,
+        termFrequencies,
+        tokens: estimateTokens(`${doc.title}\n${content}`),
+      });
+      this.totalLength += terms.length;
+      keys.push(key);
+    });
+
+    this.passageKeysByKb.set(doc.id, keys);
+  }
+
+  remove(kbId: string) {
+    const keys = this.passageKeysByKb.get(kbId);
+    if (!keys) {
+      return;
+    }
+
+    for (const key of keys) {
+      const passage = this.passages.get(key);
+      if (!passage) continue;
+
+      for (const term of passage.termFrequencies.keys()) {
+        const posting = this.postings.get(term);
+        posting?.delete(key);
+        if (posting && posting.size === 0) {
+          this.postings.delete(term);
+        }
+      }
+
+      this.totalLength -= passage.length;
+      this.passages.delete(key);
+    }
+
+    this.passageKeysByKb.delete(kbId);
+  }
+
+  search(query: string, categoryId: string | null | undefined): Array<{ passage: IndexedPassage; score: number }> {
+    const passageCount = this.passages.size;
+    if (passageCount === 0) {
+      return [];
+    }
+
+    const avgLength = this.totalLength / passageCount || 1;
+    const queryTerms = new Set(tokenize(query));
+    const scores = new Map<string, number>();
+
+    for (const term of queryTerms) {
+      const posting = this.postings.get(term);
+      if (!posting) continue;
+
+      const idf = Math.log(1 + (passageCount - posting.size + 0.5) / (posting.size + 0.5));
+
+      for (const key of posting) {
+        const passage = this.passages.get(key)!;
+        const tf = passage.termFrequencies.get(term) || 0;
+        const norm = tf + BM25_K1 * (1 - BM25_B + (BM25_B * passage.length) / avgLength);
+        scores.set(key, (scores.get(key) || 0) + idf * ((tf * (BM25_K1 + 1)) / norm));
+      }
+    }
+
+    return Array.from(scores.entries())
+      .map(([key, score]) => {
+        const passage = this.passages.get(key)!;
+        const boosted =
+          categoryId && passage.categoryId === categoryId ? score * CATEGORY_BOOST : score;
+        return { passage, score: boosted };
+      })
+      .sort((a, b) => b.score - a.score);
+  }
+}
+
+// Index singleton
+const index = new KnowledgeBaseIndex();
+let loadedAt = 0;
+let loading: Promise<void> | null = null;
+
+/**
+ * Load all active knowledge base articles into the index
+ */
+async function loadIndex(): Promise<void> {
+  const rows = await db
+    .select({
+      id: knowledgeBases.id,
+      title: knowledgeBases.title,
+      content: knowledgeBases.content,
+      categoryId: knowledgeBases.categoryId,
+      isActive: knowledgeBases.isActive,
+    })
+    .from(knowledgeBases)
+    .where(eq(knowledgeBases.isActive, true));
+
+  index.clear();
+  rows.forEach((row) => index.upsert(row));
+  loadedAt = Date.now();
+}
+
+/**
+ * Make sure the index is loaded and not older than the refresh interval
+ */
+async function ensureIndex(): Promise<void> {
+  if (loadedAt && Date.now() - loadedAt < INDEX_REFRESH_INTERVAL) {
+    return;
+  }
+
+  if (!loading) {
+    loading = loadIndex().finally(() => {
+      loading = null;
+    });
+  }
+
+  await loading;
+}
+
+// ============================================================================
+// Public API
+// ============================================================================
+
+/**
+ * Add or replace a knowledge base article in the index
+ *
+ * Inactive articles are removed. Call after a knowledge base row is written.
+ */
+export function indexKnowledgeBase(doc: KnowledgeBaseDocument): void {
+  applyWhenLoaded(() => index.upsert(doc));
+}
+
+/**
+ * Remove a knowledge base article from the index
+ */
+export function removeKnowledgeBaseFromIndex(kbId: string): void {
+  applyWhenLoaded(() => index.remove(kbId));
+}
+
+/**
+ * Apply an incremental change, re-applying it after an in-flight load
+ */
+function applyWhenLoaded(change: () => void): void {
+  if (loading) {
+    // The rows being loaded may predate this write
+    loading.then(change, () => undefined);
+    return;
+  }
+  if (!loadedAt) {
+    return; // Not loaded yet - the first search will load the latest rows
+  }
+  change();
+}
+
+/**
+ * Drop the index so that the next search reloads it from the database
+ */
+export function invalidateKnowledgeBaseIndex(): void {
+  index.clear();
+  loadedAt = 0;
+}
+
+/**
+ * Find the knowledge base passages most relevant to a query
+ *
+ * Passages from the given category are boosted. At most `limit` passages are
+ * returned and their combined estimated size stays within `tokenBudget`.
+ */
+export async function searchKnowledgeBase(
+  query: string,
+  options: KnowledgeBaseSearchOptions = {}
+): Promise<KnowledgeBasePassage[]> {
+  const { categoryId, limit = 3, tokenBudget = 1500 } = options;
+
+  await ensureIndex();
+
+  const results: KnowledgeBasePassage[] = [];
+  let usedTokens = 0;
+
+  for (const { passage, score } of index.search(query, categoryId)) {
+    if (results.length >= limit) break;
+    if (usedTokens + passage.tokens > tokenBudget) continue;
+
+    results.push({
+      kbId: passage.kbId,
+      title: passage.title,
+      content: passage.content,
+      categoryId: passage.categoryId,
+      score,
+      tokens: passage.tokens,
+    });
+    usedTokens += passage.tokens;
+  }
+
+  return results;
+}
@@ -1,13 +1,6 @@
-import { render } from '@react-email/components';
-import { sendEmail } from '@/lib/email';
-import { TicketCreatedEmail } from '@/lib/email/templates/ticket-created';
-import { TicketReplyEmail } from '@/lib/email/templates/ticket-reply';
-import { SLAWarningEmail } from '@/lib/email/templates/sla-warning';
-import { SLAViolatedEmail } from '@/lib/email/templates/sla-violated';
+import { sendEmail, renderEmail } from '@/lib/email';
 import { getMinutesUntilDeadline, getMinutesOverdue } from './sla-service';
-import { db } from '@/lib/db';
-import { users } from '@/lib/db/schema';
-import { eq } from 'drizzle-orm';
+import { getManagerRoster } from './reference-data-service';
 
 const APP_URL = process.env.NEXT_PUBLIC_APP_URL || 'http://localhost:3000';
 
@@ -32,16 +25,14 @@ export async function sendTicketCreatedNotification({
   try {
     const ticketUrl = `${APP_URL}/tickets/${ticketId}`;
 
-    const emailHtml = await render(
-      TicketCreatedEmail({
-        ticketId,
-        ticketTitle,
-        customerName,
-        priority,
-        category,
-        ticketUrl,
-      })
-    );
+    const emailHtml = await renderEmail('ticketCreated', {
+      ticketId,
+      ticketTitle,
+      customerName,
+      priority,
+      category,
+      ticketUrl,
+    });
 
     const success = await sendEmail({
       to: agentEmail,
@@ -77,16 +68,14 @@ export async function sendTicketReplyNotification({
   try {
     const ticketUrl = `${APP_URL}/tickets/${ticketId}`;
 
-    const emailHtml = await render(
-      TicketReplyEmail({
-        ticketId,
-        ticketTitle,
-        replierName,
-        replyContent,
-        ticketUrl,
-        recipientName,
-      })
-    );
+    const emailHtml = await renderEmail('ticketReply', {
+      ticketId,
+      ticketTitle,
+      replierName,
+      replyContent,
+      ticketUrl,
+      recipientName,
+    });
 
     const success = await sendEmail({
       to: recipientEmail,
@@ -128,16 +117,14 @@ export async function sendSLAWarningNotification({
       return false;
     }
 
-    const emailHtml = await render(
-      SLAWarningEmail({
-        ticketId,
-        ticketTitle,
-        agentName,
-        slaType,
-        minutesRemaining,
-        ticketUrl,
-      })
-    );
+    const emailHtml = await renderEmail('slaWarning', {
+      ticketId,
+      ticketTitle,
+      agentName,
+      slaType,
+      minutesRemaining,
+      ticketUrl,
+    });
 
     const slaTypeText = slaType === 'response' ? '응답' : '해결';
     const success = await sendEmail({
@@ -170,11 +157,8 @@ export async function sendSLAViolationNotification({
   deadline: Date;
 }): Promise<boolean> {
   try {
-    // Get all managers and admins
-    const managers = await db.query.users.findMany({
-      where: (users, { or, eq }) =>
-        or(eq(users.role, 'manager'), eq(users.role, 'admin')),
-    });
+    // Get all managers and admins (cached roster)
+    const managers = await getManagerRoster();
 
     if (managers.length === 0) {
       console.warn('No managers found to send SLA violation notification');
@@ -190,17 +174,15 @@ export async function sendSLAViolationNotification({
     // Send to all managers
     for (const manager of managers) {
       try {
-        const emailHtml = await render(
-          SLAViolatedEmail({
-            ticketId,
-            ticketTitle,
-            agentName,
-            slaType,
-            violatedBy,
-            ticketUrl,
-            managerName: manager.name,
-          })
-        );
+        const emailHtml = await renderEmail('slaViolated', {
+          ticketId,
+          ticketTitle,
+          agentName,
+          slaType,
+          violatedBy,
+          ticketUrl,
+          managerName: manager.name,
+        });
 
         const success = await sendEmail({
           to: manager.email,
@@ -223,6 +205,123 @@ export async function sendSLAViolationNotification({
   }
 }
 
+export interface SLANotificationTicket {
+  ticketId: string;
+  ticketTitle: string;
+  slaType: 'response' | 'resolve';
+  deadline: Date;
+}
+
+/**
+ * Send one SLA warning email listing all of an agent's at-risk tickets
+ *
+ * Returns the tickets included in the digest (those still before their
+ * deadline), or null if the email could not be sent.
+ */
+export async function sendSLAWarningDigest({
+  agentName,
+  agentEmail,
+  tickets,
+}: {
+  agentName: string;
+  agentEmail: string;
+  tickets: SLANotificationTicket[];
+}): Promise<SLANotificationTicket[] | null> {
+  try {
+    const due = tickets
+      .map((ticket) => ({ ticket, minutesRemaining: getMinutesUntilDeadline(ticket.deadline) }))
+      // Only include tickets that still have time remaining
+      .filter(({ minutesRemaining }) => minutesRemaining > 0)
+      .sort((a, b) => a.minutesRemaining - b.minutesRemaining);
+
+    if (due.length === 0) {
+      return [];
+    }
+
+    const emailHtml = await renderEmail('slaWarningDigest', {
+      agentName,
+      items: due.map(({ ticket, minutesRemaining }) => ({
+        ticketId: ticket.ticketId,
+        ticketTitle: ticket.ticketTitle,
+        slaType: ticket.slaType,
+        minutesRemaining,
+        ticketUrl: `${APP_URL}/tickets/${ticket.ticketId}`,
+      })),
+      ticketsUrl: `${APP_URL}/tickets`,
+    });
+
+    const first = due[0].ticket;
+    const subject =
+      due.length === 1
+        ? `[SLA 경고] ${first.slaType === 'response' ? '응답' : '해결'} SLA 마감 임박 - ${first.ticketTitle}`
+        : `[SLA 경고] SLA 마감 임박 티켓 ${due.length}건`;
+
+    const success = await sendEmail({ to: agentEmail, subject, html: emailHtml });
+
+    return success ? due.map(({ ticket }) => ticket) : null;
+  } catch (error) {
+    console.error('Error sending SLA warning digest:', error);
+    return null;
+  }
+}
+
+/**
+ * Send one SLA violation email per manager listing every violation of a sweep
+ *
+ * The digest is rendered once and the same message goes to each manager.
+ */
+export async function sendSLAViolationDigest(
+  tickets: Array<SLANotificationTicket & { agentName: string }>
+): Promise<boolean> {
+  if (tickets.length === 0) {
+    return true;
+  }
+
+  try {
+    // Get all managers and admins (cached roster)
+    const managers = await getManagerRoster();
+
+    if (managers.length === 0) {
+      console.warn('No managers found to send SLA violation digest');
+      return false;
+    }
+
+    const items = tickets
+      .map((ticket) => ({
+        ticketId: ticket.ticketId,
+        ticketTitle: ticket.ticketTitle,
+        agentName: ticket.agentName,
+        slaType: ticket.slaType,
+        violatedBy: getMinutesOverdue(ticket.deadline),
+        ticketUrl: `${APP_URL}/tickets/${ticket.ticketId}`,
+      }))
+      .sort((a, b) => b.violatedBy - a.violatedBy);
+
+    const emailHtml = await renderEmail('slaViolatedDigest', {
+      items,
+      ticketsUrl: `${APP_URL}/tickets`,
+    });
+    const subject = `[SLA 위반] SLA 초과 티켓 ${items.length}건`;
+
+    let successCount = 0;
+
+    // Send to all managers
+    for (const manager of managers) {
+      const success = await sendEmail({ to: manager.email, subject, html: emailHtml });
+      if (success) {
+        successCount++;
+      } else {
+        console.error(`Error sending SLA violation digest to ${manager.email}`);
+      }
+    }
+
+    return successCount > 0;
+  } catch (error) {
+    console.error('Error sending SLA violation digest:', error);
+    return false;
+  }
+}
+
 /**
  * Send status change notification to customer
  */
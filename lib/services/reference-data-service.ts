@@ -0,0 +1,203 @@
+/**
+ * Reference Data Cache
+ *
+ * Process-wide cache for small, rarely changing tables that are read on hot
+ * paths: categories, AI prompt templates and the manager/admin roster.
+ *
+ * Each entry carries a version. Writers call `invalidateReferenceData`, which
+ * bumps the version locally and broadcasts the change with Postgres NOTIFY so
+ * that other instances drop their copy as well. A TTL bounds staleness if a
+ * notification is missed.
+ */
+
+import { randomUUID } from 'crypto';
+import { db, client, listenClient } from '@/lib/db';
+import { categories, aiPromptTemplates, users } from '@/lib/db/schema';
+import { inArray } from 'drizzle-orm';
+import type { Category, AIPromptTemplate } from '@/lib/db/schema';
+
+const CACHE_TTL = 5 * 60 * 1000; // 5 minutes
+const NOTIFY_CHANNEL = 'reference_data_changed';
+const INSTANCE_ID = randomUUID();
+
+export type ReferenceDataKind = 'categories' | 'promptTemplates' | 'managers';
+
+export interface ManagerContact {
+  id: string;
+  name: string;
+  email: string;
+  role: 'manager' | 'admin';
+}
+
+interface CacheEntry<T> {
+  version: number;
+  value?: T;
+  loadedAt: number;
+  loading?: Promise<T>;
+}
+
+interface ReferenceData {
+  categories: { list: Category[]; byId: Map<string, Category> };
+  promptTemplates: Map<string, AIPromptTemplate>;
+  managers: ManagerContact[];
+}
+
+const loaders: { [K in ReferenceDataKind]: () => Promise<ReferenceData[K]> } = {
+  categories: async () => {
+    const list = await db
+      .select()
+      .from(categories)
+      .orderBy(categories.sortOrder, categories.name);
+    return { list, byId: new Map(list.map((c) => [c.id, c])) };
+  },
+  promptTemplates: async () => {
+    const templates = await db.select().from(aiPromptTemplates);
+    return new Map(
+      templates
+        .filter((t) => t.categoryId !== null)
+        .map((t) => [t.categoryId as string, t])
+    );
+  },
+  managers: async () => {
+    const managers = await db
+      .select({ id: users.id, name: users.name, email: users.email, role: users.role })
+      .from(users)
+      .where(inArray(users.role, ['manager', 'admin']));
+    return managers as ManagerContact[];
+  },
+};
+
+const cache: { [K in ReferenceDataKind]: CacheEntry<ReferenceData[K]> } = {
+  categories: { version: 0, loadedAt: 0 },
+  promptTemplates: { version: 0, loadedAt: 0 },
+  managers: { version: 0, loadedAt: 0 },
+};
+
+// ============================================================================
+// Cross-instance invalidation
+// ============================================================================
+
+let listening: Promise<void> | null = null;
+
+/**
+ * Subscribe to invalidations from other instances (once per process)
+ */
+function ensureListening(): void {
+  if (listening) return;
+
+  // No listener behind a transaction pooler without DATABASE_DIRECT_URL
+  // (logged by lib/db); TTL expiry only
+  if (!listenClient) {
+    listening = Promise.resolve();
+    return;
+  }
+
+  listening = listenClient
+    .listen(NOTIFY_CHANNEL, (payload) => {
+      const [sender, kind] = payload.split(':');
+      if (sender !== INSTANCE_ID && kind in cache) {
+        invalidateLocal(kind as ReferenceDataKind);
+      }
+    })
+    .then(() => undefined)
+    .catch((error) => {
+      // Fall back to TTL expiry only
+      console.error('Failed to listen for reference data changes:', error);
+    });
+}
+
+function invalidateLocal(kind: ReferenceDataKind): void {
+  const entry = cache[kind];
+  entry.version++;
+  entry.value = undefined;
+  entry.loading = undefined;
+  entry.loadedAt = 0;
+}
+
+/**
+ * Invalidate cached reference data on this and all other instances
+ *
+ * Call after writing to the underlying table.
+ */
+export async function invalidateReferenceData(...kinds: ReferenceDataKind[]): Promise<void> {
+  for (const kind of kinds) {
+    invalidateLocal(kind);
+    try {
+      await client.notify(NOTIFY_CHANNEL, `${INSTANCE_ID}:${kind}`);
+    } catch (error) {
+      console.error(`Failed to broadcast ${kind} invalidation:`, error);
+    }
+  }
+}
+
+// ============================================================================
+// Cached reads
+// ============================================================================
+
+async function getReferenceData<K extends ReferenceDataKind>(kind: K): Promise<ReferenceData[K]> {
+  ensureListening();
+
+  const entry = cache[kind] as CacheEntry<ReferenceData[K]>;
+
+  if (entry.value !== undefined && Date.now() - entry.loadedAt < CACHE_TTL) {
+    return entry.value;
+  }
+
+  let loading = entry.loading;
+
+  if (!loading) {
+    const version = entry.version;
+    const pending = loaders[kind]() as Promise<ReferenceData[K]>;
+    entry.loading = loading = pending;
+
+    pending
+      .then((value) => {
+        // Discard the result if the entry was invalidated while loading
+        if (entry.version === version) {
+          entry.value = value;
+          entry.loadedAt = Date.now();
+        }
+      })
+      .catch(() => undefined)
+      .finally(() => {
+        if (entry.loading === pending) {
+          entry.loading = undefined;
+        }
+      });
+  }
+
+  return loading;
+}
+
+/**
+ * Get active categories ordered by sort order
+ */
+export async function getActiveCategories(): Promise<Category[]> {
+  const { list } = await getReferenceData('categories');
+  return list.filter((c) => c.isActive);
+}
+
+/**
+ * Get a category by ID (active or not)
+ */
+export async function getCachedCategory(categoryId: string): Promise<Category | null> {
+  const { byId } = await getReferenceData('categories');
+  return byId.get(categoryId) || null;
+}
+
+/**
+ * Get the AI prompt template for a category
+ */
+export async function getPromptTemplateForCategory(
+  categoryId: string
+): Promise<AIPromptTemplate | null> {
+  const templates = await getReferenceData('promptTemplates');
+  return templates.get(categoryId) || null;
+}
+
+/**
+ * Get all managers and admins (SLA violation recipients)
+ */
+export async function getManagerRoster(): Promise<ManagerContact[]> {
+  return getReferenceData('managers');
+}
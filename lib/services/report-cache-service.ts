@@ -0,0 +1,188 @@
+/**
+ * Report Result Cache
+ *
+ * Caches computed report payloads per (report, date range) for a short TTL
+ * and derives an ETag from each payload so clients can revalidate with
+ * If-None-Match.
+ *
+ * The cache is dropped whenever a rollup refresh finds changed tickets or
+ * ratings (ticket writes mark their day dirty). Refreshing instances
+ * broadcast this with Postgres NOTIFY so that the caches of other instances
+ * are dropped too.
+ *
+ * Report reads never write: rollups are rebuilt by the report-rollups cron
+ * job and by a background refresh that a read starts at most once per
+ * interval, under the same lease as the cron job.
+ */
+
+import { createHash, randomUUID } from 'crypto';
+import { after } from 'next/server';
+import { client, listenClient } from '@/lib/db';
+import { runWithLease } from './job-lease-service';
+import { REPORT_ROLLUP_LEASE, refreshAllReportRollups } from './report-rollup-service';
+import type { ReportDateRange } from './report-rollup-service';
+
+const CACHE_TTL = 60 * 1000; // 1 minute
+const MAX_ENTRIES = 200;
+const NOTIFY_CHANNEL = 'report_data_changed';
+const INSTANCE_ID = randomUUID();
+const BACKGROUND_REFRESH_INTERVAL = 60 * 1000; // 1 minute
+
+// Browsers keep the response but revalidate it with If-None-Match every time
+export const REPORT_CACHE_CONTROL = 'private, no-cache';
+
+interface CachedReport {
+  generation: number;
+  expiresAt: number;
+  value: Promise<{ data: unknown; etag: string }>;
+}
+
+const entries = new Map<string, CachedReport>();
+let generation = 0;
+
+// ============================================================================
+// Invalidation
+// ============================================================================
+
+let listening: Promise<void> | null = null;
+
+/**
+ * Subscribe to invalidations from other instances (once per process)
+ */
+function ensureListening(): void {
+  if (listening) return;
+
+  // No listener behind a transaction pooler without DATABASE_DIRECT_URL
+  // (logged by lib/db); TTL expiry only
+  if (!listenClient) {
+    listening = Promise.resolve();
+    return;
+  }
+
+  listening = listenClient
+    .listen(NOTIFY_CHANNEL, (sender) => {
+      if (sender !== INSTANCE_ID) {
+        invalidateLocal();
+      }
+    })
+    .then(() => undefined)
+    .catch((error) => {
+      // Fall back to TTL expiry only
+      console.error('Failed to listen for report data changes:', error);
+    });
+}
+
+function invalidateLocal(): void {
+  generation++;
+  entries.clear();
+}
+
+/**
+ * Drop cached reports on this and all other instances
+ */
+export async function invalidateReportCache(): Promise<void> {
+  invalidateLocal();
+  try {
+    await client.notify(NOTIFY_CHANNEL, INSTANCE_ID);
+  } catch (error) {
+    console.error('Failed to broadcast report cache invalidation:', error);
+  }
+}
+
+// ============================================================================
+// Background refresh
+// ============================================================================
+
+let lastBackgroundRefresh = 0;
+
+/**
+ * Start a rollup refresh off the request path, at most once per interval
+ * per instance; skipped if another instance (or the cron job) holds the lease
+ */
+function scheduleRollupRefresh(): void {
+  const now = Date.now();
+  if (now - lastBackgroundRefresh < BACKGROUND_REFRESH_INTERVAL) return;
+  lastBackgroundRefresh = now;
+
+  const refresh = () =>
+    runWithLease(REPORT_ROLLUP_LEASE, ({ signal }) => refreshAllReportRollups(signal))
+      .then(async (run) => {
+        if (run.acquired && run.result > 0) {
+          await invalidateReportCache();
+        }
+      })
+      .catch((error) => {
+        console.error('Error refreshing report rollups:', error);
+      });
+
+  try {
+    // Runs after the response; keeps a serverless function alive until the
+    // refresh has finished and released its lease
+    after(refresh);
+  } catch {
+    // Outside a request scope
+    void refresh();
+  }
+}
+
+// ============================================================================
+// Cached reads
+// ============================================================================
+
+/**
+ * Check an If-None-Match header against an ETag
+ */
+export function matchesETag(ifNoneMatch: string | null, etag: string): boolean {
+  if (!ifNoneMatch) return false;
+  return ifNoneMatch
+    .split(',')
+    .map((tag) => tag.trim())
+    .some((tag) => tag === '*' || tag === etag || tag === etag.replace(/^W\//, ''));
+}
+
+/**
+ * Get a report payload from the cache or compute it
+ *
+ * Reads only: pending rollup changes are applied by the background refresh
+ * (started here, not awaited), which drops every cached report when it
+ * rebuilt anything. Concurrent requests for the same key share one
+ * computation.
+ */
+export async function getCachedReport<T>(
+  report: string,
+  range: ReportDateRange,
+  compute: () => Promise<T>
+): Promise<{ data: T; etag: string }> {
+  ensureListening();
+  scheduleRollupRefresh();
+
+  const key = `${report}:${range.startDate || ''}:${range.endDate || ''}`;
+  const cached = entries.get(key);
+
+  if (cached && cached.generation === generation && cached.expiresAt > Date.now()) {
+    return cached.value as Promise<{ data: T; etag: string }>;
+  }
+
+  const value = compute().then((data) => ({
+    data,
+    etag: `W/"${createHash('sha1').update(JSON.stringify(data)).digest('base64url')}"`,
+  }));
+
+  if (entries.size >= MAX_ENTRIES) {
+    // Drop the oldest entry (Map keeps insertion order)
+    const oldest = entries.keys().next().value;
+    if (oldest !== undefined) entries.delete(oldest);
+  }
+
+  const entry: CachedReport = { generation, expiresAt: Date.now() + CACHE_TTL, value };
+  entries.set(key, entry);
+
+  // Failed computations must not be served from the cache
+  value.catch(() => {
+    if (entries.get(key) === entry) {
+      entries.delete(key);
+    }
+  });
+
+  return value;
+}
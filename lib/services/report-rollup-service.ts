@@ -0,0 +1,170 @@
+/**
+ * Reporting Rollups
+ *
+ * Manager reports read from daily fact tables instead of scanning tickets:
+ * - ticket_daily_stats: tickets by creation day, category, agent, priority
+ *   and status, with SLA and resolution-time measures
+ * - satisfaction_daily_stats: ratings by rating day, category and agent
+ *
+ * Database triggers on tickets and customer_satisfactions record which days
+ * changed in report_rollup_dirty_days. `refreshReportRollups` rebuilds only
+ * those days, so its cost depends on recent activity, and report queries
+ * depend on the number of days in the range, not the number of tickets.
+ * Days are rebuilt from the all_tickets view, so archived tickets still count.
+ */
+
+import { db } from '@/lib/db';
+import { ticketDailyStats, satisfactionDailyStats } from '@/lib/db/schema';
+import { and, gte, lte, sql } from 'drizzle-orm';
+import type { SQL } from 'drizzle-orm';
+
+// Days rebuilt per transaction. Ticket writes that mark a claimed day dirty
+// wait for this transaction, so batches are kept small (today is usually
+// among them).
+const MAX_DAYS_PER_REFRESH = 7;
+const MAX_DAYS_PER_RUN = 10000;
+
+// Only one instance rebuilds at a time
+export const REPORT_ROLLUP_LEASE = 'report-rollups';
+
+export interface ReportDateRange {
+  startDate?: string | null; // YYYY-MM-DD
+  endDate?: string | null; // YYYY-MM-DD (inclusive)
+}
+
+// ============================================================================
+// Refresh
+// ============================================================================
+
+/**
+ * Rebuild the rollup rows of one small batch of dirty days
+ *
+ * Days are claimed with SKIP LOCKED, so concurrent callers split the work.
+ * A day changed while it is being rebuilt is marked dirty again by the
+ * trigger once this transaction commits. Returns the number of days rebuilt.
+ */
+export async function refreshReportRollups(): Promise<number> {
+  return db.transaction(async (tx) => {
+    const claimed = await tx.execute<{ day: string }>(sql`
+      delete from report_rollup_dirty_days
+      where day in (
+        select day from report_rollup_dirty_days
+        order by day
+        limit ${MAX_DAYS_PER_REFRESH}
+        for update skip locked
+      )
+      returning day::text as day
+    `);
+
+    const days = Array.from(claimed, (row) => row.day);
+    if (days.length === 0) {
+      return 0;
+    }
+
+    const dayList = sql.join(days.map((day) => sql`${day}::date`), sql`, `);
+    const firstDay = days.reduce((a, b) => (a < b ? a : b));
+    const lastDay = days.reduce((a, b) => (a > b ? a : b));
+
+    await tx.execute(sql`delete from ticket_daily_stats where day in (${dayList})`);
+    await tx.execute(sql`
+      insert into ticket_daily_stats (
+        day, category_id, agent_id, priority, status, ticket_count,
+        response_met, response_violated, resolve_met, resolve_violated,
+        resolution_count, resolution_hours_sum
+      )
+      select
+        created_at::date,
+        category_id,
+        agent_id,
+        priority,
+        status,
+        count(*)::int,
+        count(*) filter (where sla_response_met = true)::int,
+        count(*) filter (where sla_response_met = false)::int,
+        count(*) filter (where sla_resolve_met = true)::int,
+        count(*) filter (where sla_resolve_met = false)::int,
+        count(resolved_at)::int,
+        coalesce(sum(extract(epoch from (resolved_at - created_at)) / 3600), 0)
+      from all_tickets
+      where created_at >= ${firstDay}::date
+        and created_at < ${lastDay}::date + 1
+        and created_at::date in (${dayList})
+      group by 1, 2, 3, 4, 5
+    `);
+
+    await tx.execute(sql`delete from satisfaction_daily_stats where day in (${dayList})`);
+    await tx.execute(sql`
+      insert into satisfaction_daily_stats (day, category_id, agent_id, rating, rating_count)
+      select
+        cs.created_at::date,
+        t.category_id,
+        t.agent_id,
+        cs.rating,
+        count(*)::int
+      from customer_satisfactions cs
+      inner join all_tickets t on t.id = cs.ticket_id
+      where cs.created_at >= ${firstDay}::date
+        and cs.created_at < ${lastDay}::date + 1
+        and cs.created_at::date in (${dayList})
+      group by 1, 2, 3, 4
+    `);
+
+    return days.length;
+  });
+}
+
+/**
+ * Rebuild batches, each in its own short transaction, until no day is
+ * dirty (or the signal aborts)
+ *
+ * Runs from the report-rollups cron job and the throttled background
+ * refresh, both under REPORT_ROLLUP_LEASE; report reads never rebuild.
+ * Returns the number of days rebuilt.
+ */
+export async function refreshAllReportRollups(signal?: AbortSignal): Promise<number> {
+  let daysRebuilt = 0;
+  let batch: number;
+  do {
+    batch = await refreshReportRollups();
+    daysRebuilt += batch;
+  } while (batch > 0 && daysRebuilt < MAX_DAYS_PER_RUN && !signal?.aborted);
+  return daysRebuilt;
+}
+
+// ============================================================================
+// Range filters
+// ============================================================================
+
+const DAY_PATTERN = /^\d{4}-\d{2}-\d{2}$/;
+
+function toDay(value: string | null | undefined): string | null {
+  if (!value) return null;
+  if (DAY_PATTERN.test(value)) return value;
+
+  const parsed = new Date(value);
+  return isNaN(parsed.getTime()) ? null : parsed.toISOString().slice(0, 10);
+}
+
+/**
+ * WHERE clause for ticket rollup rows in a date range (inclusive)
+ */
+export function ticketStatsRange(range: ReportDateRange): SQL | undefined {
+  const start = toDay(range.startDate);
+  const end = toDay(range.endDate);
+  const conditions = [];
+  if (start) conditions.push(gte(ticketDailyStats.day, start));
+  if (end) conditions.push(lte(ticketDailyStats.day, end));
+  return conditions.length > 0 ? and(...conditions) : undefined;
+}
+
+/**
+ * WHERE clause for satisfaction rollup rows in a date range (inclusive)
+ */
+export function satisfactionStatsRange(range: ReportDateRange): SQL | undefined {
+  const start = toDay(range.startDate);
+  const end = toDay(range.endDate);
+  const conditions = [];
+  if (start) conditions.push(gte(satisfactionDailyStats.day, start));
+  if (end) conditions.push(lte(satisfactionDailyStats.day, end));
+  return conditions.length > 0 ? and(...conditions) : undefined;
+}
@@ -0,0 +1,240 @@
+/**
+ * Attachment Thumbnail Service
+ *
+ * Image attachments get fixed-size derivatives (WebP plus a JPEG fallback)
+ * stored next to the original blob, e.g. /uploads/ab/<hash>.thumb.webp.
+ * Because blobs are content-addressed, identical images share thumbnails.
+ *
+ * Derivatives are generated on a small background queue after upload so the
+ * upload response is not delayed, and on demand for attachments uploaded
+ * before thumbnails existed. Resizing uses `sharp` (a direct dependency,
+ * loaded lazily); if its native binary cannot be loaded on the platform no
+ * thumbnails are produced and callers fall back to the original file.
+ */
+
+import { existsSync } from 'fs';
+import { rename, unlink } from 'fs/promises';
+import { randomUUID } from 'crypto';
+import { isImageFile, resolveUploadPath } from '@/lib/upload';
+
+// ============================================================================
+// Configuration
+// ============================================================================
+
+export const THUMBNAIL_SIZES = {
+  thumb: 160, // attachment list
+  preview: 800, // inline preview
+} as const;
+
+export type ThumbnailSize = keyof typeof THUMBNAIL_SIZES;
+export type ThumbnailFormat = 'webp' | 'jpeg';
+
+const THUMBNAIL_FORMATS: ThumbnailFormat[] = ['webp', 'jpeg'];
+const THUMBNAIL_QUALITY = 75;
+const MAX_QUEUE_LENGTH = 100;
+
+export const THUMBNAIL_CONTENT_TYPES: Record<ThumbnailFormat, string> = {
+  webp: 'image/webp',
+  jpeg: 'image/jpeg',
+};
+
+// ============================================================================
+// Paths
+// ============================================================================
+
+/**
+ * Relative path of a derivative of a stored image
+ */
+export function getThumbnailPath(
+  filePath: string,
+  size: ThumbnailSize,
+  format: ThumbnailFormat
+): string {
+  return `${filePath}.${size}.${format === 'jpeg' ? 'jpg' : format}`;
+}
+
+function getAllThumbnailPaths(filePath: string): string[] {
+  return (Object.keys(THUMBNAIL_SIZES) as ThumbnailSize[]).flatMap((size) =>
+    THUMBNAIL_FORMATS.map((format) => getThumbnailPath(filePath, size, format))
+  );
+}
+
+/**
+ * Check whether an attachment can have thumbnails
+ */
+export function canHaveThumbnail(mimeType: string): boolean {
+  return isImageFile(mimeType);
+}
+
+// ============================================================================
+// Generation
+// ============================================================================
+
+type SharpModule = typeof import('sharp').default;
+
+let sharpModule: Promise<SharpModule | null> | null = null;
+
+/**
+ * Load sharp once; resolves to null when its native binary cannot be loaded
+ */
+function loadSharp(): Promise<SharpModule | null> {
+  if (!sharpModule) {
+    sharpModule = import('sharp')
+      .then((mod) => mod.default)
+      .catch((error) => {
+        console.warn('sharp is not available, image thumbnails are disabled:', error);
+        return null;
+      });
+  }
+  return sharpModule;
+}
+
+// In-flight generations by blob path, so concurrent requests share the work
+const inFlight = new Map<string, Promise<boolean>>();
+
+/**
+ * Write every derivative of a stored image
+ *
+ * Files are written to a temporary name and renamed, so readers never see
+ * a partially written thumbnail. Returns false if no thumbnails could be made.
+ */
+async function generateThumbnails(filePath: string): Promise<boolean> {
+  const sharp = await loadSharp();
+  if (!sharp) {
+    return false;
+  }
+
+  const source = resolveUploadPath(filePath);
+  if (!existsSync(source)) {
+    return false;
+  }
+
+  for (const [size, width] of Object.entries(THUMBNAIL_SIZES) as Array<[ThumbnailSize, number]>) {
+    // Decode and resize once per size, then encode each format
+    const resized = sharp(source, { animated: false })
+      .rotate() // apply EXIF orientation
+      .resize({ width, height: width, fit: 'inside', withoutEnlargement: true });
+
+    for (const format of THUMBNAIL_FORMATS) {
+      const target = resolveUploadPath(getThumbnailPath(filePath, size, format));
+      if (existsSync(target)) continue;
+
+      const tempPath = `${target}.${randomUUID()}.tmp`;
+      const pipeline =
+        format === 'webp'
+          ? resized.clone().webp({ quality: THUMBNAIL_QUALITY })
+          : resized.clone().flatten({ background: '#ffffff' }).jpeg({ quality: THUMBNAIL_QUALITY, mozjpeg: true });
+
+      try {
+        await pipeline.toFile(tempPath);
+        await rename(tempPath, target);
+      } catch (error) {
+        await unlink(tempPath).catch(() => undefined);
+        throw error;
+      }
+    }
+  }
+
+  return true;
+}
+
+/**
+ * Generate derivatives for a blob unless another caller already is
+ */
+function generateOnce(filePath: string): Promise<boolean> {
+  let pending = inFlight.get(filePath);
+
+  if (!pending) {
+    pending = generateThumbnails(filePath)
+      .catch((error) => {
+        console.error(`Error generating thumbnails for ${filePath}:`, error);
+        return false;
+      })
+      .finally(() => {
+        inFlight.delete(filePath);
+      });
+    inFlight.set(filePath, pending);
+  }
+
+  return pending;
+}
+
+// ============================================================================
+// Background queue
+// ============================================================================
+
+const queue: string[] = [];
+let draining = false;
+
+/**
+ * Process queued images one at a time so upload bursts do not compete
+ * with request handling for CPU
+ */
+async function drainQueue(): Promise<void> {
+  if (draining) return;
+  draining = true;
+
+  try {
+    let filePath: string | undefined;
+    while ((filePath = queue.shift()) !== undefined) {
+      await generateOnce(filePath);
+    }
+  } finally {
+    draining = false;
+  }
+}
+
+/**
+ * Queue thumbnail generation for a newly stored attachment
+ *
+ * Returns immediately. Non-image attachments are ignored.
+ */
+export function scheduleThumbnails(attachment: { filePath: string; mimeType: string }): void {
+  if (!canHaveThumbnail(attachment.mimeType)) {
+    return;
+  }
+
+  if (queue.length >= MAX_QUEUE_LENGTH || queue.includes(attachment.filePath)) {
+    // Dropped jobs are generated on first request instead
+    return;
+  }
+
+  queue.push(attachment.filePath);
+  setImmediate(() => {
+    drainQueue().catch((error) => console.error('Thumbnail queue error:', error));
+  });
+}
+
+/**
+ * Get the relative path of a derivative, generating it if needed
+ *
+ * Returns null when the thumbnail cannot be produced.
+ */
+export async function ensureThumbnail(
+  attachment: { filePath: string; mimeType: string },
+  size: ThumbnailSize,
+  format: ThumbnailFormat
+): Promise<string | null> {
+  if (!canHaveThumbnail(attachment.mimeType)) {
+    return null;
+  }
+
+  const thumbnailPath = getThumbnailPath(attachment.filePath, size, format);
+  if (existsSync(resolveUploadPath(thumbnailPath))) {
+    return thumbnailPath;
+  }
+
+  const generated = await generateOnce(attachment.filePath);
+  return generated && existsSync(resolveUploadPath(thumbnailPath)) ? thumbnailPath : null;
+}
+
+/**
+ * Remove all derivatives of a blob (call when the blob itself is removed)
+ */
+export async function deleteThumbnails(filePath: string): Promise<void> {
+  await Promise.all(
+    getAllThumbnailPaths(filePath).map((thumbnailPath) =>
+      unlink(resolveUploadPath(thumbnailPath)).catch(() => undefined)
+    )
+  );
+}
@@ -0,0 +1,229 @@
+/**
+ * Real-time Ticket Events
+ *
+ * Database triggers publish ticket creation, assignment, status changes and
+ * new comments on the "ticket_events" channel when the writing transaction
+ * commits, so every writer (routes, cron jobs, scripts) is covered.
+ *
+ * Each process holds one LISTEN connection (on DATABASE_DIRECT_URL behind a
+ * transaction pooler; without it events are unavailable and clients fall
+ * back to polling). A notification is enriched with
+ * at most one query, then delivered to the subscribers allowed to see it
+ * under the same rules as `hasTicketAccess`; internal notes never reach
+ * customers.
+ */
+
+import { db, listenClient } from '@/lib/db';
+import { tickets, users, categories } from '@/lib/db/schema';
+import { alias } from 'drizzle-orm/pg-core';
+import { eq, sql } from 'drizzle-orm';
+import type { TicketEvent, TicketStatus, TicketWithRelations, UserRole, CommentWithAuthor } from '@/lib/types';
+import { hasTicketAccess } from './ticket-service';
+import { getCommentWithAuthor } from './comment-service';
+
+const NOTIFY_CHANNEL = 'ticket_events';
+
+// Payload written by the notify_ticket_event / notify_comment_event triggers
+interface TicketNotification {
+  type: 'ticket.created' | 'ticket.assigned' | 'ticket.status_changed' | 'comment.added';
+  ticketId: string;
+  customerId: string;
+  agentId: string | null;
+  previousAgentId?: string | null;
+  status?: TicketStatus;
+  previousStatus?: TicketStatus;
+  commentId?: string;
+  isInternal?: boolean;
+}
+
+interface Subscriber {
+  userId: string;
+  role: UserRole;
+  send: (event: TicketEvent) => void;
+}
+
+const subscribers = new Set<Subscriber>();
+
+// ============================================================================
+// Enrichment
+// ============================================================================
+
+const agents = alias(users, 'agent');
+
+function publicUser(table: typeof users) {
+  return { id: table.id, name: table.name, email: table.email, role: table.role };
+}
+
+/**
+ * Load a ticket in the shape the ticket list renders
+ */
+async function loadEventTicket(ticketId: string): Promise<TicketWithRelations | null> {
+  const [row] = await db
+    .select({
+      ticket: tickets,
+      customer: publicUser(users),
+      agent: publicUser(agents),
+      category: categories,
+      commentsCount: sql<number>`(select count(*)::int from ticket_comments c where c.ticket_id = ${tickets.id})`,
+      attachmentsCount: sql<number>`(select count(*)::int from ticket_attachments a where a.ticket_id = ${tickets.id})`,
+    })
+    .from(tickets)
+    .innerJoin(users, eq(tickets.customerId, users.id))
+    .leftJoin(agents, eq(tickets.agentId, agents.id))
+    .leftJoin(categories, eq(tickets.categoryId, categories.id))
+    .where(eq(tickets.id, ticketId))
+    .limit(1);
+
+  if (!row) return null;
+
+  return {
+    ...row.ticket,
+    customer: row.customer,
+    agent: row.agent,
+    category: row.category,
+    commentsCount: row.commentsCount,
+    attachmentsCount: row.attachmentsCount,
+  } as TicketWithRelations;
+}
+
+// ============================================================================
+// Dispatch
+// ============================================================================
+
+function canSee(subscriber: Subscriber, ticket: { customerId: string; agentId: string | null }) {
+  return hasTicketAccess(ticket, subscriber.userId, subscriber.role);
+}
+
+async function dispatch(notification: TicketNotification): Promise<void> {
+  const recipients = Array.from(subscribers);
+
+  switch (notification.type) {
+    case 'ticket.created': {
+      const targets = recipients.filter((s) => canSee(s, notification));
+      if (targets.length === 0) return;
+
+      const ticket = await loadEventTicket(notification.ticketId);
+      if (!ticket) return;
+      for (const s of targets) s.send({ type: 'ticket.created', ticket });
+      return;
+    }
+
+    case 'ticket.assigned': {
+      const before = { ...notification, agentId: notification.previousAgentId ?? null };
+      const targets = recipients.filter((s) => canSee(s, notification) || canSee(s, before));
+      if (targets.length === 0) return;
+
+      const ticket = await loadEventTicket(notification.ticketId);
+      if (!ticket) return;
+      for (const s of targets) {
+        if (canSee(s, notification)) {
+          s.send({ type: 'ticket.assigned', ticket, added: !canSee(s, before) });
+        } else {
+          s.send({ type: 'ticket.removed', ticketId: notification.ticketId });
+        }
+      }
+      return;
+    }
+
+    case 'ticket.status_changed': {
+      for (const s of recipients) {
+        if (!canSee(s, notification)) continue;
+        s.send({
+          type: 'ticket.status_changed',
+          ticketId: notification.ticketId,
+          status: notification.status!,
+          previousStatus: notification.previousStatus!,
+        });
+      }
+      return;
+    }
+
+    case 'comment.added': {
+      const targets = recipients.filter(
+        (s) => canSee(s, notification) && !(notification.isInternal && s.role === 'customer')
+      );
+      if (targets.length === 0 || !notification.commentId) return;
+
+      const comment = await getCommentWithAuthor(notification.commentId);
+      if (!comment) return;
+      for (const s of targets) {
+        s.send({
+          type: 'comment.added',
+          ticketId: notification.ticketId,
+          comment: comment as CommentWithAuthor,
+        });
+      }
+      return;
+    }
+  }
+}
+
+// Notifications are dispatched one at a time so that enrichment queries
+// cannot reorder events of the same ticket
+let dispatchQueue: Promise<void> = Promise.resolve();
+
+function enqueue(payload: string): void {
+  let notification: TicketNotification;
+  try {
+    notification = JSON.parse(payload);
+  } catch {
+    console.error('Invalid ticket event payload:', payload);
+    return;
+  }
+
+  if (subscribers.size === 0) return;
+
+  dispatchQueue = dispatchQueue
+    .then(() => dispatch(notification))
+    .catch((error) => {
+      console.error('Failed to dispatch ticket event:', error);
+    });
+}
+
+// ============================================================================
+// Subscriptions
+// ============================================================================
+
+let listening: Promise<void> | null = null;
+
+/**
+ * Subscribe to ticket notifications (once per process)
+ */
+function ensureListening(): void {
+  if (listening || !listenClient) return;
+
+  listening = listenClient
+    .listen(NOTIFY_CHANNEL, enqueue)
+    .then(() => undefined)
+    .catch((error) => {
+      // Allow the next subscriber to retry
+      listening = null;
+      console.error('Failed to listen for ticket events:', error);
+    });
+}
+
+/**
+ * Whether this process can receive ticket notifications at all
+ */
+export function ticketEventsAvailable(): boolean {
+  return listenClient !== null;
+}
+
+/**
+ * Receive the ticket events a user is allowed to see
+ *
+ * Returns a function that ends the subscription.
+ */
+export function subscribeToTicketEvents(
+  user: { id: string; role: UserRole },
+  send: (event: TicketEvent) => void
+): () => void {
+  ensureListening();
+
+  const subscriber: Subscriber = { userId: user.id, role: user.role, send };
+  subscribers.add(subscriber);
+
+  return () => {
+    subscribers.delete(subscriber);
+  };
+}
@@ -1,11 +1,37 @@
 import { db } from '@/lib/db';
-import { tickets, users, categories, ticketComments, ticketAttachments } from '@/lib/db/schema';
-import { eq, and, or, desc, count, ilike, sql } from 'drizzle-orm';
+import { tickets, allTickets, users, categories, ticketComments, ticketAttachments } from '@/lib/db/schema';
+import { eq, and, or, desc, count, ilike, sql, getTableColumns } from 'drizzle-orm';
 import { SLA_RESPONSE_TIME, SLA_RESOLVE_TIME, REOPEN_WINDOW } from '@/lib/constants';
 import type { TicketStatus, UserRole, TicketWithRelations } from '@/lib/types';
+import type { Ticket } from '@/lib/db/schema';
+import type { TicketCreateInput } from '@/lib/validations';
+import { nextAgentQuery } from './assignment-service';
+import { recordHistories } from './history-service';
+
+/**
+ * Live tickets, or live and archived tickets through the all_tickets view
+ *
+ * The view has the same columns as tickets (plus archived_at), so queries
+ * are built against either one the same way.
+ */
+function ticketSource(includeArchived: boolean) {
+  return (includeArchived ? allTickets : tickets) as unknown as typeof tickets;
+}
+
+const TICKET_FIELDS = Object.keys(getTableColumns(tickets)) as Array<keyof typeof tickets._.columns>;
+
+/**
+ * Ticket columns of a source, for nested selections
+ */
+function ticketFields(source: typeof tickets) {
+  return Object.fromEntries(
+    TICKET_FIELDS.map((key) => [key, source[key]])
+  ) as typeof tickets._.columns;
+}
 
 /**
  * Get tickets with filters and pagination
+ * Archived tickets are only included with `includeArchived`.
  */
 export async function getTickets(params: {
   userId: string;
@@ -18,6 +44,7 @@ export async function getTickets(params: {
   search?: string;
   page?: number;
   pageSize?: number;
+  includeArchived?: boolean;
 }) {
   const {
     userId,
@@ -30,8 +57,12 @@ export async function getTickets(params: {
     search,
     page = 1,
     pageSize = 10,
+    includeArchived = false,
   } = params;
 
+  // The all_tickets view has the same columns as tickets
+  const source = ticketSource(includeArchived);
+
   const offset = (page - 1) * pageSize;
 
   // Build WHERE conditions based on role
@@ -39,33 +70,33 @@ export async function getTickets(params: {
 
   // Role-based filtering
   if (userRole === 'customer') {
-    conditions.push(eq(tickets.customerId, userId));
+    conditions.push(eq(source.customerId, userId));
   } else if (userRole === 'agent') {
-    conditions.push(eq(tickets.agentId, userId));
+    conditions.push(eq(source.agentId, userId));
   }
   // Manager and Admin can see all tickets
 
   // Additional filters
   if (status) {
-    conditions.push(eq(tickets.status, status));
+    conditions.push(eq(source.status, status));
   }
   if (priority) {
-    conditions.push(eq(tickets.priority, priority as any));
+    conditions.push(eq(source.priority, priority as any));
   }
   if (categoryId) {
-    conditions.push(eq(tickets.categoryId, categoryId));
+    conditions.push(eq(source.categoryId, categoryId));
   }
   if (agentId) {
-    conditions.push(eq(tickets.agentId, agentId));
+    conditions.push(eq(source.agentId, agentId));
   }
   if (customerId) {
-    conditions.push(eq(tickets.customerId, customerId));
+    conditions.push(eq(source.customerId, customerId));
   }
   if (search) {
     conditions.push(
       or(
-        ilike(tickets.title, `%${search}%`),
-        ilike(tickets.content, `%${search}%`)
+        ilike(source.title, `%${search}%`),
+        ilike(source.content, `%${search}%`)
       )
     );
   }
@@ -75,22 +106,22 @@ export async function getTickets(params: {
   // Get total count
   const [{ totalCount }] = await db
     .select({ totalCount: count() })
-    .from(tickets)
+    .from(source)
     .where(whereClause);
 
   // Get tickets with relations
   const ticketList = await db
     .select({
-      ticket: tickets,
+      ticket: ticketFields(source),
       customer: users,
       agent: users,
       category: categories,
     })
-    .from(tickets)
-    .leftJoin(users, eq(tickets.customerId, users.id))
-    .leftJoin(categories, eq(tickets.categoryId, categories.id))
+    .from(source)
+    .leftJoin(users, eq(source.customerId, users.id))
+    .leftJoin(categories, eq(source.categoryId, categories.id))
     .where(whereClause)
-    .orderBy(desc(tickets.createdAt))
+    .orderBy(desc(source.createdAt))
     .limit(pageSize)
     .offset(offset);
 
@@ -127,38 +158,91 @@ export async function getTickets(params: {
   };
 }
 
+/**
+ * Check whether a user can access a ticket
+ *
+ * Customers can access their own tickets, agents the tickets assigned to
+ * them, managers and admins every ticket.
+ */
+export function hasTicketAccess(
+  ticket: { customerId: string; agentId: string | null },
+  userId: string,
+  userRole: UserRole
+): boolean {
+  if (userRole === 'customer') {
+    return ticket.customerId === userId;
+  }
+  if (userRole === 'agent') {
+    return ticket.agentId === userId;
+  }
+  return true;
+}
+
+/**
+ * Lightweight access check for routes that don't need the full ticket
+ *
+ * Runs a single query without relations or counts.
+ */
+export async function getTicketAccess(
+  ticketId: string,
+  userId: string,
+  userRole: UserRole
+): Promise<{ id: string; customerId: string; agentId: string | null; status: TicketStatus } | null> {
+  const [ticket] = await db
+    .select({
+      id: tickets.id,
+      customerId: tickets.customerId,
+      agentId: tickets.agentId,
+      status: tickets.status,
+    })
+    .from(tickets)
+    .where(eq(tickets.id, ticketId))
+    .limit(1);
+
+  if (!ticket || !hasTicketAccess(ticket, userId, userRole)) {
+    return null;
+  }
+
+  return ticket;
+}
+
 /**
  * Get a single ticket by ID with relations
+ *
+ * Archived tickets are read-only and only returned with `includeArchived`,
+ * so routes that modify a ticket keep answering 404 for them.
  */
 export async function getTicketById(
   ticketId: string,
   userId: string,
-  userRole: UserRole
+  userRole: UserRole,
+  options: { includeArchived?: boolean } = {}
 ): Promise<TicketWithRelations | null> {
+  const source = ticketSource(options.includeArchived ?? false);
   const [result] = await db
     .select({
-      ticket: tickets,
+      ticket: ticketFields(source),
+      archivedAt: options.includeArchived
+        ? allTickets.archivedAt
+        : sql<Date | null>`null`,
       customer: users,
       agent: users,
       category: categories,
     })
-    .from(tickets)
-    .leftJoin(users, eq(tickets.customerId, users.id))
-    .leftJoin(categories, eq(tickets.categoryId, categories.id))
-    .where(eq(tickets.id, ticketId))
+    .from(source)
+    .leftJoin(users, eq(source.customerId, users.id))
+    .leftJoin(categories, eq(source.categoryId, categories.id))
+    .where(eq(source.id, ticketId))
     .limit(1);
 
   if (!result) {
     return null;
   }
 
-  const { ticket, customer, agent, category } = result;
+  const { ticket, archivedAt, customer, agent, category } = result;
 
   // Check access permissions
-  if (userRole === 'customer' && ticket.customerId !== userId) {
-    return null;
-  }
-  if (userRole === 'agent' && ticket.agentId !== userId) {
+  if (!hasTicketAccess(ticket, userId, userRole)) {
     return null;
   }
 
@@ -180,6 +264,7 @@ export async function getTicketById(
     category: category || null,
     commentsCount: commentsCount?.count || 0,
     attachmentsCount: attachmentsCount?.count || 0,
+    isArchived: archivedAt !== null,
   };
 }
 
@@ -193,6 +278,47 @@ export function calculateSLADeadlines(createdAt: Date = new Date()) {
   };
 }
 
+/**
+ * Create a ticket, assign it and record its history atomically
+ *
+ * The agent is chosen by a subquery inside the insert, and both history
+ * rows are written with one insert, so creation takes two statements in
+ * a single transaction.
+ */
+export async function createTicket(input: TicketCreateInput, customerId: string): Promise<Ticket> {
+  const slaDeadlines = calculateSLADeadlines();
+
+  return db.transaction(async (tx) => {
+    const [ticket] = await tx
+      .insert(tickets)
+      .values({
+        title: input.title,
+        content: input.content,
+        priority: input.priority,
+        categoryId: input.categoryId || null,
+        customerId,
+        status: 'open',
+        agentId: sql`(${nextAgentQuery()})`,
+        ...slaDeadlines,
+      })
+      .returning();
+
+    await recordHistories(
+      [
+        // Record assignment in history
+        ...(ticket.agentId
+          ? [{ ticketId: ticket.id, userId: customerId, field: 'agent', oldValue: null, newValue: ticket.agentId }]
+          : []),
+        // Record ticket creation in history
+        { ticketId: ticket.id, userId: customerId, field: 'status', oldValue: null, newValue: 'open' },
+      ],
+      tx
+    );
+
+    return ticket;
+  });
+}
+
 /**
  * Check if a ticket can be reopened (within 3 days of closing)
  */
@@ -0,0 +1,166 @@
+/**
+ * API Traffic Capture
+ *
+ * With TRAFFIC_LOG=1 the middleware writes one `[traffic] {...}` line per
+ * API request to stdout: timestamp, method, redacted path, normalized route,
+ * role, a session key and the shape of the JSON body. `replay_traffic.py`
+ * reads these lines from the server log and replays them.
+ *
+ * Nothing a user typed is logged:
+ * - bodies are reduced to their keys and value types; only the values of
+ *   known enum keys (status, priority, ...) are kept, as `=value`, so that
+ *   status and priority changes replay faithfully
+ * - query values are replaced with `[redacted]` except ids, known enum keys
+ *   and pagination/date parameters
+ * - the session key is a salted hash of the user id (TRAFFIC_LOG_SALT, or a
+ *   random per-process salt; set it to correlate sessions across instances)
+ *
+ * Uses Web APIs only, so it runs in the middleware runtime.
+ */
+
+import type { NextRequest } from "next/server";
+import type { SessionUser } from "./session-header";
+import { routeLabel } from "./request-route";
+
+const TRAFFIC_LOG_ENABLED = process.env.TRAFFIC_LOG === "1";
+
+// Login flows, scrapes and cron calls are not user traffic
+const EXCLUDED_PREFIXES = ["/api/auth", "/api/metrics", "/api/cron/"];
+
+export const REDACTED = "[redacted]";
+
+const UUID_VALUE = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+const ENUM_TOKEN = /^[a-z_]{1,32}$/;
+const SENSITIVE_KEY = /password|secret|token/i;
+
+// Keys whose values are always one of a fixed set of tokens
+const ENUM_KEYS = new Set(["status", "priority", "type", "role", "format"]);
+
+// Query parameters whose values are validated numbers, dates or flags
+const QUERY_VALUE_PATTERNS: Record<string, RegExp> = {
+  page: /^\d{1,6}$/,
+  pageSize: /^\d{1,6}$/,
+  limit: /^\d{1,6}$/,
+  startDate: /^\d{4}-\d{2}-\d{2}$/,
+  endDate: /^\d{4}-\d{2}-\d{2}$/,
+  includeArchived: /^(true|false)$/,
+};
+
+export type BodyShape = string | BodyShape[] | { [key: string]: BodyShape };
+
+export function shouldLogTraffic(pathname: string): boolean {
+  return (
+    TRAFFIC_LOG_ENABLED &&
+    pathname.startsWith("/api/") &&
+    !EXCLUDED_PREFIXES.some((prefix) => pathname.startsWith(prefix))
+  );
+}
+
+function isEnumValue(key: string | undefined, value: string): boolean {
+  return (
+    key !== undefined &&
+    ENUM_KEYS.has(key) &&
+    !SENSITIVE_KEY.test(key) &&
+    ENUM_TOKEN.test(value)
+  );
+}
+
+/**
+ * Replace a value with its type, keeping the values of known enum keys
+ */
+export function bodyShape(value: unknown, key?: string): BodyShape {
+  if (value === null) return "null";
+  if (Array.isArray(value)) {
+    // One element is enough to describe the array; keep the length
+    return value.length > 0 ? [bodyShape(value[0], key), `length:${value.length}`] : [];
+  }
+  if (typeof value === "object") {
+    return Object.fromEntries(
+      Object.entries(value as Record<string, unknown>).map(([name, item]) => [
+        name,
+        bodyShape(item, name),
+      ])
+    );
+  }
+  if (typeof value === "string" && isEnumValue(key, value)) {
+    return `=${value}`;
+  }
+  return typeof value;
+}
+
+/**
+ * Query string with every value redacted except ids, enums and pagination
+ */
+export function redactQuery(searchParams: URLSearchParams): string {
+  const params = new URLSearchParams();
+  searchParams.forEach((value, key) => {
+    const keep =
+      !SENSITIVE_KEY.test(key) &&
+      (UUID_VALUE.test(value) ||
+        isEnumValue(key, value) ||
+        (QUERY_VALUE_PATTERNS[key]?.test(value) ?? false));
+    params.append(key, keep ? value : REDACTED);
+  });
+  const query = params.toString();
+  return query ? `?${query}` : "";
+}
+
+let salt: string | null = null;
+
+function sessionSalt(): string {
+  if (!salt) {
+    salt =
+      process.env.TRAFFIC_LOG_SALT ||
+      Array.from(crypto.getRandomValues(new Uint8Array(16)), (byte) =>
+        byte.toString(16).padStart(2, "0")
+      ).join("");
+  }
+  return salt;
+}
+
+/**
+ * Stable, non-reversible session key for a user id
+ */
+async function sessionKey(userId: string): Promise<string> {
+  const digest = await crypto.subtle.digest(
+    "SHA-256",
+    new TextEncoder().encode(`${sessionSalt()}:${userId}`)
+  );
+  return Array.from(new Uint8Array(digest).slice(0, 12), (byte) =>
+    byte.toString(16).padStart(2, "0")
+  ).join("");
+}
+
+async function readBodyShape(req: NextRequest): Promise<BodyShape | undefined> {
+  if (req.method === "GET" || req.method === "HEAD") return undefined;
+
+  const contentType = req.headers.get("content-type") || "";
+  if (contentType.startsWith("multipart/form-data")) return "multipart";
+  if (!contentType.includes("application/json")) return undefined;
+
+  try {
+    // Read a copy so the route still receives the body
+    return bodyShape(await req.clone().json());
+  } catch {
+    return "invalid-json";
+  }
+}
+
+/**
+ * Write one traffic line for an API request
+ */
+export async function logTraffic(req: NextRequest, user: SessionUser | undefined) {
+  const { pathname, searchParams } = req.nextUrl;
+
+  const entry = {
+    ts: new Date().toISOString(),
+    method: req.method,
+    path: `${pathname}${redactQuery(searchParams)}`,
+    route: routeLabel(pathname),
+    role: user?.role ?? null,
+    session: user ? await sessionKey(user.id) : null,
+    body: await readBodyShape(req),
+  };
+
+  console.log(`[traffic] ${JSON.stringify(entry)}`);
+}
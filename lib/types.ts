@@ -19,6 +19,7 @@ export interface TicketWithRelations extends Ticket {
   category?: Category | null;
   commentsCount?: number;
   attachmentsCount?: number;
+  isArchived?: boolean; // moved to tickets_archive; read-only
 }
 
 export interface CommentWithAuthor extends TicketComment {
@@ -102,3 +103,18 @@ export interface SLAStatus {
   responseTimeRemaining?: number;
   resolveTimeRemaining?: number;
 }
+
+// Real-time ticket event types (GET /api/tickets/events)
+export type TicketEvent =
+  | { type: 'ticket.created'; ticket: TicketWithRelations }
+  // `added` is true when the ticket just became visible to the recipient
+  | { type: 'ticket.assigned'; ticket: TicketWithRelations; added: boolean }
+  | {
+      type: 'ticket.status_changed';
+      ticketId: string;
+      status: TicketStatus;
+      previousStatus: TicketStatus;
+    }
+  | { type: 'comment.added'; ticketId: string; comment: CommentWithAuthor }
+  // The recipient lost access (e.g. the ticket was reassigned)
+  | { type: 'ticket.removed'; ticketId: string };
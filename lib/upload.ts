@@ -1,16 +1,21 @@
-import { writeFile, mkdir } from 'fs/promises';
-import { existsSync } from 'fs';
+import { mkdir, rename, unlink } from 'fs/promises';
+import { existsSync, createReadStream, createWriteStream } from 'fs';
+import { Readable, Transform } from 'stream';
+import { pipeline } from 'stream/promises';
+import { createHash, randomUUID } from 'crypto';
 import path from 'path';
 import { MAX_FILE_SIZE, ALLOWED_FILE_TYPES } from './constants';
 
 const UPLOAD_DIR = path.join(process.cwd(), 'public', 'uploads');
+// Staging directory on the same filesystem so that the final move is atomic
+const TEMP_DIR = path.join(UPLOAD_DIR, '.tmp');
 
 /**
- * Ensure upload directory exists
+ * Ensure a directory exists
  */
-async function ensureUploadDir() {
-  if (!existsSync(UPLOAD_DIR)) {
-    await mkdir(UPLOAD_DIR, { recursive: true });
+async function ensureDir(dir: string) {
+  if (!existsSync(dir)) {
+    await mkdir(dir, { recursive: true });
   }
 }
 
@@ -35,87 +40,166 @@ export function validateFile(file: File): { valid: boolean; error?: string } {
   return { valid: true };
 }
 
+export interface StagedUpload {
+  tempPath: string;
+  contentHash: string;
+  fileSize: number;
+  fileName: string;
+}
+
 /**
- * Generate unique filename
+ * Relative path (for storing in DB) of a content-addressed blob
+ *
+ * Blobs are sharded by the first two hex digits of their SHA-256.
  */
-function generateFileName(originalName: string): string {
-  const timestamp = Date.now();
-  const random = Math.random().toString(36).substring(2, 15);
-  const ext = path.extname(originalName);
-  const nameWithoutExt = path.basename(originalName, ext);
-  const safeName = nameWithoutExt.replace(/[^a-zA-Z0-9가-힣]/g, '_');
-
-  return `${timestamp}_${random}_${safeName}${ext}`;
+export function getContentPath(contentHash: string): string {
+  return `/uploads/${contentHash.slice(0, 2)}/${contentHash}`;
 }
 
 /**
- * Upload file to server
+ * Stream an uploaded file to a temporary file while computing its SHA-256
+ *
+ * The file is never copied into a single buffer.
  */
-export async function uploadFile(file: File): Promise<{
+export async function stageUpload(file: File): Promise<{
   success: boolean;
-  filePath?: string;
-  fileName?: string;
+  staged?: StagedUpload;
   error?: string;
 }> {
-  try {
-    // Validate file
-    const validation = validateFile(file);
-    if (!validation.valid) {
-      return { success: false, error: validation.error };
-    }
-
-    // Ensure upload directory exists
-    await ensureUploadDir();
+  const validation = validateFile(file);
+  if (!validation.valid) {
+    return { success: false, error: validation.error };
+  }
 
-    // Generate unique filename
-    const fileName = generateFileName(file.name);
-    const filePath = path.join(UPLOAD_DIR, fileName);
+  await ensureDir(TEMP_DIR);
 
-    // Convert File to Buffer
-    const bytes = await file.arrayBuffer();
-    const buffer = Buffer.from(bytes);
+  const tempPath = path.join(TEMP_DIR, randomUUID());
+  const hash = createHash('sha256');
+  let fileSize = 0;
 
-    // Write file
-    await writeFile(filePath, buffer);
+  const hasher = new Transform({
+    transform(chunk: Buffer, _encoding, callback) {
+      hash.update(chunk);
+      fileSize += chunk.length;
+      callback(null, chunk);
+    },
+  });
 
-    // Return relative path (for storing in DB)
-    const relativePath = `/uploads/${fileName}`;
+  try {
+    await pipeline(
+      Readable.fromWeb(file.stream() as unknown as Parameters<typeof Readable.fromWeb>[0]),
+      hasher,
+      createWriteStream(tempPath)
+    );
+  } catch (error) {
+    await unlink(tempPath).catch(() => undefined);
+    throw error;
+  }
 
-    return {
-      success: true,
-      filePath: relativePath,
+  return {
+    success: true,
+    staged: {
+      tempPath,
+      contentHash: hash.digest('hex'),
+      fileSize,
       fileName: file.name,
-    };
-  } catch (error) {
-    console.error('Error uploading file:', error);
-    return {
-      success: false,
-      error: '파일 업로드 중 오류가 발생했습니다',
-    };
+    },
+  };
+}
+
+/**
+ * Move a staged upload to its content-addressed path
+ *
+ * If a blob with the same content already exists the staged copy is
+ * dropped (deduplication). Returns the relative path of the blob.
+ */
+export async function commitStagedUpload(staged: StagedUpload): Promise<string> {
+  const relativePath = getContentPath(staged.contentHash);
+  const absolutePath = resolveUploadPath(relativePath);
+
+  if (existsSync(absolutePath)) {
+    await discardStagedUpload(staged);
+  } else {
+    await ensureDir(path.dirname(absolutePath));
+    await rename(staged.tempPath, absolutePath);
   }
+
+  return relativePath;
 }
 
 /**
- * Upload multiple files
+ * Remove a staged upload that will not be committed
  */
-export async function uploadFiles(files: File[]): Promise<{
-  success: boolean;
-  uploads?: Array<{ filePath: string; fileName: string }>;
-  errors?: string[];
-}> {
-  const results = await Promise.all(files.map((file) => uploadFile(file)));
+export async function discardStagedUpload(staged: StagedUpload): Promise<void> {
+  await unlink(staged.tempPath).catch(() => undefined);
+}
 
-  const uploads = results
-    .filter((r) => r.success && r.filePath && r.fileName)
-    .map((r) => ({ filePath: r.filePath!, fileName: r.fileName! }));
+/**
+ * Resolve a stored relative path (e.g. /uploads/x.png) to an absolute path
+ */
+export function resolveUploadPath(relativePath: string): string {
+  return path.join(process.cwd(), 'public', relativePath);
+}
 
-  const errors = results.filter((r) => !r.success).map((r) => r.error!);
+/**
+ * Parse a single-range HTTP Range header against a file size
+ *
+ * Returns null when the header is absent, malformed (including last < first,
+ * which RFC 9110 says to ignore) or asks for several ranges (the full file
+ * is served then), and 'unsatisfiable' when the range starts past the end of
+ * the file or is an empty suffix.
+ */
+export function parseRangeHeader(
+  header: string | null,
+  size: number
+): { start: number; end: number } | 'unsatisfiable' | null {
+  if (!header) return null;
+
+  const match = /^bytes=(\d*)-(\d*)$/.exec(header.trim());
+  if (!match || (match[1] === '' && match[2] === '')) {
+    return null;
+  }
 
-  return {
-    success: errors.length === 0,
-    uploads,
-    errors: errors.length > 0 ? errors : undefined,
-  };
+  let start: number;
+  let end: number;
+
+  if (match[1] === '') {
+    // Suffix range: last N bytes
+    const suffixLength = parseInt(match[2], 10);
+    if (suffixLength === 0) return 'unsatisfiable';
+    start = Math.max(size - suffixLength, 0);
+    end = size - 1;
+  } else {
+    start = parseInt(match[1], 10);
+    if (match[2] === '') {
+      end = size - 1;
+    } else {
+      const last = parseInt(match[2], 10);
+      // Syntactically invalid range: ignore the header
+      if (last < start) return null;
+      end = Math.min(last, size - 1);
+    }
+  }
+
+  if (start >= size) {
+    return 'unsatisfiable';
+  }
+
+  return { start, end };
+}
+
+/**
+ * Open a stored file as a web stream, optionally limited to a byte range
+ *
+ * The file is read in chunks with backpressure, so memory use does not
+ * depend on the file size.
+ */
+export function createFileStream(
+  relativePath: string,
+  range?: { start: number; end: number }
+): ReadableStream<Uint8Array> {
+  const nodeStream = createReadStream(resolveUploadPath(relativePath), range);
+  return Readable.toWeb(nodeStream) as unknown as ReadableStream<Uint8Array>;
 }
 
 /**
@@ -1,4 +1,5 @@
 import { z } from 'zod';
+import { MAX_BULK_TICKETS } from './constants';
 
 // ============================================================================
 // AUTH VALIDATIONS
@@ -96,6 +97,40 @@ export const ticketAssignSchema = z.object({
   agentId: z.string().uuid('올바른 담당자를 선택하세요'),
 });
 
+export const ticketBulkUpdateSchema = z.object({
+  // Either explicit ids or a filter selects the tickets
+  ticketIds: z
+    .array(z.string().uuid())
+    .min(1, '티켓을 선택하세요')
+    .max(MAX_BULK_TICKETS, `한 번에 최대 ${MAX_BULK_TICKETS}개의 티켓만 변경할 수 있습니다`)
+    .optional(),
+  filter: z
+    .object({
+      status: z.enum(['open', 'in_progress', 'resolved', 'closed']).optional(),
+      priority: z.enum(['low', 'medium', 'high']).optional(),
+      categoryId: z.string().uuid().optional(),
+      agentId: z.string().uuid().optional(),
+    })
+    .optional(),
+  operation: z.discriminatedUnion('type', [
+    z.object({
+      type: z.literal('status'),
+      status: z.enum(['open', 'in_progress', 'resolved', 'closed']),
+    }),
+    z.object({
+      type: z.literal('assign'),
+      agentId: z.string().uuid('올바른 담당자를 선택하세요'),
+    }),
+    z.object({
+      type: z.literal('priority'),
+      priority: z.enum(['low', 'medium', 'high']),
+    }),
+  ]),
+}).refine((data) => (data.ticketIds === undefined) !== (data.filter === undefined), {
+  message: '티켓 ID 목록 또는 필터 중 하나를 지정하세요',
+  path: ['ticketIds'],
+});
+
 // ============================================================================
 // COMMENT VALIDATIONS
 // ============================================================================
@@ -236,6 +271,12 @@ export const paginationSchema = z.object({
   pageSize: z.number().int().min(1).max(100).default(10),
 });
 
+// Cursor pagination for comment threads (query string values)
+export const commentPageSchema = z.object({
+  before: z.string().uuid('잘못된 페이지 커서입니다').optional(),
+  limit: z.coerce.number().int().min(1).max(100).optional(),
+});
+
 // ============================================================================
 // SEARCH & FILTER VALIDATIONS
 // ============================================================================
@@ -251,6 +292,30 @@ export const ticketFiltersSchema = z.object({
   pageSize: z.number().int().min(1).max(100).default(10),
 });
 
+// ============================================================================
+// DATA EXPORT VALIDATIONS
+// ============================================================================
+
+// The regex alone accepts dates such as 2026-02-30, which Postgres would
+// only reject after the export has started streaming
+const isoDate = z
+  .string()
+  .regex(/^\d{4}-\d{2}-\d{2}$/, '날짜는 YYYY-MM-DD 형식이어야 합니다')
+  .refine((value) => {
+    const date = new Date(`${value}T00:00:00Z`);
+    return !isNaN(date.getTime()) && date.toISOString().slice(0, 10) === value;
+  }, '존재하지 않는 날짜입니다');
+
+export const ticketExportSchema = z.object({
+  startDate: isoDate,
+  endDate: isoDate,
+  format: z.enum(['csv', 'ndjson']).default('csv'),
+  gzip: z.enum(['true', 'false']).default('false').transform((value) => value === 'true'),
+}).refine((data) => data.startDate <= data.endDate, {
+  message: '시작일은 종료일보다 이후일 수 없습니다',
+  path: ['endDate'],
+});
+
 // ============================================================================
 // EXPORT TYPES
 // ============================================================================
@@ -261,6 +326,7 @@ export type UserCreateInput = z.infer<typeof userCreateSchema>;
 export type UserUpdateInput = z.infer<typeof userUpdateSchema>;
 export type TicketCreateInput = z.infer<typeof ticketCreateSchema>;
 export type TicketUpdateInput = z.infer<typeof ticketUpdateSchema>;
+export type TicketBulkUpdateInput = z.infer<typeof ticketBulkUpdateSchema>;
 export type CommentCreateInput = z.infer<typeof commentCreateSchema>;
 export type CategoryCreateInput = z.infer<typeof categoryCreateSchema>;
 export type CategoryUpdateInput = z.infer<typeof categoryUpdateSchema>;
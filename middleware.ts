@@ -1,17 +1,57 @@
 import { auth } from "./lib/auth";
 import { NextResponse } from "next/server";
+import type { NextRequest } from "next/server";
+import { SESSION_HEADER, signSessionHeader } from "./lib/session-header";
+import { logTraffic, shouldLogTraffic } from "./lib/traffic-log";
+import { ROUTE_HEADER, routeLabel } from "./lib/request-route";
+import type { SessionUser } from "./lib/session-header";
 
-export default auth((req) => {
+/**
+ * Continue to the route, forwarding the verified user (if any) so that
+ * route handlers do not have to decrypt the session JWT again
+ */
+async function forwardSession(req: NextRequest, user: SessionUser | undefined) {
+  const requestHeaders = new Headers(req.headers);
+  // Never trust a client-supplied copy
+  requestHeaders.delete(SESSION_HEADER);
+  requestHeaders.delete(ROUTE_HEADER);
+
+  // Route label for query metrics (lib/db/instrumentation.ts)
+  const { pathname } = req.nextUrl;
+  if (pathname.startsWith("/api/")) {
+    requestHeaders.set(ROUTE_HEADER, routeLabel(pathname));
+  }
+
+  if (user) {
+    const signed = await signSessionHeader(user);
+    if (signed) {
+      requestHeaders.set(SESSION_HEADER, signed);
+    }
+  }
+
+  return NextResponse.next({ request: { headers: requestHeaders } });
+}
+
+export default auth(async (req) => {
   const { pathname } = req.nextUrl;
   const user = req.auth?.user;
 
+  if (shouldLogTraffic(pathname)) {
+    await logTraffic(req, user);
+  }
+
   // Public routes - no authentication required
   const publicRoutes = ["/login", "/register"];
   const isPublicRoute = publicRoutes.some((route) => pathname.startsWith(route));
 
   // Auth API routes - always allow
   if (pathname.startsWith("/api/auth")) {
-    return NextResponse.next();
+    return forwardSession(req, undefined);
+  }
+
+  // Metrics scrape and cron jobs - the routes require METRICS_TOKEN / CRON_SECRET
+  if (pathname === "/api/metrics" || pathname.startsWith("/api/cron/")) {
+    return forwardSession(req, undefined);
   }
 
   // If not authenticated and trying to access protected route
@@ -43,7 +83,7 @@ export default auth((req) => {
     }
   }
 
-  return NextResponse.next();
+  return forwardSession(req, user);
 });
 
 export const config = {
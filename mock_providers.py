@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+"""
+외부 서비스 대역 서버 (OpenRouter + SMTP)
+- OpenRouter 호환 POST /api/v1/chat/completions (stream: true 지원)
+  분류/감정 분석 프롬프트에는 앱이 파싱하는 JSON을, 그 외에는 답변 텍스트를 반환
+- SMTP 싱크: EHLO / AUTH / MAIL / RCPT / DATA 를 받고 메일은 버림
+- 지연 시간 분포, 오류 주입(OpenRouter 429/503, SMTP 연결 시 421 / DATA 후 451), 처리량 카운터
+- GET /stats 로 카운터 조회, POST /stats/reset 으로 초기화,
+  POST /control 로 실행 중 지연/오류율 변경 (예: 부하 테스트 도중 공급자 지연 재현)
+
+앱 설정 (.env.local):
+  OPENROUTER_API_KEY=sk-or-v1-local
+  OPENROUTER_BASE_URL=http://localhost:3901/api/v1
+  SMTP_HOST=localhost
+  SMTP_PORT=2525
+  SMTP_USER=local
+  SMTP_PASS=local
+
+사용법:
+  python mock_providers.py
+  python mock_providers.py --ai-latency lognormal:1200,0.5 --ai-error-rate 0.05
+  python mock_providers.py --smtp-latency uniform:50,300 --smtp-error-rate 0.1
+  python mock_providers.py --smtp-connect-error-rate 0.05       # 연결의 5%를 421로 거부
+  curl -X POST localhost:3901/control -d '{"ai": {"latency": "fixed:8000"}}'
+  curl -X POST localhost:3901/control -d '{"smtp": {"connectErrorRate": 0.2}}'
+
+SMTP 오류율은 단계별로 따로 적용됩니다: connectErrorRate 는 연결 직후 421,
+errorRate 는 DATA 후 errorStatuses(기본 451)입니다.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import socketserver
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_HTTP_PORT = 3901
+DEFAULT_SMTP_PORT = 2525
+
+CATEGORY_PREFIX = '다음 카테고리 중에서 선택하세요: '
+
+NEGATIVE_WORDS = ['환불', '불만', '화가', '짜증', '오류', '안 돼', '안돼', '실망', '최악', '취소']
+POSITIVE_WORDS = ['감사', '좋아', '만족', '최고', '훌륭', '고맙']
+
+ANSWER_TEXT = (
+    '안녕하세요, 문의해 주셔서 감사합니다. '
+    '말씀하신 내용을 확인해 보았습니다. '
+    '먼저 계정 설정 화면에서 최근 변경 내역을 확인해 주시고, '
+    '문제가 계속되면 사용 중인 브라우저와 발생 시각을 알려주시면 빠르게 확인해 드리겠습니다. '
+    '추가로 궁금하신 점이 있으시면 언제든지 문의해 주세요.'
+)
+
+
+# ============================================================================
+# 지연 시간 / 오류 주입
+# ============================================================================
+
+class Latency:
+    """지연 시간 분포: fixed:ms, uniform:min,max, normal:mean,stddev, lognormal:median,sigma"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        kind, _, args = spec.partition(':')
+        values = [float(v) for v in args.split(',') if v.strip()] if args else []
+        if kind == 'fixed' and len(values) == 1:
+            self._sample = lambda: values[0]
+        elif kind == 'uniform' and len(values) == 2:
+            self._sample = lambda: random.uniform(values[0], values[1])
+        elif kind == 'normal' and len(values) == 2:
+            self._sample = lambda: random.gauss(values[0], values[1])
+        elif kind == 'lognormal' and len(values) == 2:
+            mu = math.log(values[0])
+            self._sample = lambda: random.lognormvariate(mu, values[1])
+        else:
+            raise ValueError(f'알 수 없는 지연 시간 형식: {spec}')
+
+    def seconds(self):
+        return max(0.0, self._sample()) / 1000
+
+
+class Faults:
+    """오류율과 반환할 상태 코드 목록"""
+
+    def __init__(self, rate, statuses):
+        self.rate = rate
+        self.statuses = statuses
+
+    def pick(self):
+        if self.rate > 0 and random.random() < self.rate:
+            return random.choice(self.statuses)
+        return None
+
+
+class Stats:
+    """스레드 안전 카운터와 초당 처리량"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self.total = 0
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.by_status = {}
+            self.bytes_in = 0
+            self.bytes_out = 0
+            self.latency_ms = []
+
+    def begin(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def end(self, status, started, bytes_in=0, bytes_out=0):
+        with self._lock:
+            self.in_flight -= 1
+            self.total += 1
+            self.by_status[str(status)] = self.by_status.get(str(status), 0) + 1
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+            self.latency_ms.append((time.time() - started) * 1000)
+            # Keep memory bounded on long runs
+            if len(self.latency_ms) > 100000:
+                self.latency_ms = self.latency_ms[-50000:]
+
+    def snapshot(self):
+        with self._lock:
+            elapsed = max(time.time() - self.started_at, 0.001)
+            ordered = sorted(self.latency_ms)
+
+            def pct(fraction):
+                if not ordered:
+                    return None
+                return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 1)
+
+            return {
+                'total': self.total,
+                'inFlight': self.in_flight,
+                'maxInFlight': self.max_in_flight,
+                'byStatus': dict(self.by_status),
+                'perSecond': round(self.total / elapsed, 2),
+                'bytesIn': self.bytes_in,
+                'bytesOut': self.bytes_out,
+                'latencyMs': {'p50': pct(0.5), 'p95': pct(0.95), 'p99': pct(0.99)},
+                'elapsedSeconds': round(elapsed, 1),
+            }
+
+
+class Provider:
+    """서버 한 종류(ai / smtp)의 설정과 카운터
+
+    faults 는 응답(SMTP 는 DATA) 단계의 오류, connect_faults 는 연결 직후의 오류 (SMTP 만)
+    """
+
+    def __init__(self, latency, faults, connect_faults=None):
+        self.latency = latency
+        self.faults = faults
+        self.connect_faults = connect_faults
+        self.stats = Stats()
+
+    def configure(self, options):
+        if 'latency' in options:
+            self.latency = Latency(options['latency'])
+        if 'errorRate' in options:
+            self.faults.rate = float(options['errorRate'])
+        if 'errorStatuses' in options:
+            self.faults.statuses = [int(s) for s in options['errorStatuses']]
+        if 'connectErrorRate' in options:
+            if self.connect_faults is None:
+                raise ValueError('connectErrorRate 는 smtp 에만 적용됩니다')
+            self.connect_faults.rate = float(options['connectErrorRate'])
+
+    def describe(self):
+        description = {
+            'latency': self.latency.spec,
+            'errorRate': self.faults.rate,
+            'errorStatuses': self.faults.statuses,
+        }
+        if self.connect_faults is not None:
+            description['connectErrorRate'] = self.connect_faults.rate
+        return description
+
+
+PROVIDERS = {}
+
+
+# ============================================================================
+# OpenRouter 호환 응답
+# ============================================================================
+
+def stable_choice(options, seed_text):
+    digest = hashlib.sha1(seed_text.encode('utf-8')).digest()
+    return options[digest[0] % len(options)]
+
+
+def estimate_tokens(text):
+    return max(1, len(text) // 2)
+
+
+def completion_content(messages):
+    """앱 프롬프트 종류에 맞는 응답 본문"""
+    system = next((m['content'] for m in messages if m.get('role') == 'system'), '')
+    user = '\n'.join(m['content'] for m in messages if m.get('role') == 'user')
+
+    if '분류하는 전문가' in system:
+        names = []
+        for line in user.splitlines():
+            if line.startswith(CATEGORY_PREFIX):
+                names = [n.strip() for n in line[len(CATEGORY_PREFIX):].split(',') if n.strip()]
+        return json.dumps({
+            'categoryName': stable_choice(names, user) if names else '기타',
+            'confidence': round(0.6 + hashlib.sha1(user.encode('utf-8')).digest()[1] % 35 / 100, 2),
+            'reason': '티켓 내용이 해당 카테고리의 주제와 가장 가깝습니다',
+        }, ensure_ascii=False)
+
+    if '감정을 분석' in system:
+        if any(word in user for word in NEGATIVE_WORDS):
+            sentiment = 'negative'
+        elif any(word in user for word in POSITIVE_WORDS):
+            sentiment = 'positive'
+        else:
+            sentiment = 'neutral'
+        return json.dumps({
+            'sentiment': sentiment,
+            'confidence': 0.82,
+            'reason': '문의에 사용된 표현을 근거로 판단했습니다',
+        }, ensure_ascii=False)
+
+    return ANSWER_TEXT
+
+
+class OpenRouterHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        return len(body)
+
+    def read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self.send_json(200, {
+                name: {**provider.describe(), **provider.stats.snapshot()}
+                for name, provider in PROVIDERS.items()
+            })
+        else:
+            self.send_json(404, {'error': {'message': 'Not found'}})
+
+    def do_POST(self):
+        if self.path == '/stats/reset':
+            self.read_body()
+            for provider in PROVIDERS.values():
+                provider.stats.reset()
+            self.send_json(200, {'success': True})
+        elif self.path == '/control':
+            try:
+                options = json.loads(self.read_body() or b'{}')
+                for name, values in options.items():
+                    PROVIDERS[name].configure(values)
+            except (KeyError, ValueError) as e:
+                self.send_json(400, {'error': {'message': str(e)}})
+                return
+            self.send_json(200, {name: p.describe() for name, p in PROVIDERS.items()})
+        elif self.path == '/api/v1/chat/completions':
+            self.chat_completion()
+        else:
+            self.send_json(404, {'error': {'message': 'Not found'}})
+
+    def chat_completion(self):
+        provider = PROVIDERS['ai']
+        started = time.time()
+        provider.stats.begin()
+        status = 200
+        raw = self.read_body()
+        sent = 0
+
+        try:
+            if not (self.headers.get('Authorization') or '').startswith('Bearer '):
+                status = 401
+                sent = self.send_json(401, {'error': {'message': 'Missing API key', 'code': 401}})
+                return
+
+            try:
+                request = json.loads(raw)
+                messages = request['messages']
+            except (ValueError, KeyError):
+                status = 400
+                sent = self.send_json(400, {'error': {'message': 'Invalid request body', 'code': 400}})
+                return
+
+            fault = provider.faults.pick()
+            delay = provider.latency.seconds()
+
+            if fault:
+                # Providers usually fail fast
+                time.sleep(min(delay, 0.2))
+                status = fault
+                headers = {'Retry-After': '1'} if fault == 429 else None
+                message = 'Rate limit exceeded' if fault == 429 else 'Model is currently unavailable'
+                sent = self.send_json(fault, {'error': {'message': message, 'code': fault}}, headers)
+                return
+
+            content = completion_content(messages)
+            model = request.get('model', 'anthropic/claude-3.5-sonnet')
+            completion_id = f'gen-{uuid.uuid4().hex[:24]}'
+            usage = {
+                'prompt_tokens': sum(estimate_tokens(m.get('content', '')) for m in messages),
+                'completion_tokens': estimate_tokens(content),
+            }
+            usage['total_tokens'] = usage['prompt_tokens'] + usage['completion_tokens']
+
+            if request.get('stream'):
+                sent = self.stream(completion_id, model, content, usage, delay)
+            else:
+                time.sleep(delay)
+                sent = self.send_json(200, {
+                    'id': completion_id,
+                    'object': 'chat.completion',
+                    'created': int(time.time()),
+                    'model': model,
+                    'choices': [{
+                        'index': 0,
+                        'message': {'role': 'assistant', 'content': content},
+                        'finish_reason': 'stop',
+                    }],
+                    'usage': usage,
+                })
+        except (BrokenPipeError, ConnectionResetError):
+            # Client gave up (e.g. the app's request timeout fired)
+            status = 'aborted'
+        finally:
+            provider.stats.end(status, started, len(raw), sent)
+
+    def stream(self, completion_id, model, content, usage, delay):
+        """SSE 스트리밍: 첫 토큰까지 지연의 1/3, 나머지는 청크마다 나눠서"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        pieces = [content[i:i + 8] for i in range(0, len(content), 8)] or ['']
+        time.sleep(delay / 3)
+        per_chunk = (delay * 2 / 3) / len(pieces)
+        sent = 0
+
+        def write_event(payload):
+            data = f'data: {payload}\n\n'.encode('utf-8')
+            self.wfile.write(f'{len(data):x}\r\n'.encode('ascii') + data + b'\r\n')
+            self.wfile.flush()
+            return len(data)
+
+        for index, piece in enumerate(pieces):
+            last = index == len(pieces) - 1
+            chunk = {
+                'id': completion_id,
+                'object': 'chat.completion.chunk',
+                'created': int(time.time()),
+                'model': model,
+                'choices': [{
+                    'index': 0,
+                    'delta': {'role': 'assistant', 'content': piece} if index == 0 else {'content': piece},
+                    'finish_reason': 'stop' if last else None,
+                }],
+            }
+            if last:
+                chunk['usage'] = usage
+            sent += write_event(json.dumps(chunk, ensure_ascii=False))
+            time.sleep(per_chunk)
+
+        sent += write_event('[DONE]')
+        self.wfile.write(b'0\r\n\r\n')
+        self.wfile.flush()
+        return sent
+
+
+# ============================================================================
+# SMTP 싱크
+# ============================================================================
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """메일을 받기만 하는 최소 SMTP 서버 (RFC 5321 기본 명령)"""
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode('utf-8'))
+        self.wfile.flush()
+
+    def readline(self):
+        line = self.rfile.readline(65536)
+        if not line:
+            raise ConnectionResetError
+        return line.decode('utf-8', 'replace').rstrip('\r\n')
+
+    def handle(self):
+        provider = PROVIDERS['smtp']
+        try:
+            # 421 at connect: server unavailable (DATA faults are drawn separately)
+            if provider.connect_faults.pick():
+                self.reply('421 4.3.2 Service not available, closing channel')
+                provider.stats.begin()
+                provider.stats.end(421, time.time())
+                return
+
+            self.reply('220 localhost ESMTP mock_providers')
+            recipients = []
+
+            while True:
+                line = self.readline()
+                command = line[:4].upper()
+
+                if command in ('EHLO', 'HELO'):
+                    if command == 'EHLO':
+                        self.reply('250-localhost')
+                        self.reply('250-AUTH PLAIN LOGIN')
+                        self.reply('250-8BITMIME')
+                        self.reply('250 SIZE 26214400')
+                    else:
+                        self.reply('250 localhost')
+                elif command == 'AUTH':
+                    parts = line.split()
+                    if len(parts) >= 2 and parts[1].upper() == 'LOGIN':
+                        self.reply('334 VXNlcm5hbWU6')
+                        self.readline()
+                        self.reply('334 UGFzc3dvcmQ6')
+                        self.readline()
+                    elif len(parts) == 2:
+                        # AUTH PLAIN without initial response
+                        self.reply('334 ')
+                        self.readline()
+                    self.reply('235 2.7.0 Authentication successful')
+                elif command == 'MAIL':
+                    recipients = []
+                    self.reply('250 2.1.0 OK')
+                elif command == 'RCPT':
+                    recipients.append(line)
+                    self.reply('250 2.1.5 OK')
+                elif command == 'DATA':
+                    self.receive_message(provider, recipients)
+                elif command == 'RSET':
+                    recipients = []
+                    self.reply('250 2.0.0 OK')
+                elif command == 'NOOP':
+                    self.reply('250 2.0.0 OK')
+                elif command == 'QUIT':
+                    self.reply('221 2.0.0 Bye')
+                    return
+                else:
+                    self.reply('502 5.5.2 Command not implemented')
+        except (ConnectionResetError, BrokenPipeError):
+            return
+
+    def receive_message(self, provider, recipients):
+        self.reply('354 End data with <CR><LF>.<CR><LF>')
+        started = time.time()
+        provider.stats.begin()
+        size = 0
+        status = 250
+        try:
+            while True:
+                line = self.rfile.readline(1024 * 1024)
+                if not line:
+                    status = 'aborted'
+                    raise ConnectionResetError
+                if line in (b'.\r\n', b'.\n'):
+                    break
+                size += len(line)
+
+            time.sleep(provider.latency.seconds())
+
+            fault = provider.faults.pick()
+            if fault:
+                status = fault
+                self.reply(f'{fault} 4.3.0 Temporary failure, try again later')
+            else:
+                self.reply(f'250 2.0.0 OK queued as {uuid.uuid4().hex[:12]} ({len(recipients)} rcpt)')
+        finally:
+            provider.stats.end(status, started, size, 0)
+
+
+class ThreadingSMTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+# ============================================================================
+# 실행
+# ============================================================================
+
+def parse_statuses(value):
+    return [int(s) for s in value.split(',') if s.strip()]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='OpenRouter / SMTP 대역 서버')
+    parser.add_argument('--http-port', type=int, default=DEFAULT_HTTP_PORT, help='OpenRouter 호환 서버 포트')
+    parser.add_argument('--smtp-port', type=int, default=DEFAULT_SMTP_PORT, help='SMTP 싱크 포트')
+    parser.add_argument('--ai-latency', default='lognormal:800,0.4',
+                        help='AI 응답 지연 분포 (fixed:ms, uniform:a,b, normal:mean,sd, lognormal:median,sigma)')
+    parser.add_argument('--ai-error-rate', type=float, default=0.0, help='AI 오류 비율 (0~1)')
+    parser.add_argument('--ai-error-statuses', type=parse_statuses, default=[429, 503], help='AI 오류 상태 코드')
+    parser.add_argument('--smtp-latency', default='uniform:20,120', help='SMTP DATA 처리 지연 분포')
+    parser.add_argument('--smtp-error-rate', type=float, default=0.0, help='SMTP DATA 오류 비율 (0~1)')
+    parser.add_argument('--smtp-error-statuses', type=parse_statuses, default=[451],
+                        help='SMTP DATA 오류 코드 (451: 일시 실패, 452: 저장 공간 부족)')
+    parser.add_argument('--smtp-connect-error-rate', type=float, default=0.0,
+                        help='SMTP 연결 거부(421) 비율 (0~1)')
+    parser.add_argument('--report-interval', type=float, default=10, help='카운터 출력 간격(초), 0이면 끔')
+    parser.add_argument('--seed', type=int, help='난수 시드 (재현용)')
+    return parser.parse_args()
+
+
+def print_stats():
+    for name, provider in PROVIDERS.items():
+        s = provider.stats.snapshot()
+        print(
+            f'[{name:4}] 총 {s["total"]}건 ({s["perSecond"]}/s), 진행 중 {s["inFlight"]} '
+            f'(최대 {s["maxInFlight"]}), p50 {s["latencyMs"]["p50"]}ms, p95 {s["latencyMs"]["p95"]}ms, '
+            f'상태 {s["byStatus"]}'
+        )
+
+
+def main():
+    args = parse_args()
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    try:
+        PROVIDERS['ai'] = Provider(Latency(args.ai_latency), Faults(args.ai_error_rate, args.ai_error_statuses))
+        PROVIDERS['smtp'] = Provider(
+            Latency(args.smtp_latency),
+            Faults(args.smtp_error_rate, args.smtp_error_statuses),
+            connect_faults=Faults(args.smtp_connect_error_rate, [421]),
+        )
+    except ValueError as e:
+        print(f'❌ {e}')
+        return 1
+
+    http_server = ThreadingHTTPServer(('127.0.0.1', args.http_port), OpenRouterHandler)
+    http_server.daemon_threads = True
+    smtp_server = ThreadingSMTPServer(('127.0.0.1', args.smtp_port), SMTPHandler)
+
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    threading.Thread(target=smtp_server.serve_forever, daemon=True).start()
+
+    print('=' * 60)
+    print('외부 서비스 대역 서버')
+    print(f'OpenRouter: http://localhost:{args.http_port}/api/v1  ({args.ai_latency}, 오류율 {args.ai_error_rate})')
+    print(
+        f'SMTP:       localhost:{args.smtp_port}  ({args.smtp_latency}, '
+        f'연결 오류율 {args.smtp_connect_error_rate}, DATA 오류율 {args.smtp_error_rate})'
+    )
+    print(f'카운터:     http://localhost:{args.http_port}/stats')
+    print('=' * 60)
+
+    try:
+        while True:
+            time.sleep(args.report_interval or 3600)
+            if args.report_interval:
+                print_stats()
+    except KeyboardInterrupt:
+        print('\n최종 카운터')
+        print_stats()
+    finally:
+        http_server.shutdown()
+        smtp_server.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
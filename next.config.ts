@@ -1,7 +1,9 @@
 import type { NextConfig } from "next";
 
 const nextConfig: NextConfig = {
-  /* config options here */
+  // Required at runtime by the password hashing worker (lib/password.ts),
+  // which loads it with require() outside the bundle
+  serverExternalPackages: ["bcryptjs"],
 };
 
 export default nextConfig;
@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+"""
+API 트래픽 리플레이
+- TRAFFIC_LOG=1 로 실행한 서버 로그의 `[traffic] {...}` 줄(또는 같은 형식의 JSONL)을 읽음
+- 원래 세션을 역할별 시드 계정에, 원래 티켓/카테고리/사용자 ID를 로컬 인스턴스의 ID에 대응시킴
+- 요청 간격을 유지한 채 1x / 10x / 100x 속도로 재생 (세션 안의 요청 순서는 항상 유지)
+- 라우트별 지연 시간(p50/p95/p99)과 오류를 집계하고, 이전 리플레이 결과(--compare)와 비교
+
+로그 줄 형식 (lib/traffic-log.ts):
+  {"ts": "...", "method": "PATCH", "path": "/api/tickets/<uuid>", "route": "/api/tickets/[id]",
+   "role": "agent", "session": "<salted hash>", "body": {"status": "=resolved"}}
+가려진 쿼리 값([redacted])은 임의의 값으로 채워 재생합니다.
+status / durationMs 필드가 있는 로그는 그 값을 원래 실행 결과로 사용합니다.
+
+계정은 --accounts accounts.json ({"agent": [{"email": "...", "password": "..."}], ...})
+또는 PERF_<ROLE>_EMAIL / PERF_<ROLE>_PASSWORD 환경변수로 지정합니다.
+
+사용법:
+  TRAFFIC_LOG=1 npm start | tee server.log               # 캡처
+  python replay_traffic.py server.log --speed 10         # 10배속 재생
+  python replay_traffic.py server.log --speed 1 --output replay_1x.json
+  python replay_traffic.py server.log --speed 100 --compare replay_1x.json
+  python replay_traffic.py server.log --extract traffic.jsonl   # 로그에서 트래픽만 추출
+"""
+
+import argparse
+import http.cookiejar
+import json
+import os
+import re
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+BASE_URL = os.environ.get('BASE_URL', 'http://localhost:3002')
+
+RESULTS_FILE = 'test_results_replay.json'
+
+TRAFFIC_PREFIX = '[traffic] '
+
+# 캡처 시 가려진 쿼리 값 (lib/traffic-log.ts)
+REDACTED = '[redacted]'
+
+DEFAULT_ACCOUNTS = {
+    'customer': ('testcustomer@test.com', 'Test1234!'),
+    'agent': ('testagent@test.com', 'Agent1234!'),
+    'manager': ('manager@example.com', 'Manager123!'),
+    'admin': ('admin@example.com', 'Admin123!'),
+}
+
+UUID_PATTERN = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.I)
+
+# 경로의 ID 앞 세그먼트 -> 로컬 ID 목록을 가져올 API
+RESOURCE_POOLS = {
+    'tickets': '/api/tickets?pageSize=100',
+    'categories': '/api/categories',
+    'users': '/api/users?pageSize=100',
+    'templates': '/api/templates',
+    'knowledge-base': '/api/knowledge-base',
+}
+
+# 본문 키 -> 리소스 (ID 값 합성용)
+BODY_ID_RESOURCES = {
+    'ticketId': 'tickets',
+    'ticketIds': 'tickets',
+    'categoryId': 'categories',
+    'agentId': 'agents',
+    'userId': 'users',
+    'templateId': 'templates',
+}
+
+REQUEST_TIMEOUT = 60
+
+
+# ============================================================================
+# 로그 읽기
+# ============================================================================
+
+def read_traffic(path):
+    """서버 로그 또는 JSONL에서 트래픽 항목을 시간순으로 읽음"""
+    entries = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if TRAFFIC_PREFIX in line:
+                line = line.split(TRAFFIC_PREFIX, 1)[1]
+            elif not line.startswith('{'):
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if not {'ts', 'method', 'path'} <= entry.keys():
+                continue
+            entry['time'] = datetime.fromisoformat(entry['ts'].replace('Z', '+00:00')).timestamp()
+            entry.setdefault('route', UUID_PATTERN.sub('[id]', entry['path'].split('?')[0]))
+            entries.append(entry)
+    entries.sort(key=lambda e: e['time'])
+    return entries
+
+
+def route_key(entry):
+    return f'{entry["method"]} {entry["route"]}'
+
+
+# ============================================================================
+# 세션 / 계정 / ID 대응
+# ============================================================================
+
+class Session:
+    """로그인한 계정 하나 (쿠키 유지)"""
+
+    def __init__(self, role, email, password):
+        self.role = role
+        self.email = email
+        self.password = password
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies))
+
+    def request(self, method, path, body=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        request = urllib.request.Request(f'{BASE_URL}{path}', data=data, method=method)
+        if data is not None:
+            request.add_header('Content-Type', 'application/json')
+        try:
+            with self.opener.open(request, timeout=REQUEST_TIMEOUT) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+    def login(self):
+        try:
+            return self._login()
+        except (urllib.error.URLError, OSError) as e:
+            print(f'[ERROR] {BASE_URL} 연결 실패: {e}')
+            return False
+
+    def _login(self):
+        status, raw = self.request('GET', '/api/auth/csrf')
+        if status != 200:
+            return False
+        csrf = json.loads(raw)['csrfToken']
+        form = urllib.parse.urlencode({
+            'csrfToken': csrf,
+            'email': self.email,
+            'password': self.password,
+            'json': 'true',
+        }).encode('utf-8')
+        request = urllib.request.Request(
+            f'{BASE_URL}/api/auth/callback/credentials', data=form, method='POST',
+            headers={'Content-Type': 'application/x-www-form-urlencoded'},
+        )
+        try:
+            self.opener.open(request, timeout=REQUEST_TIMEOUT).read()
+        except urllib.error.HTTPError:
+            pass
+        status, raw = self.request('GET', '/api/auth/session')
+        return status == 200 and bool(json.loads(raw or b'{}').get('user'))
+
+
+def load_accounts(path):
+    if path:
+        with open(path, encoding='utf-8') as f:
+            return {
+                role: [(a['email'], a['password']) for a in accounts]
+                for role, accounts in json.load(f).items()
+            }
+    return {
+        role: [(
+            os.environ.get(f'PERF_{role.upper()}_EMAIL', email),
+            os.environ.get(f'PERF_{role.upper()}_PASSWORD', password),
+        )]
+        for role, (email, password) in DEFAULT_ACCOUNTS.items()
+    }
+
+
+def extract_ids(raw):
+    """API 응답에서 id 목록을 찾음 (data 배열 또는 data 안의 첫 배열)"""
+    try:
+        data = json.loads(raw).get('data')
+    except (ValueError, AttributeError):
+        return []
+    if isinstance(data, dict):
+        data = next((v for v in data.values() if isinstance(v, list)), [])
+    return [item['id'] for item in data or [] if isinstance(item, dict) and 'id' in item]
+
+
+class Mapper:
+    """원래 세션 -> 로그인한 계정, 원래 ID -> 로컬 ID"""
+
+    def __init__(self, accounts):
+        self.accounts = accounts
+        self.logged_in = {}
+        self.session_map = {}
+        self.next_account = defaultdict(int)
+        self.pools = {}
+        self.id_map = {}
+        self._lock = threading.Lock()
+
+    def login_all(self, roles):
+        for role in roles:
+            sessions = []
+            for email, password in self.accounts.get(role, []):
+                session = Session(role, email, password)
+                if session.login():
+                    print(f'[SUCCESS] {role} 로그인: {email}')
+                    sessions.append(session)
+                else:
+                    print(f'[FAIL] {role} 로그인 실패: {email}')
+            self.logged_in[role] = sessions
+
+    def session_for(self, entry):
+        """원래 세션마다 같은 역할의 계정을 돌아가며 배정"""
+        role = entry.get('role')
+        sessions = self.logged_in.get(role) or []
+        if not sessions:
+            return None
+        key = entry.get('session') or f'anonymous-{role}'
+        with self._lock:
+            if key not in self.session_map:
+                self.session_map[key] = sessions[self.next_account[role] % len(sessions)]
+                self.next_account[role] += 1
+            return self.session_map[key]
+
+    def pool(self, resource, session):
+        """리소스의 로컬 ID 목록 (티켓은 계정별로 접근 가능한 것만)"""
+        key = (resource, session.email if resource == 'tickets' else None)
+        with self._lock:
+            if key in self.pools:
+                return self.pools[key]
+
+        if resource == 'agents':
+            fetcher = self._any_session('admin') or session
+            ids = extract_ids(fetcher.request('GET', '/api/users?role=agent&pageSize=100')[1])
+        elif resource in RESOURCE_POOLS:
+            fetcher = session if resource == 'tickets' else (self._any_session('admin') or session)
+            ids = extract_ids(fetcher.request('GET', RESOURCE_POOLS[resource])[1])
+        else:
+            ids = []
+
+        with self._lock:
+            self.pools[key] = ids
+        return ids
+
+    def _any_session(self, role):
+        sessions = self.logged_in.get(role) or []
+        return sessions[0] if sessions else None
+
+    def local_id(self, resource, original, session):
+        """원래 ID를 항상 같은 로컬 ID로 대응 (없으면 원래 값 유지)"""
+        with self._lock:
+            mapped = self.id_map.get((resource, original))
+        if mapped:
+            return mapped
+        ids = self.pool(resource, session)
+        if not ids:
+            return original
+        with self._lock:
+            used = sum(1 for (r, _) in self.id_map if r == resource)
+            mapped = self.id_map.setdefault((resource, original), ids[used % len(ids)])
+        return mapped
+
+    def map_path(self, path, session):
+        """경로의 /<리소스>/<id> 와 쿼리의 xxxId=<id> 를 로컬 ID로 바꿈"""
+        pathname, _, query = path.partition('?')
+        segments = pathname.split('/')
+        for index, segment in enumerate(segments):
+            if index > 0 and UUID_PATTERN.fullmatch(segment):
+                segments[index] = self.local_id(segments[index - 1], segment, session)
+        mapped = '/'.join(segments)
+
+        if not query:
+            return mapped
+        params = []
+        for key, value in urllib.parse.parse_qsl(query, keep_blank_values=True):
+            if key in BODY_ID_RESOURCES and UUID_PATTERN.fullmatch(value):
+                value = self.local_id(BODY_ID_RESOURCES[key], value, session)
+            elif value == REDACTED:
+                value = synthesize_string(key, 0)
+            params.append((key, value))
+        return f'{mapped}?{urllib.parse.urlencode(params)}'
+
+    def synthesize(self, shape, session, key=None, counter=0):
+        """본문 모양(키와 타입)에서 요청 본문을 만듦"""
+        if isinstance(shape, dict):
+            return {k: self.synthesize(v, session, k, counter) for k, v in shape.items()}
+        if isinstance(shape, list):
+            if not shape:
+                return []
+            length = 1
+            if len(shape) > 1 and isinstance(shape[1], str) and shape[1].startswith('length:'):
+                length = int(shape[1].split(':', 1)[1])
+            resource = BODY_ID_RESOURCES.get(key or '')
+            if resource:
+                ids = self.pool(resource, session)
+                return ids[:length] if ids else []
+            return [self.synthesize(shape[0], session, key, counter) for _ in range(length)]
+        if isinstance(shape, str) and shape.startswith('='):
+            return shape[1:]
+        if shape == 'string':
+            resource = BODY_ID_RESOURCES.get(key or '')
+            if resource:
+                ids = self.pool(resource, session)
+                return ids[counter % len(ids)] if ids else None
+            return synthesize_string(key, counter)
+        if shape == 'number':
+            return 1
+        if shape == 'boolean':
+            return False
+        return None
+
+
+def synthesize_string(key, counter):
+    key = (key or '').lower()
+    if key == 'email':
+        return f'replay-{int(time.time() * 1000)}-{counter}@example.invalid'
+    if 'password' in key:
+        return 'Replay1234!'
+    if key in ('title', 'name', 'subject'):
+        return f'리플레이 {key} {counter}'
+    if key in ('content', 'description', 'message', 'body', 'comment'):
+        return '트래픽 리플레이로 생성된 내용입니다. ' * 3
+    if key.endswith('date') or key.endswith('at'):
+        return datetime.now().date().isoformat()
+    return 'replay'
+
+
+# ============================================================================
+# 재생
+# ============================================================================
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes = defaultdict(lambda: {'latency': [], 'statuses': defaultdict(int), 'errors': 0})
+        self.lag_ms = []
+        self.skipped = defaultdict(int)
+
+    def record(self, key, status, latency_ms, lag_ms):
+        with self._lock:
+            route = self.routes[key]
+            route['latency'].append(latency_ms)
+            route['statuses'][str(status)] += 1
+            if not isinstance(status, int) or status >= 400:
+                route['errors'] += 1
+            self.lag_ms.append(lag_ms)
+
+    def skip(self, reason):
+        with self._lock:
+            self.skipped[reason] += 1
+
+
+class SessionQueue:
+    """세션 하나의 요청을 순서대로 실행 (동시에 한 요청만)"""
+
+    def __init__(self, executor, run):
+        self.executor = executor
+        self.run = run
+        self.pending = deque()
+        self.running = False
+        self._lock = threading.Lock()
+
+    def submit(self, item):
+        with self._lock:
+            self.pending.append(item)
+            if self.running:
+                return
+            self.running = True
+        self.executor.submit(self.drain)
+
+    def drain(self):
+        while True:
+            with self._lock:
+                if not self.pending:
+                    self.running = False
+                    return
+                item = self.pending.popleft()
+            self.run(*item)
+
+
+def replay(entries, mapper, recorder, speed, workers):
+    start_original = entries[0]['time']
+    start = time.time()
+    queues = {}
+
+    def execute(entry, scheduled, counter):
+        session = mapper.session_for(entry)
+        if session is None:
+            recorder.skip(f'no_account:{entry.get("role")}')
+            return
+        path = mapper.map_path(entry['path'], session)
+        body = None
+        if isinstance(entry.get('body'), (dict, list)):
+            body = mapper.synthesize(entry['body'], session, counter=counter)
+        elif entry.get('body') == 'multipart':
+            recorder.skip('multipart')
+            return
+
+        sent = time.time()
+        try:
+            status, _ = session.request(entry['method'], path, body)
+        except Exception as e:
+            status = type(e).__name__
+        recorder.record(route_key(entry), status, (time.time() - sent) * 1000, (sent - scheduled) * 1000)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for counter, entry in enumerate(entries):
+            scheduled = start + (entry['time'] - start_original) / speed
+            delay = scheduled - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+            key = entry.get('session') or f'anonymous-{entry.get("role")}'
+            if key not in queues:
+                queues[key] = SessionQueue(executor, execute)
+            queues[key].submit((entry, scheduled, counter))
+
+            if counter and counter % 1000 == 0:
+                print(f'  {counter}/{len(entries)} 요청 예약됨 ({time.time() - start:.0f}초)')
+
+    return time.time() - start
+
+
+# ============================================================================
+# 리포트
+# ============================================================================
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(values):
+    if not values:
+        return None
+    return {
+        'p50': round(percentile(values, 0.5), 1),
+        'p95': round(percentile(values, 0.95), 1),
+        'p99': round(percentile(values, 0.99), 1),
+        'mean': round(statistics.mean(values), 1),
+    }
+
+
+def original_run(entries):
+    """로그에 status / durationMs 가 있으면 원래 실행 결과로 집계"""
+    routes = defaultdict(lambda: {'latency': [], 'errors': 0, 'count': 0})
+    for entry in entries:
+        if 'status' not in entry and 'durationMs' not in entry:
+            continue
+        route = routes[route_key(entry)]
+        route['count'] += 1
+        if 'durationMs' in entry:
+            route['latency'].append(entry['durationMs'])
+        if isinstance(entry.get('status'), int) and entry['status'] >= 400:
+            route['errors'] += 1
+    return {
+        key: {
+            'count': r['count'],
+            'errorRate': round(r['errors'] / r['count'], 4),
+            'latencyMs': summarize(r['latency']),
+        }
+        for key, r in routes.items()
+    }
+
+
+def build_report(entries, recorder, elapsed, speed):
+    original_span = entries[-1]['time'] - entries[0]['time']
+    routes = {}
+    for key, route in sorted(recorder.routes.items()):
+        count = len(route['latency'])
+        routes[key] = {
+            'count': count,
+            'errors': route['errors'],
+            'errorRate': round(route['errors'] / count, 4) if count else 0,
+            'statuses': dict(route['statuses']),
+            'latencyMs': summarize(route['latency']),
+        }
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'baseUrl': BASE_URL,
+        'speed': speed,
+        'requests': len(entries),
+        'originalSeconds': round(original_span, 1),
+        'replaySeconds': round(elapsed, 1),
+        'scheduleLagMs': summarize(recorder.lag_ms),
+        'skipped': dict(recorder.skipped),
+        'routes': routes,
+        'original': original_run(entries),
+    }
+
+
+def compare(report, previous):
+    """라우트별 p50/p95 와 오류율 변화"""
+    rows = []
+    for key, current in report['routes'].items():
+        before = previous.get(key)
+        if not before or not before.get('latencyMs') or not current.get('latencyMs'):
+            continue
+        rows.append({
+            'route': key,
+            'p50': (before['latencyMs']['p50'], current['latencyMs']['p50']),
+            'p95': (before['latencyMs']['p95'], current['latencyMs']['p95']),
+            'errorRate': (before.get('errorRate', 0), current['errorRate']),
+        })
+    return rows
+
+
+def print_report(report, comparison, compare_label):
+    print(f'\n원래 {report["originalSeconds"]}초 -> 재생 {report["replaySeconds"]}초 ({report["speed"]}x)')
+    lag = report['scheduleLagMs']
+    if lag:
+        print(f'예약 대비 지연: p50 {lag["p50"]}ms, p95 {lag["p95"]}ms (클라이언트가 밀리면 커짐)')
+    if report['skipped']:
+        print(f'건너뜀: {report["skipped"]}')
+
+    print(f'\n{"라우트":45} {"건수":>6} {"오류율":>7} {"p50":>9} {"p95":>9} {"p99":>9}')
+    for key, route in report['routes'].items():
+        latency = route['latencyMs'] or {}
+        print(
+            f'{key:45} {route["count"]:6} {route["errorRate"] * 100:6.1f}% '
+            f'{latency.get("p50", 0):8.1f}ms {latency.get("p95", 0):8.1f}ms {latency.get("p99", 0):8.1f}ms'
+        )
+
+    if comparison:
+        print(f'\n=== {compare_label} 대비 ===')
+        for row in comparison:
+            (b50, a50), (b95, a95), (be, ae) = row['p50'], row['p95'], row['errorRate']
+            mark = '❌' if a95 > b95 * 1.5 or ae > be + 0.01 else '✅'
+            print(
+                f'{mark} {row["route"]:45} p50 {b50:.0f} -> {a50:.0f}ms, '
+                f'p95 {b95:.0f} -> {a95:.0f}ms, 오류율 {be * 100:.1f}% -> {ae * 100:.1f}%'
+            )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='API 트래픽 리플레이')
+    parser.add_argument('log', help='서버 로그 또는 트래픽 JSONL')
+    parser.add_argument('--speed', type=float, default=1.0, help='재생 배속 (1, 10, 100 ...)')
+    parser.add_argument('--accounts', help='역할별 계정 JSON 파일')
+    parser.add_argument('--workers', type=int, default=64, help='동시 요청 스레드 수')
+    parser.add_argument('--limit', type=int, help='앞에서부터 재생할 요청 수')
+    parser.add_argument('--compare', help='비교할 이전 리플레이 결과 JSON')
+    parser.add_argument('--output', default=RESULTS_FILE, help='결과 JSON 파일')
+    parser.add_argument('--extract', help='재생하지 않고 트래픽 JSONL만 저장')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    entries = read_traffic(args.log)
+    if args.limit:
+        entries = entries[:args.limit]
+    if not entries:
+        print(f'❌ {args.log} 에서 트래픽 항목을 찾지 못했습니다 (TRAFFIC_LOG=1 로 캡처하세요)')
+        return 1
+
+    if args.extract:
+        with open(args.extract, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps({k: v for k, v in entry.items() if k != 'time'}, ensure_ascii=False) + '\n')
+        print(f'트래픽 {len(entries)}건 저장: {args.extract}')
+        return 0
+
+    mix = defaultdict(int)
+    for entry in entries:
+        mix[route_key(entry)] += 1
+    roles = sorted({e.get('role') for e in entries if e.get('role')})
+
+    print('=' * 60)
+    print('API 트래픽 리플레이')
+    print(f'대상: {BASE_URL}, 요청 {len(entries)}건, 세션 {len({e.get("session") for e in entries})}개, {args.speed}x')
+    for key, count in sorted(mix.items(), key=lambda item: -item[1])[:15]:
+        print(f'  {count:6}  {key}')
+    print('=' * 60)
+
+    mapper = Mapper(load_accounts(args.accounts))
+    mapper.login_all(roles)
+    if not any(mapper.logged_in.values()):
+        print('❌ 로그인한 계정이 없습니다')
+        return 1
+
+    recorder = Recorder()
+    elapsed = replay(entries, mapper, recorder, args.speed, args.workers)
+    report = build_report(entries, recorder, elapsed, args.speed)
+
+    comparison = []
+    compare_label = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+        comparison = compare(report, previous.get('routes', {}))
+        compare_label = f'{args.compare} ({previous.get("speed")}x)'
+    elif report['original']:
+        comparison = compare(report, report['original'])
+        compare_label = '원래 실행'
+    report['comparison'] = comparison
+
+    print_report(report, comparison, compare_label)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f'\n결과 저장: {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,185 @@
+/**
+ * 라우트 콜드 스타트 벤치마크
+ * - 매 측정마다 새 `next start` 프로세스를 띄우고, 포트가 열린 뒤
+ *   대상 라우트에 보내는 첫 요청의 응답 시간(모듈 로드 + 핸들러)을 잰다
+ * - 같은 프로세스에 보낸 두 번째 요청 시간(웜)과 비교한다
+ *
+ * 사전 준비: npm run build (프로덕션 빌드 필요)
+ * 사용법: npm run bench:cold-start -- [반복 횟수] [라우트...]
+ *   인증이 필요한 라우트(/api/tickets, /api/reports/*)는
+ *   BENCH_COOKIE="authjs.session-token=..." 가 있을 때만 측정한다
+ *   (쿠키가 없으면 미들웨어가 /login 으로 리다이렉트해서 라우트 모듈이 로드되지 않는다)
+ * 리다이렉트(3xx) 응답은 측정 오류로 처리한다
+ */
+
+import { spawn } from 'child_process';
+import type { ChildProcess } from 'child_process';
+import { connect } from 'net';
+import { performance } from 'perf_hooks';
+import path from 'path';
+
+interface RouteTarget {
+  name: string;
+  path: string;
+  method?: 'GET' | 'POST';
+  body?: unknown;
+  requiresAuth?: boolean;
+}
+
+const DEFAULT_ROUTES: RouteTarget[] = [
+  { name: 'GET /api/tickets', path: '/api/tickets', requiresAuth: true },
+  { name: 'GET /api/auth/session', path: '/api/auth/session' },
+  { name: 'GET /api/auth/csrf', path: '/api/auth/csrf' },
+  // Invalid body: validation fails after the route module (and bcrypt pool module) has loaded
+  { name: 'POST /api/auth/register', path: '/api/auth/register', method: 'POST', body: {} },
+  {
+    name: 'GET /api/reports/overview',
+    path: '/api/reports/overview?startDate=2026-01-01&endDate=2026-01-31',
+    requiresAuth: true,
+  },
+];
+
+const RUNS = parseInt(process.argv[2] || '', 10) || 5;
+const ROUTE_FILTER = process.argv.slice(3);
+const PORT = parseInt(process.env.BENCH_PORT || '', 10) || 3900;
+const BOOT_TIMEOUT_MS = 60000;
+const COOKIE = process.env.BENCH_COOKIE;
+
+const NEXT_BIN = path.join(
+  process.cwd(),
+  'node_modules',
+  '.bin',
+  process.platform === 'win32' ? 'next.cmd' : 'next'
+);
+
+function sleep(ms: number) {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+/**
+ * Wait until the port accepts connections, without sending an HTTP request
+ * (a request would load some route and skew the measurement)
+ */
+async function waitForPort(port: number, timeoutMs: number): Promise<void> {
+  const deadline = Date.now() + timeoutMs;
+  while (Date.now() < deadline) {
+    const open = await new Promise<boolean>((resolve) => {
+      const socket = connect(port, '127.0.0.1');
+      socket.once('connect', () => {
+        socket.destroy();
+        resolve(true);
+      });
+      socket.once('error', () => resolve(false));
+    });
+    if (open) return;
+    await sleep(25);
+  }
+  throw new Error(`서버가 ${timeoutMs}ms 안에 시작되지 않았습니다`);
+}
+
+async function timeRequest(target: RouteTarget): Promise<{ ms: number; status: number }> {
+  const start = performance.now();
+  const response = await fetch(`http://127.0.0.1:${PORT}${target.path}`, {
+    method: target.method || 'GET',
+    headers: {
+      ...(COOKIE ? { cookie: COOKIE } : {}),
+      ...(target.body ? { 'content-type': 'application/json' } : {}),
+    },
+    body: target.body ? JSON.stringify(target.body) : undefined,
+    // A followed redirect would time another page instead of this route
+    redirect: 'manual',
+  });
+  await response.arrayBuffer();
+
+  if (response.status >= 300 && response.status < 400) {
+    throw new Error(
+      `${target.name}: ${response.status} 리다이렉트 (${response.headers.get('location')}) - ` +
+        'BENCH_COOKIE가 유효한지 확인하세요'
+    );
+  }
+  return { ms: performance.now() - start, status: response.status };
+}
+
+function startServer(): ChildProcess {
+  return spawn(NEXT_BIN, ['start', '-p', String(PORT)], {
+    env: { ...process.env, NODE_ENV: 'production' },
+    stdio: 'ignore',
+  });
+}
+
+async function stopServer(server: ChildProcess): Promise<void> {
+  if (server.exitCode !== null) return;
+  const exited = new Promise((resolve) => server.once('exit', resolve));
+  server.kill('SIGTERM');
+  await Promise.race([exited, sleep(5000)]);
+  if (server.exitCode === null) server.kill('SIGKILL');
+}
+
+async function measureRoute(target: RouteTarget) {
+  const boot: number[] = [];
+  const cold: number[] = [];
+  const warm: number[] = [];
+  let status = 0;
+
+  for (let run = 0; run < RUNS; run++) {
+    const spawnedAt = performance.now();
+    const server = startServer();
+    try {
+      await waitForPort(PORT, BOOT_TIMEOUT_MS);
+      boot.push(performance.now() - spawnedAt);
+
+      const first = await timeRequest(target);
+      cold.push(first.ms);
+      status = first.status;
+
+      warm.push((await timeRequest(target)).ms);
+    } finally {
+      await stopServer(server);
+    }
+  }
+
+  return { boot, cold, warm, status };
+}
+
+function median(values: number[]): number {
+  const sorted = [...values].sort((a, b) => a - b);
+  const middle = Math.floor(sorted.length / 2);
+  return sorted.length % 2 ? sorted[middle] : (sorted[middle - 1] + sorted[middle]) / 2;
+}
+
+async function main() {
+  const selected = ROUTE_FILTER.length
+    ? DEFAULT_ROUTES.filter((route) => ROUTE_FILTER.some((filter) => route.path.startsWith(filter)))
+    : DEFAULT_ROUTES;
+
+  if (selected.length === 0) {
+    throw new Error(`일치하는 라우트가 없습니다: ${ROUTE_FILTER.join(', ')}`);
+  }
+
+  const skipped = COOKIE ? [] : selected.filter((route) => route.requiresAuth);
+  const routes = selected.filter((route) => !skipped.includes(route));
+
+  if (routes.length === 0) {
+    throw new Error(`인증이 필요한 라우트입니다. BENCH_COOKIE를 설정하세요: ${skipped.map((r) => r.name).join(', ')}`);
+  }
+
+  console.log('🧊 라우트 콜드 스타트 벤치마크');
+  console.log(`라우트당 새 프로세스 ${RUNS}회${COOKIE ? ' (인증 쿠키 사용)' : ''}`);
+  if (skipped.length > 0) {
+    console.log(`⚠️  BENCH_COOKIE가 없어 건너뜀: ${skipped.map((route) => route.name).join(', ')}`);
+  }
+  console.log('');
+
+  for (const route of routes) {
+    const { boot, cold, warm, status } = await measureRoute(route);
+    console.log(
+      `${route.name} [${status}]: 첫 응답 ${median(cold).toFixed(0)}ms, ` +
+        `웜 ${median(warm).toFixed(1)}ms, 서버 기동 ${median(boot).toFixed(0)}ms (중앙값)`
+    );
+  }
+}
+
+main().catch((error) => {
+  console.error('❌ 벤치마크 실패:', error);
+  process.exit(1);
+});
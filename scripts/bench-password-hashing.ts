@@ -0,0 +1,104 @@
+/**
+ * 비밀번호 해싱 벤치마크
+ * - 로그인 폭주 상황에서 메인 스레드 bcryptjs와 워커 풀 비교
+ * - 로그인 처리량(초당), 로그인 지연 p50/p95/p99
+ * - 이벤트 루프 지연 (다른 요청이 얼마나 막히는지)
+ *
+ * 사용법: npm run bench:password -- [로그인 수] [동시성]
+ *   BCRYPT_COST, PASSWORD_HASH_WORKERS 환경 변수로 설정 변경
+ */
+
+import bcrypt from 'bcryptjs';
+import { monitorEventLoopDelay, performance } from 'perf_hooks';
+import {
+  PASSWORD_HASH_COST,
+  hashPassword,
+  verifyPassword,
+  getPasswordPoolStats,
+} from '../lib/password';
+
+const TOTAL_LOGINS = parseInt(process.argv[2] || '', 10) || 200;
+const CONCURRENCY = parseInt(process.argv[3] || '', 10) || 50;
+const PASSWORD = 'password123';
+
+interface BenchResult {
+  name: string;
+  durationMs: number;
+  latencies: number[];
+  loopDelayP99Ms: number;
+  loopDelayMaxMs: number;
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return 0;
+  const index = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(index, 0)];
+}
+
+async function runStorm(
+  name: string,
+  verify: (password: string, hash: string) => Promise<boolean>,
+  hash: string
+): Promise<BenchResult> {
+  const latencies: number[] = [];
+  const histogram = monitorEventLoopDelay({ resolution: 10 });
+  let next = 0;
+
+  const worker = async () => {
+    while (next < TOTAL_LOGINS) {
+      next++;
+      const start = performance.now();
+      const ok = await verify(PASSWORD, hash);
+      latencies.push(performance.now() - start);
+      if (!ok) throw new Error('비밀번호 검증 실패');
+    }
+  };
+
+  histogram.enable();
+  const start = performance.now();
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+  const durationMs = performance.now() - start;
+  histogram.disable();
+
+  return {
+    name,
+    durationMs,
+    latencies: latencies.sort((a, b) => a - b),
+    loopDelayP99Ms: histogram.percentile(99) / 1e6,
+    loopDelayMaxMs: histogram.max / 1e6,
+  };
+}
+
+function printResult(result: BenchResult) {
+  const { latencies } = result;
+  console.log(`\n=== ${result.name} ===`);
+  console.log(`처리량: ${((latencies.length / result.durationMs) * 1000).toFixed(1)} 로그인/초`);
+  console.log(
+    `로그인 지연: p50 ${percentile(latencies, 50).toFixed(0)}ms, ` +
+      `p95 ${percentile(latencies, 95).toFixed(0)}ms, ` +
+      `p99 ${percentile(latencies, 99).toFixed(0)}ms`
+  );
+  console.log(
+    `이벤트 루프 지연: p99 ${result.loopDelayP99Ms.toFixed(1)}ms, ` +
+      `최대 ${result.loopDelayMaxMs.toFixed(1)}ms`
+  );
+}
+
+async function main() {
+  console.log('🔐 비밀번호 해싱 벤치마크');
+  console.log(`로그인 ${TOTAL_LOGINS}회, 동시성 ${CONCURRENCY}, cost ${PASSWORD_HASH_COST}`);
+
+  const hash = await hashPassword(PASSWORD);
+  console.log(`워커 수: ${getPasswordPoolStats().workers}`);
+
+  const mainThread = await runStorm('메인 스레드 (bcryptjs)', (p, h) => bcrypt.compare(p, h), hash);
+  printResult(mainThread);
+
+  const pool = await runStorm('워커 풀', verifyPassword, hash);
+  printResult(pool);
+}
+
+main().catch((error) => {
+  console.error('❌ 벤치마크 실패:', error);
+  process.exit(1);
+});
@@ -0,0 +1,142 @@
+/**
+ * Prepared Statement 벤치마크
+ * - getTickets 목록/카운트 쿼리와 SLA 경고 쿼리를 prepare 끔/켬 상태로 반복 실행
+ * - 쿼리별 평균/p95 지연과 EXPLAIN으로 측정한 계획(planning) 시간 비교
+ *
+ * 사용법: npm run bench:prepared -- [반복 횟수]
+ */
+
+import { config } from 'dotenv';
+config({ path: '.env.local' });
+
+import postgres from 'postgres';
+import { drizzle } from 'drizzle-orm/postgres-js';
+import { and, count, desc, eq, gte, isNull, lte, or } from 'drizzle-orm';
+import { performance } from 'perf_hooks';
+import * as schema from '../lib/db/schema';
+
+const { tickets, users, categories, ticketComments } = schema;
+
+const ITERATIONS = parseInt(process.argv[2] || '', 10) || 500;
+
+type Db = ReturnType<typeof drizzle<typeof schema>>;
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)];
+}
+
+/**
+ * Hot queries, built the same way as in ticket-service and sla-service
+ */
+function hotQueries(db: Db, sampleTicketId: string) {
+  return {
+    'getTickets 목록': () =>
+      db
+        .select({ ticket: tickets, customer: users, category: categories })
+        .from(tickets)
+        .leftJoin(users, eq(tickets.customerId, users.id))
+        .leftJoin(categories, eq(tickets.categoryId, categories.id))
+        .where(eq(tickets.status, 'open'))
+        .orderBy(desc(tickets.createdAt))
+        .limit(10)
+        .offset(0),
+    'getTickets 댓글 수': () =>
+      db
+        .select({ count: count() })
+        .from(ticketComments)
+        .where(eq(ticketComments.ticketId, sampleTicketId)),
+    'SLA 응답 경고': () => {
+      const now = new Date();
+      const warningTime = new Date(now.getTime() + 30 * 60 * 1000);
+      return db
+        .select({ id: tickets.id, title: tickets.title, agentName: users.name, agentEmail: users.email })
+        .from(tickets)
+        .leftJoin(users, eq(tickets.agentId, users.id))
+        .where(
+          and(
+            or(eq(tickets.status, 'open'), eq(tickets.status, 'in_progress')),
+            isNull(tickets.firstResponseAt),
+            isNull(tickets.slaResponseMet),
+            lte(tickets.slaResponseDeadline, warningTime),
+            gte(tickets.slaResponseDeadline, now)
+          )
+        );
+    },
+  };
+}
+
+async function runMode(connectionString: string, prepare: boolean, sampleTicketId: string) {
+  const sql = postgres(connectionString, { prepare, max: 1 });
+  const db = drizzle(sql, { schema });
+  const results: Record<string, { mean: number; p95: number; planningMs: number }> = {};
+
+  try {
+    for (const [name, build] of Object.entries(hotQueries(db, sampleTicketId))) {
+      // Warm up (lets Postgres switch to a generic plan for prepared statements)
+      for (let i = 0; i < 10; i++) await build();
+
+      const latencies: number[] = [];
+      for (let i = 0; i < ITERATIONS; i++) {
+        const start = performance.now();
+        await build();
+        latencies.push(performance.now() - start);
+      }
+      latencies.sort((a, b) => a - b);
+
+      // Planning time of one unprepared execution
+      const query = build().toSQL();
+      const plan = await sql.unsafe(
+        `explain (analyze, summary, format json) ${query.sql}`,
+        query.params as never[]
+      );
+      const planningMs = (plan[0]['QUERY PLAN'] as Array<{ 'Planning Time': number }>)[0]['Planning Time'];
+
+      results[name] = {
+        mean: latencies.reduce((sum, value) => sum + value, 0) / latencies.length,
+        p95: percentile(latencies, 95),
+        planningMs,
+      };
+    }
+  } finally {
+    await sql.end();
+  }
+
+  return results;
+}
+
+async function main() {
+  const connectionString = process.env.DATABASE_URL;
+  if (!connectionString) {
+    throw new Error('DATABASE_URL이 설정되지 않았습니다');
+  }
+
+  console.log('⚡ Prepared Statement 벤치마크');
+  console.log(`쿼리당 ${ITERATIONS}회 실행, 단일 연결\n`);
+
+  const setup = postgres(connectionString, { prepare: false, max: 1 });
+  const [sample] = await setup`select id from tickets order by created_at desc limit 1`;
+  await setup.end();
+
+  const sampleTicketId = sample?.id ?? '00000000-0000-0000-0000-000000000000';
+
+  const unprepared = await runMode(connectionString, false, sampleTicketId);
+  const prepared = await runMode(connectionString, true, sampleTicketId);
+
+  for (const name of Object.keys(unprepared)) {
+    const before = unprepared[name];
+    const after = prepared[name];
+    console.log(`=== ${name} ===`);
+    console.log(`  prepare 끔: 평균 ${before.mean.toFixed(2)}ms, p95 ${before.p95.toFixed(2)}ms`);
+    console.log(`  prepare 켬: 평균 ${after.mean.toFixed(2)}ms, p95 ${after.p95.toFixed(2)}ms`);
+    console.log(
+      `  계획 시간(실행당 절감 가능): ${before.planningMs.toFixed(3)}ms, ` +
+        `평균 지연 변화 ${(before.mean - after.mean).toFixed(2)}ms\n`
+    );
+  }
+}
+
+main().catch((error) => {
+  console.error('❌ 벤치마크 실패:', error);
+  process.exit(1);
+});
@@ -0,0 +1,81 @@
+/**
+ * 요청당 인증 오버헤드 마이크로 벤치마크
+ * - 이전: 요청마다 NextAuth JWT 복호화를 여러 번 수행 (requireAuth + 서비스 재확인)
+ * - 이후: 미들웨어가 서명한 세션 헤더를 요청당 한 번만 검증
+ *
+ * 사용법: npm run bench:auth -- [반복 횟수] [요청당 인증 호출 수]
+ */
+
+import { encode, decode } from 'next-auth/jwt';
+import { performance } from 'perf_hooks';
+import { signSessionHeader, verifySessionHeader } from '../lib/session-header';
+
+const ITERATIONS = parseInt(process.argv[2] || '', 10) || 5000;
+const CALLS_PER_REQUEST = parseInt(process.argv[3] || '', 10) || 2;
+
+const SECRET = process.env.AUTH_SECRET || process.env.NEXTAUTH_SECRET || 'bench-secret-bench-secret-bench-secret';
+const SALT = 'authjs.session-token';
+
+const user = {
+  id: '00000000-0000-0000-0000-000000000001',
+  email: 'agent@example.com',
+  name: '테스트 상담원',
+  role: 'agent' as const,
+};
+
+async function measure(name: string, perRequest: () => Promise<unknown>) {
+  // Warm up
+  for (let i = 0; i < 200; i++) await perRequest();
+
+  const start = performance.now();
+  for (let i = 0; i < ITERATIONS; i++) {
+    await perRequest();
+  }
+  const elapsed = performance.now() - start;
+  const perRequestUs = (elapsed / ITERATIONS) * 1000;
+
+  console.log(`${name}: ${perRequestUs.toFixed(1)}µs/요청 (${ITERATIONS}회, 총 ${elapsed.toFixed(0)}ms)`);
+  return perRequestUs;
+}
+
+async function main() {
+  process.env.AUTH_SECRET = SECRET;
+
+  console.log('🔑 요청당 인증 오버헤드 벤치마크');
+  console.log(`요청당 인증 호출 ${CALLS_PER_REQUEST}회\n`);
+
+  const token = await encode({
+    token: { sub: user.id, ...user },
+    secret: SECRET,
+    salt: SALT,
+  });
+  const header = await signSessionHeader(user);
+
+  // Before: every requireAuth() decrypts the session JWT
+  const before = await measure('이전 (JWT 복호화 반복)', async () => {
+    for (let i = 0; i < CALLS_PER_REQUEST; i++) {
+      await decode({ token, secret: SECRET, salt: SALT });
+    }
+  });
+
+  // After: one header verification, later calls hit the per-request memo
+  const after = await measure('이후 (서명 헤더 + 요청 메모이제이션)', async () => {
+    const memo = new WeakMap<object, Promise<unknown>>();
+    const requestKey = {};
+    for (let i = 0; i < CALLS_PER_REQUEST; i++) {
+      let pending = memo.get(requestKey);
+      if (!pending) {
+        pending = verifySessionHeader(header);
+        memo.set(requestKey, pending);
+      }
+      await pending;
+    }
+  });
+
+  console.log(`\n요청당 절감: ${(before - after).toFixed(1)}µs (${(before / after).toFixed(1)}배)`);
+}
+
+main().catch((error) => {
+  console.error('❌ 벤치마크 실패:', error);
+  process.exit(1);
+});
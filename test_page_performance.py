@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+페이지 성능 측정 (브라우저)
+- 역할별로 로그인한 뒤 주요 페이지(/dashboard, /tickets, /tickets/[id], /reports, 관리자 페이지)를 반복 방문
+- Navigation Timing, LCP, CLS, Long Task, JS 힙 크기, 페이지가 호출한 /api/* 요청 수와 크기를 수집
+- 반복 측정값을 페이지별 중앙값/p95로 집계해 test_results_page_performance.json 에 저장
+
+측정마다 새 브라우저 컨텍스트(로그인 쿠키만 유지, HTTP 캐시 없음)를 사용하므로
+매 방문이 첫 방문과 같은 조건입니다.
+
+계정은 PERF_<ROLE>_EMAIL / PERF_<ROLE>_PASSWORD 환경변수로 바꿀 수 있습니다.
+사용법:
+  python test_page_performance.py                         # 모든 역할, 페이지당 5회
+  python test_page_performance.py --runs 10 --roles agent,manager
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+
+from playwright.sync_api import sync_playwright
+
+BASE_URL = os.environ.get('BASE_URL', 'http://localhost:3002')
+
+RESULTS_FILE = 'test_results_page_performance.json'
+
+ACCOUNTS = {
+    'customer': ('testcustomer@test.com', 'Test1234!'),
+    'agent': ('testagent@test.com', 'Agent1234!'),
+    'manager': ('manager@example.com', 'Manager123!'),
+    'admin': ('admin@example.com', 'Admin123!'),
+}
+
+TICKET_DETAIL = '/tickets/[id]'
+
+PAGES = {
+    'customer': ['/dashboard', '/tickets', TICKET_DETAIL],
+    'agent': ['/dashboard', '/tickets', TICKET_DETAIL],
+    'manager': ['/dashboard', '/tickets', TICKET_DETAIL, '/reports'],
+    'admin': [
+        '/dashboard', '/tickets', TICKET_DETAIL, '/reports',
+        '/users', '/categories', '/templates', '/knowledge-base',
+    ],
+}
+
+# 페이지 로드 전에 설치되어 LCP / CLS / Long Task 를 모음
+OBSERVER_SCRIPT = """
+(() => {
+  const perf = { lcp: null, cls: 0, longTasks: [] };
+  window.__pagePerf = perf;
+  const observe = (type, callback) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(callback))
+        .observe({ type, buffered: true });
+    } catch (e) {
+      // Entry type not supported by this browser
+    }
+  };
+  observe('largest-contentful-paint', (entry) => {
+    perf.lcp = entry.startTime;
+  });
+  observe('layout-shift', (entry) => {
+    if (!entry.hadRecentInput) perf.cls += entry.value;
+  });
+  observe('longtask', (entry) => {
+    perf.longTasks.push(entry.duration);
+  });
+})();
+"""
+
+COLLECT_SCRIPT = """
+() => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const perf = window.__pagePerf || { lcp: null, cls: 0, longTasks: [] };
+  return {
+    ttfb: nav ? nav.responseStart : null,
+    domContentLoaded: nav ? nav.domContentLoadedEventEnd : null,
+    load: nav ? nav.loadEventEnd : null,
+    documentBytes: nav ? nav.transferSize : null,
+    lcp: perf.lcp,
+    cls: perf.cls,
+    longTaskCount: perf.longTasks.length,
+    longTaskTotal: perf.longTasks.reduce((sum, duration) => sum + duration, 0),
+    jsHeapUsed: performance.memory ? performance.memory.usedJSHeapSize : null,
+  };
+}
+"""
+
+# 집계 대상 지표
+METRICS = [
+    'ttfb', 'domContentLoaded', 'load', 'lcp', 'cls', 'longTaskCount', 'longTaskTotal',
+    'jsHeapUsed', 'apiRequests', 'apiBytes', 'documentBytes',
+]
+
+
+def account(role):
+    email, password = ACCOUNTS[role]
+    return (
+        os.environ.get(f'PERF_{role.upper()}_EMAIL', email),
+        os.environ.get(f'PERF_{role.upper()}_PASSWORD', password),
+    )
+
+
+def login(browser, role):
+    """로그인한 컨텍스트의 storage state 를 반환 (실패 시 None)"""
+    email, password = account(role)
+    context = browser.new_context()
+    page = context.new_page()
+    try:
+        page.goto(f'{BASE_URL}/login')
+        page.wait_for_load_state('networkidle')
+        page.locator('#email').fill(email)
+        page.locator('#password').fill(password)
+        page.locator('button[type="submit"]').click()
+        try:
+            page.wait_for_url(lambda url: '/login' not in url, timeout=10000)
+        except Exception:
+            print(f'[FAIL] {role} 로그인 실패: {email}')
+            return None
+        print(f'[SUCCESS] {role} 로그인: {email}')
+        return context.storage_state()
+    finally:
+        context.close()
+
+
+def find_ticket_path(browser, state):
+    """티켓 목록에서 첫 번째 티켓 상세 경로를 찾음"""
+    if os.environ.get('PERF_TICKET_ID'):
+        return f'/tickets/{os.environ["PERF_TICKET_ID"]}'
+
+    context = browser.new_context(storage_state=state)
+    page = context.new_page()
+    try:
+        page.goto(f'{BASE_URL}/tickets')
+        page.wait_for_load_state('networkidle')
+        for href in page.locator('a[href^="/tickets/"]').evaluate_all(
+            'links => links.map((link) => link.getAttribute("href"))'
+        ):
+            if href != '/tickets/new':
+                return href
+        return None
+    finally:
+        context.close()
+
+
+def measure(browser, state, path):
+    """새 컨텍스트에서 페이지를 한 번 열고 지표를 수집"""
+    context = browser.new_context(storage_state=state)
+    context.add_init_script(OBSERVER_SCRIPT)
+    page = context.new_page()
+
+    api_calls = []
+
+    def on_request_finished(request):
+        if not urlparse(request.url).path.startswith('/api/'):
+            return
+        try:
+            sizes = request.sizes()
+            size = sizes['responseBodySize'] + sizes['responseHeadersSize']
+        except Exception:
+            size = 0
+        api_calls.append({'url': request.url.replace(BASE_URL, ''), 'bytes': size})
+
+    page.on('requestfinished', on_request_finished)
+
+    try:
+        page.goto(f'{BASE_URL}{path}', wait_until='load')
+        page.wait_for_load_state('networkidle')
+        # LCP / Long Task 항목이 전달될 시간
+        time.sleep(0.5)
+
+        if '/login' in page.url or urlparse(page.url).path != path:
+            return {'redirectedTo': page.url.replace(BASE_URL, '')}
+
+        metrics = page.evaluate(COLLECT_SCRIPT)
+        metrics['apiRequests'] = len(api_calls)
+        metrics['apiBytes'] = sum(call['bytes'] for call in api_calls)
+        metrics['apiCalls'] = api_calls
+        return metrics
+    finally:
+        context.close()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def aggregate(samples):
+    """반복 측정값을 지표별 중앙값 / p95 / 최소 / 최대로 집계"""
+    summary = {}
+    for metric in METRICS:
+        values = [s[metric] for s in samples if s.get(metric) is not None]
+        if not values:
+            continue
+        summary[metric] = {
+            'median': round(statistics.median(values), 3),
+            'p95': round(percentile(values, 0.95), 3),
+            'min': round(min(values), 3),
+            'max': round(max(values), 3),
+        }
+
+    # 가장 큰 API 응답 (마지막 측정 기준)
+    calls = samples[-1].get('apiCalls', []) if samples else []
+    summary['largestApiCalls'] = sorted(calls, key=lambda call: call['bytes'], reverse=True)[:5]
+    return summary
+
+
+def format_bytes(value):
+    if value is None:
+        return '-'
+    if value >= 1024 * 1024:
+        return f'{value / 1024 / 1024:.1f}MB'
+    return f'{value / 1024:.1f}KB'
+
+
+def print_row(path, summary):
+    def median(metric):
+        return summary.get(metric, {}).get('median')
+
+    lcp = median('lcp')
+    cls = median('cls')
+    print(
+        f'  {path:22} LCP {lcp if lcp is None else f"{lcp:.0f}ms":>8}  '
+        f'load {median("load") or 0:7.0f}ms  '
+        f'CLS {cls if cls is None else f"{cls:.3f}":>6}  '
+        f'long task {median("longTaskTotal") or 0:6.0f}ms  '
+        f'API {median("apiRequests") or 0:3.0f}건 / {format_bytes(median("apiBytes"))}  '
+        f'heap {format_bytes(median("jsHeapUsed"))}'
+    )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='페이지 성능 측정')
+    parser.add_argument('--runs', type=int, default=5, help='페이지당 반복 횟수')
+    parser.add_argument('--roles', default=','.join(PAGES), help='측정할 역할 (쉼표 구분)')
+    parser.add_argument('--output', default=RESULTS_FILE, help='결과 JSON 파일')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    roles = [role.strip() for role in args.roles.split(',') if role.strip() in PAGES]
+
+    print('=' * 60)
+    print('페이지 성능 측정')
+    print(f'대상: {BASE_URL}, 역할: {", ".join(roles)}, 페이지당 {args.runs}회')
+    print('=' * 60)
+
+    results = {
+        'timestamp': datetime.now().isoformat(),
+        'baseUrl': BASE_URL,
+        'runs': args.runs,
+        'roles': {},
+    }
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+
+        try:
+            for role in roles:
+                print(f'\n=== {role} ===')
+                state = login(browser, role)
+                if state is None:
+                    results['roles'][role] = {'error': 'login_failed'}
+                    continue
+
+                ticket_path = None
+                if TICKET_DETAIL in PAGES[role]:
+                    ticket_path = find_ticket_path(browser, state)
+
+                role_results = {}
+                for page_name in PAGES[role]:
+                    path = ticket_path if page_name == TICKET_DETAIL else page_name
+                    if path is None:
+                        print(f'  {page_name:22} 건너뜀 (티켓 없음)')
+                        continue
+
+                    samples = [measure(browser, state, path) for _ in range(args.runs)]
+                    redirected = next((s['redirectedTo'] for s in samples if 'redirectedTo' in s), None)
+                    if redirected:
+                        print(f'  {page_name:22} 건너뜀 ({redirected}(으)로 이동)')
+                        role_results[page_name] = {'path': path, 'redirectedTo': redirected}
+                        continue
+
+                    summary = aggregate(samples)
+                    summary['path'] = path
+                    role_results[page_name] = summary
+                    print_row(page_name, summary)
+
+                results['roles'][role] = role_results
+
+        except Exception as e:
+            print(f'\n[ERROR] 측정 실패: {e}')
+            import traceback
+            traceback.print_exc()
+            return 1
+
+        finally:
+            browser.close()
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+    print('\n' + '=' * 60)
+    print(f'결과 저장: {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""
+쿼리 플랜 회귀 테스트
+- ticket-service / sla-service / assignment-service / 리포트 라우트의 쿼리 형태를
+  EXPLAIN (ANALYZE, BUFFERS)로 실행하고 플랜 노드, 사용 인덱스, 버퍼, 실행 시간을 기록
+- 데이터 규모별(기본 1천/1만/10만 티켓)로 시드한 뒤 측정
+- 큰 테이블에서 Seq Scan으로 떨어지거나, 기대 인덱스를 쓰지 않거나,
+  기준값(baseline) 대비 시간/버퍼가 임계치 이상 늘어나면 실패 (exit 1)
+
+시드와 측정은 하나의 트랜잭션 안에서 수행하고 마지막에 ROLLBACK 하므로
+DB에 데이터가 남지 않습니다. 그래도 로컬/CI용 DB에서만 실행하세요.
+
+준비: pip install psycopg2-binary, npm run db:migrate 로 스키마 적용
+사용법:
+  python test_query_plans.py                      # 측정 + 규칙 검사 (+ baseline 비교)
+  python test_query_plans.py --update-baseline    # 현재 결과를 기준값으로 저장
+  python test_query_plans.py --scales 1000,50000 --tolerance 0.5
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from urllib.parse import urlparse
+
+import psycopg2
+
+RESULTS_FILE = 'test_results_query_plans.json'
+BASELINE_FILE = 'query_plan_baseline.json'
+
+DEFAULT_SCALES = [1000, 10000, 100000]
+
+# Below this many rows a sequential scan is the planner's right call
+SEQ_SCAN_MIN_ROWS = 10000
+
+# Tables whose sequential scans are regressions once they are large
+LARGE_TABLES = {'tickets', 'ticket_comments', 'ticket_daily_stats'}
+
+# Regressions smaller than this are treated as noise
+MIN_TIME_DELTA_MS = 2.0
+MIN_BUFFER_DELTA = 50
+
+
+# ============================================================================
+# 쿼리 형태 (서비스 코드가 만드는 SQL과 같은 모양)
+# ============================================================================
+
+# expect_index: 충분히 큰 규모에서 플랜에 반드시 나타나야 하는 인덱스
+QUERY_SHAPES = [
+    {
+        'name': 'ticket_list_agent',
+        'source': 'ticket-service.getTickets (agent)',
+        'sql': """
+            select t.*, c.name as customer_name, cat.name as category_name
+            from tickets t
+            left join users c on c.id = t.customer_id
+            left join categories cat on cat.id = t.category_id
+            where t.agent_id = %(agent_id)s
+            order by t.created_at desc
+            limit 10 offset 0
+        """,
+    },
+    {
+        'name': 'ticket_list_agent_status',
+        'source': 'ticket-service.getTickets (agent + status filter)',
+        'sql': """
+            select t.*, c.name as customer_name
+            from tickets t
+            left join users c on c.id = t.customer_id
+            where t.agent_id = %(agent_id)s and t.status = 'open'
+            order by t.created_at desc
+            limit 10 offset 0
+        """,
+        'expect_index': 'tickets_status_agent_idx',
+    },
+    {
+        'name': 'ticket_count_customer',
+        'source': 'ticket-service.getTickets (customer count)',
+        'sql': """
+            select count(*) from tickets where customer_id = %(customer_id)s
+        """,
+        'expect_index': 'tickets_customer_idx',
+    },
+    {
+        'name': 'ticket_list_manager_status',
+        'source': 'ticket-service.getTickets (manager + status filter)',
+        'sql': """
+            select t.*, c.name as customer_name
+            from tickets t
+            left join users c on c.id = t.customer_id
+            where t.status = 'open'
+            order by t.created_at desc
+            limit 10 offset 0
+        """,
+        'expect_index': 'tickets_status_created_idx',
+    },
+    {
+        'name': 'ticket_by_id',
+        'source': 'ticket-service.getTicketById',
+        'sql': """
+            select t.*, u.name, cat.name
+            from tickets t
+            left join users u on u.id = t.customer_id
+            left join categories cat on cat.id = t.category_id
+            where t.id = %(ticket_id)s
+            limit 1
+        """,
+        'expect_index': 'tickets_pkey',
+    },
+    {
+        'name': 'comment_page',
+        'source': 'comment-service.getCommentPage',
+        'sql': """
+            select c.*, u.name, u.email, u.role
+            from ticket_comments c
+            inner join users u on u.id = c.user_id
+            where c.ticket_id = %(ticket_id)s
+            order by c.created_at desc, c.id desc
+            limit 31
+        """,
+        'expect_index': 'comments_ticket_created_at_idx',
+    },
+    {
+        'name': 'sla_approaching_response',
+        'source': 'sla-service.getTicketsApproachingResponseSLA',
+        'sql': """
+            select t.id, t.title, u.name, u.email, t.sla_response_deadline
+            from tickets t
+            left join users u on u.id = t.agent_id
+            where (t.status = 'open' or t.status = 'in_progress')
+              and t.first_response_at is null
+              and t.sla_response_met is null
+              and t.sla_response_deadline <= now() + interval '30 minutes'
+              and t.sla_response_deadline >= now()
+        """,
+        'expect_index': 'tickets_sla_response_idx',
+    },
+    {
+        'name': 'sla_approaching_resolve',
+        'source': 'sla-service.getTicketsApproachingResolveSLA',
+        'sql': """
+            select t.id, t.title, u.name, u.email, t.sla_resolve_deadline
+            from tickets t
+            left join users u on u.id = t.agent_id
+            where (t.status = 'open' or t.status = 'in_progress')
+              and t.resolved_at is null
+              and t.sla_resolve_met is null
+              and t.sla_resolve_deadline <= now() + interval '30 minutes'
+              and t.sla_resolve_deadline >= now()
+        """,
+        'expect_index': 'tickets_sla_resolve_idx',
+    },
+    {
+        'name': 'sla_violated_response',
+        'source': 'sla-service.getTicketsViolatedResponseSLA',
+        'sql': """
+            select t.id, t.title, u.name, t.sla_response_deadline
+            from tickets t
+            left join users u on u.id = t.agent_id
+            where (t.status = 'open' or t.status = 'in_progress')
+              and t.first_response_at is null
+              and t.sla_response_met is null
+              and t.sla_response_deadline <= now()
+        """,
+    },
+    {
+        'name': 'sla_violated_resolve',
+        'source': 'sla-service.getTicketsViolatedResolveSLA',
+        'sql': """
+            select t.id, t.title, u.name, t.sla_resolve_deadline
+            from tickets t
+            left join users u on u.id = t.agent_id
+            where (t.status = 'open' or t.status = 'in_progress')
+              and t.resolved_at is null
+              and t.sla_resolve_met is null
+              and t.sla_resolve_deadline <= now()
+        """,
+    },
+    {
+        'name': 'next_agent',
+        'source': 'assignment-service.nextAgentQuery',
+        'sql': """
+            select u.id
+            from users u
+            left join tickets t
+              on t.agent_id = u.id and t.status not in ('closed', 'resolved')
+            where u.role = 'agent' and u.is_online = true and u.is_away = false
+            group by u.id
+            order by count(t.id) asc
+            limit 1
+        """,
+    },
+    {
+        'name': 'report_overview_status',
+        'source': 'reports/overview (status breakdown)',
+        'sql': """
+            select status, coalesce(sum(ticket_count), 0)::int
+            from ticket_daily_stats
+            where day >= %(range_start)s and day <= %(range_end)s
+            group by status
+        """,
+        'expect_index': 'ticket_daily_stats_day_idx',
+    },
+    {
+        'name': 'report_overview_agents',
+        'source': 'reports/overview (agent performance)',
+        'sql': """
+            select s.agent_id, u.name,
+                   coalesce(sum(s.ticket_count), 0)::int,
+                   sum(s.resolution_hours_sum) / nullif(sum(s.resolution_count), 0)
+            from ticket_daily_stats s
+            inner join users u on u.id = s.agent_id
+            where s.agent_id is not null
+              and s.day >= %(range_start)s and s.day <= %(range_end)s
+            group by s.agent_id, u.name
+        """,
+        'expect_index': 'ticket_daily_stats_day_idx',
+    },
+    {
+        'name': 'report_sla',
+        'source': 'reports/sla',
+        'sql': """
+            select coalesce(sum(response_met), 0)::int, coalesce(sum(response_violated), 0)::int,
+                   coalesce(sum(resolve_met), 0)::int, coalesce(sum(resolve_violated), 0)::int
+            from ticket_daily_stats
+            where day >= %(range_start)s and day <= %(range_end)s
+        """,
+        'expect_index': 'ticket_daily_stats_day_idx',
+    },
+    {
+        'name': 'rollup_rebuild_day',
+        'source': 'report-rollup-service.refreshReportRollups',
+        'sql': """
+            select created_at::date, category_id, agent_id, priority, status, count(*)::int
+            from all_tickets
+            where created_at >= %(range_end)s::date and created_at < %(range_end)s::date + 1
+            group by 1, 2, 3, 4, 5
+        """,
+        'expect_index': 'tickets_created_at_idx',
+    },
+]
+
+
+# ============================================================================
+# 시드 데이터
+# ============================================================================
+
+def seed(cur, tickets_target, tickets_existing):
+    """tickets_existing 개에서 tickets_target 개까지 티켓(과 댓글)을 추가"""
+    count = tickets_target - tickets_existing
+    if count <= 0:
+        return
+
+    # 규모에 비례하는 사용자 수 (상담원 1명당 약 1천 티켓, 고객 1명당 약 10 티켓)
+    cur.execute("select count(*) from users where email like 'perf-agent-%'")
+    agents_existing = cur.fetchone()[0]
+    agents_target = max(10, tickets_target // 1000)
+    cur.execute("""
+        insert into users (email, password_hash, name, role, is_online, is_away)
+        select 'perf-agent-' || i || '@example.invalid', 'x', '성능 상담원 ' || i, 'agent',
+               i %% 3 <> 0, i %% 10 = 0
+        from generate_series(%s, %s) i
+    """, (agents_existing + 1, agents_target))
+
+    cur.execute("select count(*) from users where email like 'perf-customer-%'")
+    customers_existing = cur.fetchone()[0]
+    customers_target = max(50, tickets_target // 10)
+    cur.execute("""
+        insert into users (email, password_hash, name, role)
+        select 'perf-customer-' || i || '@example.invalid', 'x', '성능 고객 ' || i, 'customer'
+        from generate_series(%s, %s) i
+    """, (customers_existing + 1, customers_target))
+
+    cur.execute("""
+        insert into categories (name, sort_order)
+        select '성능 카테고리 ' || i, i from generate_series(1, 8) i
+        on conflict (name) do nothing
+    """)
+
+    # 5% open, 5% in_progress (최근 3일), 20% resolved, 70% closed (최근 1년)
+    cur.execute("""
+        with agents as (
+          select array_agg(id order by email) ids from users where email like 'perf-agent-%%'
+        ), customers as (
+          select array_agg(id order by email) ids from users where email like 'perf-customer-%%'
+        ), cats as (
+          select array_agg(id order by name) ids from categories where name like '성능 카테고리 %%'
+        ), base as (
+          select i, random() r,
+                 (array['low', 'medium', 'high'])[1 + (i %% 3)]::ticket_priority priority
+          from generate_series(1, %(count)s) i
+        ), shaped as (
+          select b.*,
+                 case when r < 0.05 then 'open' when r < 0.10 then 'in_progress'
+                      when r < 0.30 then 'resolved' else 'closed' end::ticket_status status,
+                 case when r < 0.10 then now() - random() * interval '3 days'
+                      else now() - interval '3 days' - random() * interval '362 days' end created_at
+          from base b
+        )
+        insert into tickets (
+          title, content, status, priority, category_id, customer_id, agent_id,
+          sla_response_deadline, sla_resolve_deadline, sla_response_met, sla_resolve_met,
+          created_at, updated_at, first_response_at, resolved_at, closed_at
+        )
+        select
+          '성능 테스트 티켓 ' || s.i, '성능 테스트 본문 ' || s.i, s.status, s.priority,
+          cats.ids[1 + (s.i %% array_length(cats.ids, 1))],
+          customers.ids[1 + (s.i %% array_length(customers.ids, 1))],
+          agents.ids[1 + ((s.i * 7) %% array_length(agents.ids, 1))],
+          s.created_at + interval '1 hour', s.created_at + interval '24 hours',
+          case when s.status = 'open' then null else s.r < 0.8 end,
+          case when s.status in ('resolved', 'closed') then s.r < 0.7 end,
+          s.created_at, s.created_at,
+          case when s.status <> 'open' then s.created_at + random() * interval '2 hours' end,
+          case when s.status in ('resolved', 'closed') then s.created_at + random() * interval '48 hours' end,
+          case when s.status = 'closed' then s.created_at + interval '48 hours' + random() * interval '24 hours' end
+        from shaped s, agents, customers, cats
+    """, {'count': count})
+
+    # 티켓당 댓글 3개 (새로 추가된 티켓만)
+    cur.execute("""
+        insert into ticket_comments (ticket_id, user_id, content, is_internal, created_at)
+        select t.id, case when n = 2 then t.agent_id else t.customer_id end,
+               '성능 테스트 댓글 ' || n, n = 3, t.created_at + n * interval '10 minutes'
+        from tickets t
+        cross join generate_series(1, 3) n
+        where t.title like '성능 테스트 티켓 %'
+          and not exists (select 1 from ticket_comments c where c.ticket_id = t.id)
+          and t.agent_id is not null
+    """)
+
+    # 리포트 롤업을 티켓에서 다시 계산
+    cur.execute('delete from ticket_daily_stats')
+    cur.execute("""
+        insert into ticket_daily_stats (
+          day, category_id, agent_id, priority, status, ticket_count,
+          response_met, response_violated, resolve_met, resolve_violated,
+          resolution_count, resolution_hours_sum
+        )
+        select created_at::date, category_id, agent_id, priority, status, count(*)::int,
+               count(*) filter (where sla_response_met = true)::int,
+               count(*) filter (where sla_response_met = false)::int,
+               count(*) filter (where sla_resolve_met = true)::int,
+               count(*) filter (where sla_resolve_met = false)::int,
+               count(resolved_at)::int,
+               coalesce(sum(extract(epoch from (resolved_at - created_at)) / 3600), 0)
+        from tickets
+        group by 1, 2, 3, 4, 5
+    """)
+
+    cur.execute('analyze users')
+    cur.execute('analyze categories')
+    cur.execute('analyze tickets')
+    cur.execute('analyze ticket_comments')
+    cur.execute('analyze ticket_daily_stats')
+
+
+def query_params(cur):
+    """쿼리에 넣을 대표 값 (티켓이 많은 상담원, 고객, 댓글 있는 티켓, 최근 7일)"""
+    cur.execute("""
+        select agent_id from tickets where agent_id is not null
+        group by agent_id order by count(*) desc limit 1
+    """)
+    agent_id = cur.fetchone()[0]
+    cur.execute("""
+        select customer_id from tickets group by customer_id order by count(*) desc limit 1
+    """)
+    customer_id = cur.fetchone()[0]
+    cur.execute("""
+        select ticket_id from ticket_comments group by ticket_id order by count(*) desc limit 1
+    """)
+    row = cur.fetchone()
+    ticket_id = row[0] if row else None
+    if ticket_id is None:
+        cur.execute('select id from tickets limit 1')
+        ticket_id = cur.fetchone()[0]
+    cur.execute("select (now() - interval '7 days')::date, now()::date")
+    range_start, range_end = cur.fetchone()
+    return {
+        'agent_id': agent_id,
+        'customer_id': customer_id,
+        'ticket_id': ticket_id,
+        'range_start': range_start,
+        'range_end': range_end,
+    }
+
+
+def table_rows(cur):
+    cur.execute("""
+        select relname, reltuples::bigint from pg_class
+        where relname in ('tickets', 'ticket_comments', 'ticket_daily_stats', 'users')
+    """)
+    return dict(cur.fetchall())
+
+
+def index_tables(cur):
+    """인덱스 이름 -> 테이블 이름"""
+    cur.execute("select indexname, tablename from pg_indexes where schemaname = 'public'")
+    return dict(cur.fetchall())
+
+
+# ============================================================================
+# EXPLAIN 분석
+# ============================================================================
+
+def walk(node, visit):
+    visit(node)
+    for child in node.get('Plans', []):
+        walk(child, visit)
+
+
+def explain(cur, shape, params):
+    cur.execute('explain (analyze, buffers, format json) ' + shape['sql'], params)
+    raw = cur.fetchone()[0]
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+    root = plan['Plan']
+
+    node_types = []
+    indexes = set()
+    seq_scans = set()
+
+    def visit(node):
+        node_types.append(node['Node Type'])
+        if node.get('Index Name'):
+            indexes.add(node['Index Name'])
+        if node['Node Type'] == 'Seq Scan':
+            seq_scans.add(node.get('Relation Name'))
+
+    walk(root, visit)
+
+    return {
+        'nodeTypes': node_types,
+        'indexes': sorted(indexes),
+        'seqScans': sorted(s for s in seq_scans if s),
+        'sharedHit': root.get('Shared Hit Blocks', 0),
+        'sharedRead': root.get('Shared Read Blocks', 0),
+        'planningMs': round(plan.get('Planning Time', 0), 3),
+        'executionMs': round(plan.get('Execution Time', 0), 3),
+    }
+
+
+def check(shape, result, rows, indexes, baseline, tolerance):
+    """규칙 위반 목록을 반환"""
+    failures = []
+
+    for relation in result['seqScans']:
+        if relation in LARGE_TABLES and rows.get(relation, 0) >= SEQ_SCAN_MIN_ROWS:
+            failures.append(f'{relation} Seq Scan ({rows[relation]} rows)')
+
+    expected = shape.get('expect_index')
+    large = rows.get(indexes.get(expected), 0) >= SEQ_SCAN_MIN_ROWS
+    if expected and large and expected not in result['indexes']:
+        failures.append(f'{expected} 미사용 (사용: {", ".join(result["indexes"]) or "없음"})')
+
+    if baseline:
+        limit_ms = baseline['executionMs'] * (1 + tolerance)
+        if result['executionMs'] > limit_ms and result['executionMs'] - baseline['executionMs'] > MIN_TIME_DELTA_MS:
+            failures.append(
+                f'실행 시간 {result["executionMs"]}ms > 기준 {baseline["executionMs"]}ms x {1 + tolerance:.2f}'
+            )
+        buffers = result['sharedHit'] + result['sharedRead']
+        base_buffers = baseline['sharedHit'] + baseline['sharedRead']
+        if buffers > base_buffers * (1 + tolerance) and buffers - base_buffers > MIN_BUFFER_DELTA:
+            failures.append(f'버퍼 {buffers} > 기준 {base_buffers} x {1 + tolerance:.2f}')
+
+    return failures
+
+
+# ============================================================================
+# 실행
+# ============================================================================
+
+def database_url():
+    if os.environ.get('DATABASE_URL'):
+        return os.environ['DATABASE_URL']
+    for env_file in ('.env.local', '.env'):
+        if os.path.exists(env_file):
+            with open(env_file, encoding='utf-8') as f:
+                for line in f:
+                    if line.startswith('DATABASE_URL='):
+                        return line.split('=', 1)[1].strip().strip('"\'')
+    return None
+
+
+def load_json(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='쿼리 플랜 회귀 테스트')
+    parser.add_argument('--scales', default=','.join(str(s) for s in DEFAULT_SCALES),
+                        help='티켓 수 규모 (쉼표 구분)')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='기준값 파일')
+    parser.add_argument('--update-baseline', action='store_true', help='현재 결과를 기준값으로 저장')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='기준값 대비 허용 증가율 (0.5 = 50%%)')
+    parser.add_argument('--output', default=RESULTS_FILE, help='결과 JSON 파일')
+    parser.add_argument('--allow-remote', action='store_true', help='localhost 외의 DB 허용')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    scales = sorted(int(s) for s in args.scales.split(',') if s.strip())
+
+    url = database_url()
+    if not url:
+        print('❌ DATABASE_URL이 설정되지 않았습니다')
+        return 1
+
+    host = urlparse(url).hostname
+    if host not in ('localhost', '127.0.0.1', '::1') and not args.allow_remote:
+        print(f'❌ 로컬 DB가 아닙니다 ({host}). --allow-remote 로 허용할 수 있습니다')
+        return 1
+
+    baseline = None if args.update_baseline else load_json(args.baseline)
+
+    print('=' * 60)
+    print('쿼리 플랜 회귀 테스트')
+    print(f'규모: {", ".join(str(s) for s in scales)} 티켓')
+    print(f'기준값: {args.baseline if baseline else "없음"}')
+    print('=' * 60)
+
+    conn = psycopg2.connect(url)
+    results = {'timestamp': datetime.now().isoformat(), 'scales': {}}
+    all_failures = []
+
+    try:
+        with conn.cursor() as cur:
+            cur.execute("set local statement_timeout = '10min'")
+            cur.execute('select setseed(0.42)')
+
+            cur.execute("select count(*) from tickets where title like '성능 테스트 티켓 %'")
+            seeded = cur.fetchone()[0]
+
+            for scale in scales:
+                print(f'\n=== {scale} 티켓 ===')
+                seed(cur, scale, seeded)
+                seeded = max(seeded, scale)
+
+                rows = table_rows(cur)
+                indexes = index_tables(cur)
+                params = query_params(cur)
+                scale_results = {}
+
+                for shape in QUERY_SHAPES:
+                    result = explain(cur, shape, params)
+                    base = ((baseline or {}).get('scales', {}).get(str(scale), {}) or {}).get(shape['name'])
+                    failures = check(shape, result, rows, indexes, base, args.tolerance)
+                    result['failures'] = failures
+                    scale_results[shape['name']] = result
+
+                    mark = '❌' if failures else '✅'
+                    print(
+                        f'{mark} {shape["name"]:28} {result["executionMs"]:9.2f}ms '
+                        f'buffers={result["sharedHit"] + result["sharedRead"]:<7} '
+                        f'{", ".join(result["indexes"]) or "-"}'
+                    )
+                    for failure in failures:
+                        print(f'     - {failure}')
+                        all_failures.append(f'[{scale}] {shape["name"]}: {failure}')
+
+                results['scales'][str(scale)] = scale_results
+    finally:
+        # 시드 데이터는 남기지 않음
+        conn.rollback()
+        conn.close()
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f'\n결과 저장: {args.output}')
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f'기준값 저장: {args.baseline}')
+
+    print('\n' + '=' * 60)
+    if all_failures:
+        print(f'❌ 실패 {len(all_failures)}건')
+        for failure in all_failures:
+            print(f'  - {failure}')
+        return 1
+
+    print('✅ 모든 쿼리 플랜 검사 통과')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())